@@ -0,0 +1,165 @@
+"""Benchmarks for the File Scanner and System Cleaner scan engines.
+
+Usage:
+    python -m benchmarks.scanner_bench --root /tmp/wo_bench --depth 3 --fanout 4 --files-per-dir 25
+    python -m benchmarks.scanner_bench --bench duplicates --workers 1 --workers 8 --repeat 3 -o bench_output.txt
+
+A reproducible synthetic tree is generated (or reused) under --root, then
+every benchmark runs in its own subprocess so peak RSS is measured per run.
+One JSON record per run is written to stdout or --output (NDJSON).
+Runs on plain Linux; /proc/self/io counters are reported when available.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from benchmarks.synthetic_tree import generate_tree
+
+BENCHMARKS = ("duplicates", "large", "cleaner")
+
+
+def read_proc_io():
+    """Returns {rchar, read_bytes, ...} for this process, or {} off Linux."""
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            return {k: int(v) for k, v in (line.split(":") for line in f if ":" in line)}
+    except (OSError, ValueError):
+        return {}
+
+
+def peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset
+        except Exception:
+            return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run_case(case):
+    """Runs one benchmark in the current process and returns its result record."""
+    from modules.scan_engine import default_options, run_scan
+    from modules.clean_engine import scan_junk
+    from modules.clean_rules import CleanRules
+
+    root = case["root"]
+    io_before = read_proc_io()
+    started = time.perf_counter()
+    engine_bytes = None
+
+    if case["bench"] == "cleaner":
+        # The synthetic files are brand new, so measure without the cleaning rules
+        scanned = len(scan_junk([("Synthetic", root)], rules_for=lambda name: CleanRules()))
+    else:
+        options = default_options(
+            modes=[case["bench"]],
+            workers=case["workers"],
+            threshold_bytes=case["threshold_bytes"],
+            verify=case["verify"],
+        )
+        analyzers, scanned = run_scan([root], options)
+        if "duplicates" in analyzers:
+            engine_bytes = analyzers["duplicates"].bytes_read
+
+    wall = time.perf_counter() - started
+    io_after = read_proc_io()
+
+    record = {
+        "type": "benchmark",
+        "bench": case["bench"],
+        "workers": case["workers"],
+        "verify": case["verify"],
+        "run": case["run"],
+        "files": scanned,
+        "wall_seconds": round(wall, 4),
+        "files_per_sec": round(scanned / wall, 1) if wall > 0 else None,
+        "bytes_hashed": engine_bytes,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+    for key in ("rchar", "read_bytes"):
+        if key in io_before and key in io_after:
+            record[f"io_{key}"] = io_after[key] - io_before[key]
+    return record
+
+
+def run_isolated(case):
+    """Runs a case in a fresh interpreter so peak RSS is not shared between runs."""
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.scanner_bench", "--child", json.dumps(case)],
+        cwd=repo_root, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        return {"type": "error", "bench": case["bench"], "workers": case["workers"], "run": case["run"], "error": proc.stderr.strip()[-2000:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scanner_bench", description="WinOptimizer scan engine benchmarks (NDJSON output).")
+    parser.add_argument("--root", default=os.path.join(os.path.expanduser("~"), ".cache", "winoptimizer_bench"), help="Synthetic tree location")
+    parser.add_argument("--depth", type=int, default=3, help="Directory nesting depth")
+    parser.add_argument("--fanout", type=int, default=4, help="Subdirectories per directory")
+    parser.add_argument("--files-per-dir", type=int, default=20, help="Files per directory")
+    parser.add_argument("--sizes", default="lognormal:65536:1.5:67108864", help="fixed:N, uniform:MIN:MAX or lognormal:MEDIAN:SIGMA[:MAX]")
+    parser.add_argument("--dup-ratio", type=float, default=0.1, help="Share of files that are exact duplicates")
+    parser.add_argument("--near-dup-ratio", type=float, default=0.02, help="Share of same-size files differing by one byte")
+    parser.add_argument("--seed", type=int, default=1, help="Generator seed")
+    parser.add_argument("--bench", action="append", choices=BENCHMARKS, help="Benchmark to run (repeatable, default: all)")
+    parser.add_argument("--workers", action="append", type=int, help="Walker thread count to test (repeatable, default: 1 and 4)")
+    parser.add_argument("--threshold-mb", type=float, default=1, help="Large file threshold for the large benchmark")
+    parser.add_argument("--verify", action="store_true", help="Byte-verify duplicate groups in the duplicates benchmark")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per configuration")
+    parser.add_argument("--output", "-o", default="-", help="NDJSON output file (default: stdout)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_run_case(json.loads(args.child))))
+        return 0
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    def emit(record):
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+
+    try:
+        started = time.perf_counter()
+        try:
+            manifest = generate_tree(
+                args.root, depth=args.depth, fanout=args.fanout, files_per_dir=args.files_per_dir,
+                sizes=args.sizes, dup_ratio=args.dup_ratio, near_dup_ratio=args.near_dup_ratio, seed=args.seed
+            )
+        except ValueError as e:
+            print(f"Cannot use --root: {e}", file=sys.stderr)
+            return 2
+        emit({"type": "tree", "root": args.root, "prepare_seconds": round(time.perf_counter() - started, 3), **manifest})
+
+        for bench in args.bench or BENCHMARKS:
+            # The cleaner scan has no worker setting of its own
+            worker_counts = [None] if bench == "cleaner" else (args.workers or [1, 4])
+            for workers in worker_counts:
+                for run in range(max(1, args.repeat)):
+                    emit(run_isolated({
+                        "bench": bench, "root": args.root, "workers": workers, "run": run,
+                        "threshold_bytes": int(args.threshold_mb * 1024 * 1024), "verify": args.verify,
+                    }))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
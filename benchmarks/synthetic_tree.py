@@ -0,0 +1,139 @@
+import os
+import math
+import json
+import random
+import shutil
+
+# Files are written in chunks of this size so large files never sit in memory
+WRITE_CHUNK_BYTES = 1024 * 1024
+
+# Originals remembered as copy sources for duplicates
+DUP_POOL_SIZE = 512
+
+# Kept next to the tree, not inside it, so it is never counted by a scan
+MANIFEST_SUFFIX = ".manifest.json"
+# Recorded in the manifest; only trees carrying it are ever deleted
+GENERATOR = "winoptimizer-synthetic-tree"
+
+
+def _read_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(path, manifest):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def parse_size_spec(spec):
+    """Parses 'fixed:N', 'uniform:MIN:MAX' or 'lognormal:MEDIAN:SIGMA[:MAX]' into a sampler."""
+    kind, *args = spec.split(":")
+    nums = [float(a) for a in args]
+    if kind == "fixed":
+        return lambda rng: int(nums[0])
+    if kind == "uniform":
+        return lambda rng: rng.randint(int(nums[0]), int(nums[1]))
+    if kind == "lognormal":
+        median, sigma = nums[0], nums[1]
+        cap = int(nums[2]) if len(nums) > 2 else 1 << 32
+        mu = math.log(max(median, 1))
+        return lambda rng: min(cap, int(rng.lognormvariate(mu, sigma)))
+    raise ValueError(f"Unknown size distribution: {spec}")
+
+
+def _write_random(path, size, rng):
+    with open(path, "wb") as f:
+        left = size
+        while left > 0:
+            n = min(WRITE_CHUNK_BYTES, left)
+            f.write(rng.randbytes(n))
+            left -= n
+
+
+def _write_near_copy(src, dst, size, rng):
+    """Copies src and flips one byte in the middle: same size and same head/tail sample."""
+    shutil.copyfile(src, dst)
+    if size < 3:
+        return
+    with open(dst, "r+b") as f:
+        pos = size // 2 + rng.randint(-(size // 4), size // 4)
+        f.seek(pos)
+        b = f.read(1)
+        f.seek(pos)
+        f.write(bytes([b[0] ^ 0xFF]))
+
+
+def generate_tree(root, depth=3, fanout=4, files_per_dir=20, sizes="lognormal:65536:1.5:67108864",
+                  dup_ratio=0.1, near_dup_ratio=0.02, seed=1):
+    """Builds a reproducible synthetic tree under root and returns its manifest.
+
+    Every directory down to `depth` gets `fanout` subdirectories and
+    `files_per_dir` files. A `dup_ratio` share of files are exact copies of
+    earlier files, a `near_dup_ratio` share are copies with one byte changed.
+    The same parameters and seed always produce the same tree; an existing
+    tree with a matching manifest is reused as is. A tree is only ever
+    deleted when its manifest shows the generator created it; any other
+    non-empty root is refused with ValueError.
+    """
+    params = {
+        "depth": depth, "fanout": fanout, "files_per_dir": files_per_dir, "sizes": sizes,
+        "dup_ratio": dup_ratio, "near_dup_ratio": near_dup_ratio, "seed": seed,
+    }
+    root = os.path.normpath(root)
+    manifest_path = root + MANIFEST_SUFFIX
+    manifest = _read_manifest(manifest_path)
+    if manifest and manifest.get("params") == params and manifest.get("stats") and os.path.isdir(root):
+        return manifest
+    if os.path.isdir(root) and os.listdir(root):
+        # Manifests written before the generator tag was added still carry params and stats
+        if not manifest or (manifest.get("generator") != GENERATOR and not ("params" in manifest and "stats" in manifest)):
+            raise ValueError(f"{root} is not empty and was not created by the benchmark generator")
+        shutil.rmtree(root)
+
+    os.makedirs(root, exist_ok=True)
+    # Claim the root before writing into it, so an interrupted run can be regenerated
+    _write_manifest(manifest_path, {"generator": GENERATOR, "params": params, "stats": None})
+    rng = random.Random(seed)
+    sample_size = parse_size_spec(sizes)
+    pool = []
+    stats = {"dirs": 0, "files": 0, "bytes": 0, "duplicates": 0, "near_duplicates": 0, "duplicate_bytes": 0}
+
+    stack = [(root, 0)]
+    while stack:
+        path, level = stack.pop()
+        stats["dirs"] += 1
+        for i in range(files_per_dir):
+            fpath = os.path.join(path, f"file_{i:05d}.bin")
+            roll = rng.random()
+            if pool and roll < dup_ratio:
+                src, size = pool[rng.randrange(len(pool))]
+                shutil.copyfile(src, fpath)
+                stats["duplicates"] += 1
+                stats["duplicate_bytes"] += size
+            elif pool and roll < dup_ratio + near_dup_ratio:
+                src, size = pool[rng.randrange(len(pool))]
+                _write_near_copy(src, fpath, size, rng)
+                stats["near_duplicates"] += 1
+            else:
+                size = sample_size(rng)
+                _write_random(fpath, size, rng)
+                if len(pool) < DUP_POOL_SIZE:
+                    pool.append((fpath, size))
+                else:
+                    pool[rng.randrange(DUP_POOL_SIZE)] = (fpath, size)
+            stats["files"] += 1
+            stats["bytes"] += size
+
+        if level < depth:
+            for d in range(fanout):
+                sub = os.path.join(path, f"dir_{level}_{d:03d}")
+                os.makedirs(sub, exist_ok=True)
+                stack.append((sub, level + 1))
+
+    manifest = {"generator": GENERATOR, "params": params, "stats": stats}
+    _write_manifest(manifest_path, manifest)
+    return manifest
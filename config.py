@@ -1,100 +1,144 @@
-import os  # Added missing import
-
-# WinGet Preset Apps for Batch Installation
-PRESET_APPS = [
-    "Discord.Discord",
-    "Git.Git",
-    "VideoLAN.VLC",
-    "Valve.Steam",
-    "Microsoft.PowerToys",
-    "Obsidian.Obsidian",
-    "DominikReichl.KeePass",
-    "Mozilla.Firefox",
-    "Google.Chrome",
-    "ExpressVPN.ExpressVPN",
-    "Logitech.GHUB"
-]
-
-# Service Configurations
-DISABLABLE_SERVICES = {
-    "SysMain", "DiagTrack", "PcaSvc", 
-    "Fax", "MapsBroker", "RetailDemo", "TabletInputService"
-}
-
-CRITICAL_SERVICES = {
-    "WinDefend", "RpcSs", "EventLog", "SamSs", "LSASS", "TrustedInstaller", "BITS", "Dhcp"
-}
-
-# Process & File Safety
-CRITICAL_PROCESS_NAMES = {
-    'System', 'System Idle Process', 'Registry', 'csrss.exe', 'wininit.exe',
-    'services.exe', 'lsass.exe', 'winlogon.exe', 'smss.exe'
-}
-
-SAFE_TEMP_EXTENSIONS = {'.tmp', '.log', '.pf', '.dmp', '.old', '.etl', '.evtx'}
-
-# Cleaner Configuration
-SAFE_JUNK_EXTENSIONS = {
-    '.tmp', '.temp', '.log', '.bak', '.old', '.dmp', '.chk', '.pf', '.error'
-}
-
-CLEANER_PATHS = [
-    ("User Temp", os.environ.get('TEMP')),
-    ("System Temp", r"C:\Windows\Temp"),
-    ("Prefetch", r"C:\Windows\Prefetch"),
-    ("Windows Update Cache", r"C:\Windows\SoftwareDistribution\Download"),
-    ("Crash Dumps", r"C:\Windows\Minidump"),
-    ("Error Reports", r"C:\ProgramData\Microsoft\Windows\WER"),
-]
-
-# Safe Apps Whitelist for Bloat Uninstaller (Includes Office 365 / M365 components & Bloatware)
-SAFE_TO_REMOVE_APPS = [
-    # Microsoft Office / 365 Components
-    "Microsoft.MicrosoftOfficeHub",
-    "Microsoft.Office.Word",
-    "Microsoft.Office.Excel",
-    "Microsoft.Office.PowerPoint",
-    "Microsoft.Office.Outlook",
-    "Microsoft.Office.OneNote",
-    
-    # News, Weather & Feed
-    "Microsoft.BingNews",
-    "Microsoft.BingWeather",
-    "Microsoft.BingSearch",
-    
-    # Feedback & Help
-    "Microsoft.WindowsFeedbackHub",
-    "Microsoft.GetHelp",
-    "Microsoft.Getstarted",
-    
-    # Communication & Utilities
-    "Microsoft.Messaging",
-    "Microsoft.SkypeApp",
-    "Microsoft.YourPhone",
-    "Microsoft.People",
-    "Microsoft.WindowsAlarms",
-    "Microsoft.WindowsMaps",
-    "Microsoft.WindowsCamera",
-    "Microsoft.WindowsSoundRecorder",
-    "Microsoft.Todos",
-    "Microsoft.PowerAutomateDesktop",
-    "Microsoft.Clipchamp",
-    "Microsoft.Teams",
-    
-    # Media & Gaming
-    "Microsoft.MicrosoftSolitaireCollection",
-    "Microsoft.ZuneVideo",
-    "Microsoft.ZuneMusic",
-    "Microsoft.XboxApp",
-    "Microsoft.XboxGameOverlay",
-    "Microsoft.XboxGamingOverlay",
-    "Microsoft.XboxIdentityProvider",
-    "Microsoft.XboxSpeechToTextOverlay",
-    "Microsoft.GamingApp",
-]
-
-# UI Colors
-COLOR_RED = "#c42b1c"
-COLOR_BLUE = "#1f6aa5"
-COLOR_GREEN = "#00FF00"
+import os  # Added missing import
+
+# WinGet Preset Apps for Batch Installation
+PRESET_APPS = [
+    "Discord.Discord",
+    "Git.Git",
+    "VideoLAN.VLC",
+    "Valve.Steam",
+    "Microsoft.PowerToys",
+    "Obsidian.Obsidian",
+    "DominikReichl.KeePass",
+    "Mozilla.Firefox",
+    "Google.Chrome",
+    "ExpressVPN.ExpressVPN",
+    "Logitech.GHUB"
+]
+
+# Service Configurations
+DISABLABLE_SERVICES = {
+    "SysMain", "DiagTrack", "PcaSvc", 
+    "Fax", "MapsBroker", "RetailDemo", "TabletInputService"
+}
+
+CRITICAL_SERVICES = {
+    "WinDefend", "RpcSs", "EventLog", "SamSs", "LSASS", "TrustedInstaller", "BITS", "Dhcp"
+}
+
+# Process & File Safety
+CRITICAL_PROCESS_NAMES = {
+    'System', 'System Idle Process', 'Registry', 'csrss.exe', 'wininit.exe',
+    'services.exe', 'lsass.exe', 'winlogon.exe', 'smss.exe'
+}
+
+SAFE_TEMP_EXTENSIONS = {'.tmp', '.log', '.pf', '.dmp', '.old', '.etl', '.evtx'}
+
+# Cleaner Configuration
+SAFE_JUNK_EXTENSIONS = {
+    '.tmp', '.temp', '.log', '.bak', '.old', '.dmp', '.chk', '.pf', '.error'
+}
+
+CLEANER_PATHS = [
+    ("User Temp", os.environ.get('TEMP')),
+    ("System Temp", r"C:\Windows\Temp"),
+    ("Prefetch", r"C:\Windows\Prefetch"),
+    ("Windows Update Cache", r"C:\Windows\SoftwareDistribution\Download"),
+    ("Crash Dumps", r"C:\Windows\Minidump"),
+    ("Error Reports", r"C:\ProgramData\Microsoft\Windows\WER"),
+]
+CLEANER_DELETE_WORKERS = 8             # Threads removing files per cleaner location
+
+# Cleaning rules: files failing them are left in place and never queued.
+# min_age_hours keeps recently modified files, extensions is an allow-list,
+# max_file_mb caps the file size and skip_locked keeps files in use; None disables a rule.
+CLEANER_DEFAULT_RULES = {"min_age_hours": 24, "extensions": None, "max_file_mb": None, "skip_locked": True}
+CLEANER_RULES = {                      # Per-location overrides, keyed by CLEANER_PATHS name
+    "Prefetch": {"extensions": SAFE_JUNK_EXTENSIONS},
+    "Crash Dumps": {"min_age_hours": 72, "extensions": SAFE_JUNK_EXTENSIONS},
+    "Windows Update Cache": {"min_age_hours": 72},
+}
+
+# File Scanner Configuration
+SCANNER_HASH_WORKERS = 8               # Threads used to hash duplicate candidates
+SCANNER_SAMPLE_BYTES = 64 * 1024       # Head/tail sample size for the first hash pass
+SCANNER_WALK_WORKERS = 4               # Threads listing directories (1 = serial walk)
+SCANNER_LARGE_THRESHOLD_MB = 100       # Default minimum size for the large file finder
+SCANNER_TOP_K = 100                    # Default number of largest files kept and shown
+SCANNER_INDEX_PATH = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), "WinOptimizer", "scan_index.sqlite3"
+)
+SCANNER_CHECKPOINT_DIR = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), "WinOptimizer", "checkpoints"
+)
+SCANNER_CHECKPOINT_SECONDS = 30        # Resumable scans commit their progress at this interval
+SCANNER_WATCH_POLL_SECONDS = 30        # Re-listing interval of the polling change tracker (no inotify)
+SCANNER_WATCH_FULL_POLL_EVERY = 10     # Polls only re-list changed folders; every Nth one re-lists all to catch in-place edits
+SCANNER_CHUNK_MIN_FILE_MB = 64         # Files at least this large are included in the chunking report
+SCANNER_CHUNK_AVG_KB = 64              # Target average content-defined chunk size
+SCANNER_CHUNK_MAX_TOTAL_GB = 16        # Chunking reads ~6 MB/s per worker; files beyond this total are left out
+SCANNER_CHUNK_SAMPLE_SHIFT = 0         # Keep 1 in 2**N chunk digests to bound memory on huge data sets
+SCANNER_COMPRESS_METHOD = "zlib"       # Compressibility estimate codec: "zlib" (close to NTFS/zip) or "lzma" (7z)
+SCANNER_COMPRESS_SAMPLE_BLOCKS = 16    # Blocks sampled per large file for the compressibility estimate
+SCANNER_COMPRESS_BLOCK_KB = 64         # Size of each sampled block (NTFS compresses in 64 KB units)
+SCANNER_COLD_DAYS = 365                # Files not used for this many days count as cold data
+SCANNER_THROTTLE_MB_PER_SEC = 20       # Low-impact mode: file content read per second, all threads together
+SCANNER_THROTTLE_ENTRIES_PER_SEC = 2000  # Low-impact mode: directory entries stat'ed per second
+SCANNER_THROTTLE_CPU_PERCENT = 60      # Low-impact mode pauses while other programs' CPU load is above this (needs psutil)
+SCANNER_THROTTLE_DISK_BUSY_PERCENT = 50  # Low-impact mode pauses while other programs keep a disk busier than this (needs psutil)
+SCANNER_LINK_JOURNAL_DIR = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), "WinOptimizer", "link_journals"
+)
+# Folder names never descended into by the File Scanner (matched case-insensitively on Windows)
+SCANNER_EXCLUDE_DIRS = ["node_modules", ".git", ".svn", ".hg", "__pycache__", "WinSxS"]
+
+# Safe Apps Whitelist for Bloat Uninstaller (Includes Office 365 / M365 components & Bloatware)
+SAFE_TO_REMOVE_APPS = [
+    # Microsoft Office / 365 Components
+    "Microsoft.MicrosoftOfficeHub",
+    "Microsoft.Office.Word",
+    "Microsoft.Office.Excel",
+    "Microsoft.Office.PowerPoint",
+    "Microsoft.Office.Outlook",
+    "Microsoft.Office.OneNote",
+    
+    # News, Weather & Feed
+    "Microsoft.BingNews",
+    "Microsoft.BingWeather",
+    "Microsoft.BingSearch",
+    
+    # Feedback & Help
+    "Microsoft.WindowsFeedbackHub",
+    "Microsoft.GetHelp",
+    "Microsoft.Getstarted",
+    
+    # Communication & Utilities
+    "Microsoft.Messaging",
+    "Microsoft.SkypeApp",
+    "Microsoft.YourPhone",
+    "Microsoft.People",
+    "Microsoft.WindowsAlarms",
+    "Microsoft.WindowsMaps",
+    "Microsoft.WindowsCamera",
+    "Microsoft.WindowsSoundRecorder",
+    "Microsoft.Todos",
+    "Microsoft.PowerAutomateDesktop",
+    "Microsoft.Clipchamp",
+    "Microsoft.Teams",
+    
+    # Media & Gaming
+    "Microsoft.MicrosoftSolitaireCollection",
+    "Microsoft.ZuneVideo",
+    "Microsoft.ZuneMusic",
+    "Microsoft.XboxApp",
+    "Microsoft.XboxGameOverlay",
+    "Microsoft.XboxGamingOverlay",
+    "Microsoft.XboxIdentityProvider",
+    "Microsoft.XboxSpeechToTextOverlay",
+    "Microsoft.GamingApp",
+]
+
+# UI Colors
+COLOR_RED = "#c42b1c"
+COLOR_BLUE = "#1f6aa5"
+COLOR_GREEN = "#00FF00"
 COLOR_LIGHT_BLUE = "#1E90FF"
\ No newline at end of file
@@ -0,0 +1 @@
+# Lets pytest import the modules package when run from the repository root
@@ -0,0 +1,544 @@
+import os
+import time
+import heapq
+import bisect
+import hashlib
+import itertools
+from array import array
+
+from modules.duplicates import DuplicateFinder
+from modules.dirtree import DirTree
+from modules.chunking import ChunkReport
+from modules.compressibility import CompressionReport
+
+try:
+    from config import SCANNER_COLD_DAYS
+except ImportError:
+    SCANNER_COLD_DAYS = 365
+
+# Traversal progress is reported roughly every this many files
+PROGRESS_EVERY = 200
+
+# Upper bounds (in days) of the age histogram buckets; the last bucket is open-ended
+AGE_BUCKET_DAYS = (30, 90, 180, 365, 730)
+# A folder is reported as cold when at least this share of its bytes is cold
+COLD_FOLDER_SHARE = 0.9
+
+
+class TopKFiles:
+    """Keeps the K largest files above a size threshold in a bounded min-heap.
+
+    Memory stays O(K) no matter how many files match; `matched` still counts
+    every file above the threshold.
+    """
+    def __init__(self, k=100, threshold=0):
+        self.k = max(1, int(k))
+        self.threshold = threshold
+        self.matched = 0
+        self.version = 0      # Bumped whenever the heap content changes
+        self._heap = []       # (size, seq, path), smallest on top
+        self._seq = itertools.count()
+
+    def push(self, path, size):
+        if size <= self.threshold:
+            return
+        self.matched += 1
+        heap = self._heap
+        if len(heap) < self.k:
+            heapq.heappush(heap, (size, next(self._seq), path))
+        elif size > heap[0][0]:
+            heapq.heapreplace(heap, (size, next(self._seq), path))
+        else:
+            return
+        self.version += 1
+
+    def discard(self, path):
+        """Drops path, or every file below it when it is a folder. Returns True if anything was kept.
+
+        Used by change tracking; files outside the top-K are not known, so the
+        heap can hold fewer than K entries until the next scan.
+        """
+        prefix = path.rstrip("\\/") + os.sep
+        kept = [item for item in self._heap if item[2] != path and not item[2].startswith(prefix)]
+        removed = len(self._heap) - len(kept)
+        if not removed:
+            return False
+        heapq.heapify(kept)
+        self._heap = kept
+        self.matched -= removed
+        self.version += 1
+        return True
+
+    def update(self, path, size):
+        """Re-ranks a file whose size changed (or that was just created)."""
+        self.discard(path)
+        self.push(path, size)
+
+    def snapshot(self):
+        """Returns the current top-K as [(path, size)] sorted largest first."""
+        return [(path, size) for size, _, path in sorted(self._heap, reverse=True)]
+
+
+# ===========================
+# Single-Pass Analyzers
+# ===========================
+class Analyzer:
+    """Receives every DirListing of one traversal; heavy work goes in finish().
+
+    When `emit` is set, results are also streamed to it as plain dict records
+    the moment they are known (used by the headless CLI).
+    """
+    title = "Analyzer"
+    emit = None
+
+    def feed(self, listing):
+        raise NotImplementedError
+
+    def finish(self, should_stop=None, progress=None):
+        pass
+
+
+class DuplicateAnalyzer(Analyzer):
+    """Collects size groups during traversal and confirms them by content in finish()."""
+    title = "Duplicates"
+
+    def __init__(self, index=None, workers=None, verify=False, throttle=None):
+        self.index = index
+        self.workers = workers
+        self.verify = verify
+        self.throttle = throttle
+        self.files_by_size = {}
+        self.groups = []
+        self.links = {}         # path in a group (or a lone file) -> other hard links to it
+        self.linked_bytes = 0
+        self.bytes_read = 0
+
+    def feed(self, listing):
+        by_size = self.files_by_size
+        for entry in listing.files:
+            if entry.size in by_size:
+                by_size[entry.size].append(entry.path)
+            else:
+                by_size[entry.size] = [entry.path]
+
+    def finish(self, should_stop=None, progress=None):
+        finder = DuplicateFinder(workers=self.workers, should_stop=should_stop, progress=progress, index=self.index, verify=self.verify,
+                                 throttle=self.throttle)
+        self.groups = finder.find(self.files_by_size)
+        self.bytes_read = finder.bytes_read
+        self.links = finder.links
+        self.linked_bytes = finder.linked_bytes
+        self.files_by_size = {}
+        if self.emit:
+            for size, paths in self.groups:
+                record = {"type": "duplicate_group", "size": size, "paths": paths, "reclaimable": size * (len(paths) - 1)}
+                linked = {p: self.links[p] for p in paths if p in self.links}
+                if linked:
+                    record["hardlinks"] = linked
+                self.emit(record)
+
+    def rows(self):
+        """Flattens groups into (duplicate, original, size) rows."""
+        rows = []
+        for size, paths in self.groups:
+            for duplicate in paths[1:]:
+                rows.append((duplicate, paths[0], size))
+        return rows
+
+
+class DuplicateDirsAnalyzer(Analyzer):
+    """Finds whole folders with identical content using Merkle-style digests.
+
+    A file's identity is its duplicate group from the content-verified
+    duplicate pipeline, so no file is read a second time. A file that is in
+    no group is unique, which makes its folder and every ancestor unique
+    without hashing anything. So is a folder with entries the scan did not
+    look at (pruned subfolders, links, files dropped by scan rules), since
+    two copies could differ there. Otherwise a folder's digest covers the
+    sorted (name, identity) of its files and the (name, digest) of its
+    subfolders; an empty folder gets the digest of no entries, so it can
+    be part of a matching tree. Only the topmost folder of each identical
+    subtree holding at least one file is reported.
+    """
+    title = "Duplicate Folders"
+
+    def __init__(self, duplicates=None, index=None, workers=None, verify=False, throttle=None):
+        # Share the duplicate analyzer of the same scan when there is one
+        self.owns_duplicates = duplicates is None
+        self.duplicates = duplicates or DuplicateAnalyzer(index=index, workers=workers, verify=verify, throttle=throttle)
+        self.listings = []      # (path, [(name, path, size)], [subdir paths], complete) in traversal order
+        self.groups = []        # (total_bytes, file_count, [paths], reclaimable) most reclaimable first
+
+    def feed(self, listing):
+        if self.owns_duplicates:
+            self.duplicates.feed(listing)
+        files = [(e.name, e.path, e.size) for e in listing.files]
+        complete = not (listing.skipped or listing.filtered)
+        self.listings.append((listing.path, files, [p for p, _ in listing.dirs], complete))
+
+    def finish(self, should_stop=None, progress=None):
+        if self.owns_duplicates:
+            self.duplicates.finish(should_stop=should_stop, progress=progress)
+        if should_stop and should_stop():
+            return
+
+        identity = {}
+        for number, (_, paths) in enumerate(self.duplicates.groups):
+            for path in paths:
+                identity[path] = number
+        # Hard links to one file share its identity, even if that file has no other copy
+        for number, (path, others) in enumerate(self.duplicates.links.items(), len(self.duplicates.groups)):
+            ident = identity.setdefault(path, number)
+            for other in others:
+                identity[other] = ident
+
+        digests = {}        # dir path -> (digest or None, bytes, files)
+        # Parents are listed before their children, so reversed order is bottom-up
+        for path, files, subdirs, complete in reversed(self.listings):
+            h = hashlib.blake2b(digest_size=20)
+            unique = not complete
+            total_bytes = total_files = 0
+            for name, fpath, size in sorted(files):
+                total_bytes += size
+                total_files += 1
+                # Empty files all share one identity
+                ident = -1 if size == 0 else identity.get(fpath)
+                if ident is None:
+                    unique = True
+                elif not unique:
+                    h.update(f"f\0{name}\0{ident}\0".encode("utf-8", "surrogatepass"))
+            for sub in sorted(subdirs):
+                sub_digest, sub_bytes, sub_files = digests.get(sub, (None, 0, 0))
+                total_bytes += sub_bytes
+                total_files += sub_files
+                if sub_digest is None:
+                    unique = True
+                elif not unique:
+                    h.update(b"d\0" + os.path.basename(sub).encode("utf-8", "surrogatepass") + b"\0" + sub_digest)
+            digests[path] = (None if unique else h.digest(), total_bytes, total_files)
+        self.listings = []
+
+        by_digest = {}
+        for path, (digest, _, files) in digests.items():
+            # Trees of empty folders match each other but free nothing
+            if digest is not None and files:
+                by_digest.setdefault(digest, []).append(path)
+        matched = {digest for digest, paths in by_digest.items() if len(paths) > 1}
+
+        groups = []
+        for digest in matched:
+            paths = sorted(by_digest[digest])
+            # Copies inside an identical parent pair are already counted with that pair
+            covered = sum(1 for p in paths if digests.get(os.path.dirname(p), (None,))[0] in matched)
+            if covered == len(paths):
+                continue
+            _, total_bytes, total_files = digests[paths[0]]
+            extra_copies = len(paths) - covered if covered else len(paths) - 1
+            groups.append((total_bytes, total_files, paths, total_bytes * extra_copies))
+        groups.sort(key=lambda g: g[3], reverse=True)
+        self.groups = groups
+
+        if self.emit:
+            for total_bytes, total_files, paths, reclaimable in groups:
+                self.emit({"type": "duplicate_dir_group", "bytes": total_bytes, "files": total_files, "paths": paths, "reclaimable": reclaimable})
+
+    @property
+    def reclaimable(self):
+        return sum(g[3] for g in self.groups)
+
+
+class ChunkingAnalyzer(Analyzer):
+    """Content-defined chunking of large files to estimate block-level dedup savings."""
+    title = "Shared Chunks"
+
+    def __init__(self, min_file_size, avg_chunk_bytes=None, sample_shift=None, workers=None, throttle=None, max_bytes=None):
+        self.min_file_size = min_file_size
+        self.max_bytes = max_bytes
+        self.avg_chunk_bytes = avg_chunk_bytes
+        self.sample_shift = sample_shift
+        self.workers = workers
+        self.throttle = throttle
+        self.files = []
+        self.report = None
+
+    def feed(self, listing):
+        min_size = self.min_file_size
+        for entry in listing.files:
+            if entry.size >= min_size:
+                self.files.append((entry.path, entry.size))
+
+    def finish(self, should_stop=None, progress=None):
+        report = ChunkReport(avg_chunk_bytes=self.avg_chunk_bytes, sample_shift=self.sample_shift, workers=self.workers, should_stop=should_stop, progress=progress,
+                             throttle=self.throttle, max_bytes=self.max_bytes)
+        self.report = report.run(self.files)
+        self.files = []
+        if self.emit:
+            for path, size, redundant in report.per_file:
+                if redundant:
+                    self.emit({"type": "shared_chunks_file", "path": path, "bytes": size, "shared": redundant})
+            self.emit({"type": "shared_chunks", "files": len(report.per_file), "bytes": report.total_bytes, "chunks": report.chunks, "shared": report.redundant_bytes, "unique": report.unique_bytes,
+                       "skipped_files": report.skipped_files, "skipped_bytes": report.skipped_bytes})
+
+
+class LargeFileAnalyzer(Analyzer):
+    title = "Large Files"
+
+    def __init__(self, k=100, threshold=0):
+        self.tracker = TopKFiles(k=k, threshold=threshold)
+
+    def feed(self, listing):
+        push = self.tracker.push
+        emit = self.emit
+        threshold = self.tracker.threshold
+        for entry in listing.files:
+            push(entry.path, entry.size)
+            if emit and entry.size > threshold:
+                emit({"type": "large_file", "path": entry.path, "size": entry.size})
+
+
+class CompressibilityAnalyzer(Analyzer):
+    """Sampled compression estimate for the large files of the scan, ranked by reclaimable bytes."""
+    title = "Compressibility"
+
+    def __init__(self, large=None, k=100, threshold=0, method=None, workers=None, throttle=None):
+        # Estimate the files the large file analyzer of the same scan keeps, when there is one
+        self.owns_large = large is None
+        self.large = large or LargeFileAnalyzer(k=k, threshold=threshold)
+        self.method = method
+        self.workers = workers
+        self.throttle = throttle
+        self.report = None
+
+    def feed(self, listing):
+        if self.owns_large:
+            self.large.feed(listing)
+
+    def finish(self, should_stop=None, progress=None):
+        report = CompressionReport(method=self.method, workers=self.workers, should_stop=should_stop, progress=progress,
+                                   throttle=self.throttle)
+        self.report = report.run(self.large.tracker.snapshot())
+        if self.emit:
+            for path, size, estimated, reclaimable in report.per_file:
+                self.emit({"type": "compressible_file", "path": path, "size": size, "estimated": estimated, "reclaimable": reclaimable})
+            self.emit({"type": "compressibility", "method": report.method, "files": len(report.per_file), "bytes": report.total_bytes, "sampled": report.sampled_bytes, "reclaimable": report.reclaimable})
+
+
+class ExtensionStatsAnalyzer(Analyzer):
+    """Per-extension file count and byte totals."""
+    title = "Extensions"
+
+    def __init__(self):
+        self.stats = {}     # ext -> [count, bytes]
+
+    def feed(self, listing):
+        stats = self.stats
+        for entry in listing.files:
+            ext = os.path.splitext(entry.name)[1].lower() or "(none)"
+            item = stats.get(ext)
+            if item is None:
+                stats[ext] = [1, entry.size]
+            else:
+                item[0] += 1
+                item[1] += entry.size
+
+    def top(self, n=25):
+        """Returns [(ext, count, bytes)] sorted by bytes, largest first."""
+        items = sorted(self.stats.items(), key=lambda kv: kv[1][1], reverse=True)
+        return [(ext, c, b) for ext, (c, b) in items[:n]]
+
+    def finish(self, should_stop=None, progress=None):
+        if self.emit:
+            for ext, count, size in self.top(None):
+                self.emit({"type": "extension", "ext": ext, "files": count, "bytes": size})
+
+
+class EmptyItemsAnalyzer(Analyzer):
+    """Zero-byte files and folders with no entries at all.
+
+    A folder only counts as empty when it really is: files dropped by scan
+    rules, pruned subfolders and links keep it from being reported.
+    """
+    title = "Empty Items"
+
+    def __init__(self):
+        self.empty_files = []
+        self.empty_dirs = []
+
+    def feed(self, listing):
+        if listing.is_empty:
+            self.empty_dirs.append(listing.path)
+            if self.emit:
+                self.emit({"type": "empty_dir", "path": listing.path})
+            return
+        for entry in listing.files:
+            if entry.size == 0:
+                self.empty_files.append(entry.path)
+                if self.emit:
+                    self.emit({"type": "zero_byte_file", "path": entry.path})
+
+
+class DirSizeAnalyzer(Analyzer):
+    """Builds a DirTree of per-folder size totals during the traversal."""
+    title = "Folder Sizes"
+
+    def __init__(self, report_top=50):
+        self.tree = DirTree()
+        self.report_top = report_top
+
+    def feed(self, listing):
+        self.tree.add_listing(listing)
+
+    def finish(self, should_stop=None, progress=None):
+        if self.emit:
+            tree = self.tree
+            for node in tree.top_dirs(self.report_top):
+                self.emit({"type": "dir_size", "path": tree.path(node), "bytes": tree.total_bytes[node], "files": tree.total_files[node]})
+
+
+class ColdDataAnalyzer(Analyzer):
+    """Per-folder histograms of file age by last use and by last modification.
+
+    Folders are DirTree nodes and each node owns a fixed run of buckets in
+    flat int64 arrays (bytes and file counts for both histograms), so memory
+    grows with the number of folders, never with the number of files. "Last
+    use" is the later of access and modification time, since access times
+    are often not updated (NTFS last-access policy, Linux relatime).
+    Subtree histograms are summed bottom-up once in finish(). The report
+    lists the topmost folders whose bytes are at least COLD_FOLDER_SHARE
+    unused for cold_days, most cold bytes first.
+    """
+    title = "Cold Data"
+
+    def __init__(self, cold_days=None, report_top=50, now=None):
+        self.cold_days = SCANNER_COLD_DAYS if cold_days is None else cold_days
+        self.bounds = sorted(set(AGE_BUCKET_DAYS) | {self.cold_days})
+        self.nbuckets = len(self.bounds) + 1
+        # First bucket whose files were last used at least cold_days ago
+        self.cold_bucket = self.bounds.index(self.cold_days) + 1
+        self.report_top = report_top
+        self.now = time.time() if now is None else now
+        self.tree = DirTree()
+        self.used_bytes = array('q')
+        self.used_files = array('q')
+        self.modified_bytes = array('q')
+        self.modified_files = array('q')
+        self.totals = None      # subtree sums of the four arrays, filled by finish()
+        self.cold_dirs = []     # (node, cold_bytes, total_bytes)
+
+    def bucket_labels(self):
+        edges = [0] + self.bounds
+        labels = [f"{lo}-{hi}d" for lo, hi in zip(edges, edges[1:])]
+        return labels + [f">{self.bounds[-1]}d"]
+
+    def _bucket(self, timestamp):
+        return bisect.bisect_right(self.bounds, (self.now - timestamp) / 86400)
+
+    def feed(self, listing):
+        tree = self.tree
+        node = tree.add_listing(listing)
+        missing = len(tree) * self.nbuckets - len(self.used_bytes)
+        if missing > 0:
+            zeros = array('q', bytes(8 * missing))
+            for arr in (self.used_bytes, self.used_files, self.modified_bytes, self.modified_files):
+                arr.extend(zeros)
+
+        base = node * self.nbuckets
+        bucket = self._bucket
+        used_bytes, used_files = self.used_bytes, self.used_files
+        modified_bytes, modified_files = self.modified_bytes, self.modified_files
+        for entry in listing.files:
+            mtime = entry.mtime
+            u = base + bucket(max(entry.atime, mtime))
+            used_bytes[u] += entry.size
+            used_files[u] += 1
+            m = base + bucket(mtime)
+            modified_bytes[m] += entry.size
+            modified_files[m] += 1
+
+    def histogram(self, node, kind="used", subtree=True):
+        """Returns [(bytes, files)] per bucket for a node; kind is 'used' or 'modified'."""
+        arrays = self.totals if subtree and self.totals else (
+            self.used_bytes, self.used_files, self.modified_bytes, self.modified_files)
+        size_arr, count_arr = arrays[0:2] if kind == "used" else arrays[2:4]
+        base = node * self.nbuckets
+        return [(size_arr[base + b], count_arr[base + b]) for b in range(self.nbuckets)]
+
+    def finish(self, should_stop=None, progress=None):
+        n, nb = len(self.tree), self.nbuckets
+        totals = tuple(array('q', arr) for arr in (self.used_bytes, self.used_files, self.modified_bytes, self.modified_files))
+        parent = self.tree.parent
+        # Children always get higher ids than their parent, so reverse id order is bottom-up
+        for node in range(n - 1, -1, -1):
+            p = parent[node]
+            if p < 0:
+                continue
+            src, dst = node * nb, p * nb
+            for arr in totals:
+                for b in range(nb):
+                    arr[dst + b] += arr[src + b]
+        self.totals = totals
+
+        used_bytes = totals[0]
+        cold = []
+        for node in range(n):
+            total = self.tree.total_bytes[node]
+            if not total:
+                continue
+            base = node * nb
+            cold_bytes = sum(used_bytes[base + self.cold_bucket:base + nb])
+            if cold_bytes < total * COLD_FOLDER_SHARE:
+                continue
+            p = parent[node]
+            if p >= 0:
+                parent_cold = sum(used_bytes[p * nb + self.cold_bucket:p * nb + nb])
+                if parent_cold >= self.tree.total_bytes[p] * COLD_FOLDER_SHARE:
+                    continue
+            cold.append((node, cold_bytes, total))
+        cold.sort(key=lambda item: item[1], reverse=True)
+        self.cold_dirs = cold
+
+        if self.emit:
+            labels = self.bucket_labels()
+            for root in self.tree.roots:
+                self.emit({
+                    "type": "age_histogram", "path": self.tree.path(root), "buckets": labels,
+                    "used": [b for b, _ in self.histogram(root, "used")],
+                    "modified": [b for b, _ in self.histogram(root, "modified")],
+                })
+            for node, cold_bytes, total in cold[:self.report_top]:
+                self.emit({"type": "cold_dir", "path": self.tree.path(node), "bytes": total, "cold_bytes": cold_bytes,
+                           "used": [b for b, _ in self.histogram(node, "used")]})
+
+    @property
+    def cold_bytes(self):
+        return sum(item[1] for item in self.cold_dirs)
+
+
+def run_analysis(walker, roots, analyzers, should_stop=None, progress=None, rules=None, checkpoint=None):
+    """Feeds one traversal to every analyzer, then lets each finish. Returns the file count.
+
+    With ScanRules, rejected files are dropped once per listing, before any
+    analyzer sees them. With a ScanCheckpoint, the traversal resumes from it.
+    """
+    should_stop = should_stop or (lambda: False)
+    scanned = 0
+    reported = 0
+    listings = checkpoint.walk(walker, roots) if checkpoint else walker.walk(roots)
+    for listing in listings:
+        if should_stop():
+            break
+        if rules:
+            rules.filter_listing(listing)
+        for analyzer in analyzers:
+            analyzer.feed(listing)
+        scanned += len(listing.files)
+        if progress and scanned - reported >= PROGRESS_EVERY:
+            reported = scanned
+            progress("Scanned", scanned, None)
+
+    for analyzer in analyzers:
+        if should_stop():
+            break
+        analyzer.finish(should_stop=should_stop, progress=progress)
+    return scanned
+
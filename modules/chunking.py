@@ -0,0 +1,204 @@
+import os
+import random
+import hashlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from modules.throttle import Throttle
+
+try:
+    from config import SCANNER_CHUNK_AVG_KB, SCANNER_CHUNK_MIN_FILE_MB, SCANNER_CHUNK_MAX_TOTAL_GB, SCANNER_CHUNK_SAMPLE_SHIFT
+except ImportError:
+    SCANNER_CHUNK_AVG_KB = 64
+    SCANNER_CHUNK_MIN_FILE_MB = 64
+    SCANNER_CHUNK_MAX_TOTAL_GB = 16
+    SCANNER_CHUNK_SAMPLE_SHIFT = 0
+
+# Files are streamed through a buffer of this size, whatever their length
+READ_BLOCK_BYTES = 4 * 1024 * 1024
+
+MASK64 = (1 << 64) - 1
+
+DIGEST_BYTES = 16
+
+# Fixed pseudo-random table so chunk boundaries are identical across runs and processes
+_gear_rng = random.Random(0x5EED)
+GEAR = tuple(_gear_rng.getrandbits(64) for _ in range(256))
+del _gear_rng
+
+
+def chunk_params(avg_size):
+    """Returns (min_size, max_size, mask) for an average chunk size, FastCDC style.
+
+    The boundary test uses the top bits of the Gear hash, which depend on the
+    last 64 bytes; the low bits only see the last few bytes.
+    """
+    min_size = avg_size // 4
+    max_size = avg_size * 8
+    bits = max(1, (avg_size - min_size).bit_length() - 1)
+    return min_size, max_size, ((1 << bits) - 1) << (64 - bits)
+
+
+def iter_chunks(path, avg_size, throttle=None):
+    """Yields (digest, size) for each content-defined chunk of a file in bounded memory.
+
+    Boundaries come from a Gear rolling hash, so an insertion only moves the
+    chunk boundaries near it and the rest of the file still yields the same
+    chunks. The first min_size bytes of a chunk are never tested (as in
+    FastCDC) and a chunk is cut at max_size regardless.
+    """
+    min_size, max_size, mask = chunk_params(avg_size)
+    gear = GEAR
+    buf = bytearray(READ_BLOCK_BYTES)
+    view = memoryview(buf)
+    hasher = hashlib.blake2b(digest_size=DIGEST_BYTES)
+    chunk_len = 0
+    h = 0
+
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            if throttle:
+                throttle.bytes(n)
+            i = 0
+            while i < n:
+                if chunk_len < min_size:
+                    take = min(min_size - chunk_len, n - i)
+                    hasher.update(view[i:i + take])
+                    chunk_len += take
+                    i += take
+                    h = 0
+                    continue
+
+                limit = min(n, i + max_size - chunk_len)
+                j = i
+                cut = False
+                while j < limit:
+                    h = ((h << 1) + gear[buf[j]]) & MASK64
+                    j += 1
+                    if not h & mask:
+                        cut = True
+                        break
+                hasher.update(view[i:j])
+                chunk_len += j - i
+                i = j
+
+                if cut or chunk_len >= max_size:
+                    yield hasher.digest(), chunk_len
+                    hasher = hashlib.blake2b(digest_size=DIGEST_BYTES)
+                    chunk_len = 0
+                    h = 0
+
+    if chunk_len:
+        yield hasher.digest(), chunk_len
+
+
+def chunk_file(path, avg_size, sample_shift=0, throttle_settings=None):
+    """Process pool worker: returns (path, bytes, chunk_count, digests, sizes) of the sampled chunks.
+
+    Only chunks whose digest falls in a 1/2**sample_shift slice are kept,
+    which bounds the memory of the global chunk table on huge data sets.
+    The kept digests are packed back to back into one bytes object and
+    their sizes into an array, about 20 bytes per chunk.
+    throttle_settings come from Throttle.process_settings in low-impact mode.
+    """
+    throttle = Throttle(**throttle_settings) if throttle_settings else None
+    if throttle:
+        throttle.enter_worker()
+    sample_mask = (1 << sample_shift) - 1
+    digests = bytearray()
+    sizes = array('L')
+    total = count = 0
+    for digest, size in iter_chunks(path, avg_size, throttle):
+        total += size
+        count += 1
+        if not digest[0] & sample_mask:
+            digests += digest
+            sizes.append(size)
+    return path, total, count, bytes(digests), sizes
+
+
+class ChunkReport:
+    """Estimates what a deduplicating store would save on a set of files.
+
+    Files are chunked on a process pool, one file per task; the parent keeps
+    one entry per distinct (sampled) chunk. A chunk already seen, in another
+    file or earlier in the same one, counts as redundant and is credited to
+    the file it appears in. With sampling, byte figures are scaled back up.
+
+    The rolling hash runs in pure Python at roughly 6 MB/s per worker, so
+    one report reads at most max_bytes (SCANNER_CHUNK_MAX_TOTAL_GB). Files
+    that no longer fit are left out and counted in skipped_files and
+    skipped_bytes; this also bounds the chunk table to about
+    max_bytes / avg_chunk_bytes entries.
+    """
+    def __init__(self, avg_chunk_bytes=None, sample_shift=None, workers=None, should_stop=None, progress=None, throttle=None, max_bytes=None):
+        self.avg_chunk_bytes = avg_chunk_bytes or SCANNER_CHUNK_AVG_KB * 1024
+        self.sample_shift = SCANNER_CHUNK_SAMPLE_SHIFT if sample_shift is None else sample_shift
+        self.max_bytes = int(SCANNER_CHUNK_MAX_TOTAL_GB * 1024 ** 3) if max_bytes is None else max_bytes
+        self.workers = workers or os.cpu_count() or 2
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = progress
+        self.throttle = throttle
+        self.total_bytes = 0
+        self.chunks = 0
+        self.redundant_bytes = 0
+        self.per_file = []      # (path, bytes, redundant_bytes)
+        self.errors = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+
+    def select(self, files):
+        """Returns the paths of (path, size) pairs that fit in max_bytes, in the given order."""
+        paths = []
+        budget = self.max_bytes
+        for path, size in files:
+            if size > budget:
+                self.skipped_files += 1
+                self.skipped_bytes += size
+                continue
+            budget -= size
+            paths.append(path)
+        return paths
+
+    def run(self, files):
+        """Chunks (path, size) pairs, as many as fit in max_bytes."""
+        paths = self.select(files)
+        seen = set()
+        scale = 1 << self.sample_shift
+        settings = self.throttle.process_settings(self.workers) if self.throttle else None
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(chunk_file, p, self.avg_chunk_bytes, self.sample_shift, settings) for p in paths]
+            for done, fut in enumerate(as_completed(futures), 1):
+                if self.should_stop():
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    return self
+                try:
+                    path, total, count, digests, sizes = fut.result()
+                except OSError:
+                    self.errors += 1
+                    continue
+
+                redundant = 0
+                for i, size in enumerate(sizes):
+                    digest = digests[i * DIGEST_BYTES:(i + 1) * DIGEST_BYTES]
+                    if digest in seen:
+                        redundant += size
+                    else:
+                        seen.add(digest)
+                redundant = min(total, redundant * scale)
+                self.total_bytes += total
+                self.chunks += count
+                self.redundant_bytes += redundant
+                self.per_file.append((path, total, redundant))
+
+                if self.progress:
+                    self.progress("Chunking", done, len(futures))
+        self.per_file.sort(key=lambda item: item[2], reverse=True)
+        return self
+
+    @property
+    def unique_bytes(self):
+        return self.total_bytes - self.redundant_bytes
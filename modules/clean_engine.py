@@ -0,0 +1,262 @@
+import os
+import stat
+import time
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from modules.traversal import TreeWalker, is_reparse_point
+from modules.clean_queue import CleanQueue
+from modules.clean_rules import CleanRules
+
+# Fallback config import if config.py cleaner paths are missing
+try:
+    from config import CLEANER_PATHS
+except ImportError:
+    CLEANER_PATHS = [
+        ("User Temp", os.environ.get('TEMP')),
+        ("System Temp", r"C:\Windows\Temp"),
+        ("Prefetch", r"C:\Windows\Prefetch"),
+        ("Windows Update Cache", r"C:\Windows\SoftwareDistribution\Download"),
+        ("Crash Dumps", r"C:\Windows\Minidump"),
+        ("Error Reports", r"C:\ProgramData\Microsoft\Windows\WER"),
+    ]
+
+try:
+    from config import CLEANER_DELETE_WORKERS
+except ImportError:
+    CLEANER_DELETE_WORKERS = 8
+
+# Files handed to a deletion worker at a time
+DELETE_BATCH = 256
+# Progress callbacks are rate limited to one per interval
+PROGRESS_SECONDS = 0.2
+
+
+def scan_junk(locations, on_location=None, on_error=None, should_stop=None, rules_for=None):
+    """Collects the removable files below the given cleaner locations into a CleanQueue.
+
+    locations is a list of (name, path) pairs like config.CLEANER_PATHS;
+    missing paths are skipped. on_location(name) is called before each
+    location is walked and on_error(name, path, exc) for unreadable entries.
+    Each location becomes one queue category; the sizes come from the
+    traversal and are reused when deleting.
+
+    rules_for(name) returns the CleanRules of a location (by default from
+    config). Files they keep are only counted, in the same pass, so the
+    delete phase never sees them.
+
+    Subfolders that were read completely and hold nothing but queued files
+    and such subfolders are collapsed into whole-folder entries, which are
+    removed in one pass together with the folders themselves.
+    """
+    rules_for = rules_for or CleanRules.for_location
+    queue = CleanQueue()
+
+    for name, path in locations:
+        if should_stop and should_stop():
+            break
+        if not path or not os.path.exists(path):
+            continue
+
+        if on_location:
+            on_location(name)
+
+        walker = TreeWalker(
+            on_error=(lambda err_path, exc, n=name: on_error(n, err_path, exc)) if on_error else None,
+            should_stop=should_stop
+        )
+        rules = rules_for(name)
+        queue.add_category(name)
+        first_dir = len(queue.dirs)
+        # Per folder of this location: complete listing with no skipped entries,
+        # and the number of subfolders still to be listed
+        full = array('b')
+        unlisted = array('l')
+        parent_of = {}
+        for listing in walker.walk(path):
+            parent = parent_of.pop(listing.path, -1)
+            dir_id = queue.add_dir(listing.path, parent)
+            full.append(listing.skipped == 0)
+            unlisted.append(len(listing.dirs))
+            if parent >= 0:
+                unlisted[parent - first_dir] -= 1
+            for sub_path, _ in listing.dirs:
+                parent_of[sub_path] = dir_id
+            for entry in listing.files:
+                reason = rules.reason(entry)
+                if reason is None:
+                    queue.add_file(dir_id, entry.name, entry.size, entry.mtime)
+                else:
+                    queue.add_kept(reason, entry.size)
+                    full[-1] = 0
+
+        # Children always come after their parent, so a reverse pass settles
+        # every folder before its parent is looked at
+        for i in range(len(full) - 1, -1, -1):
+            if unlisted[i]:
+                full[i] = 0
+            parent = queue.dir_parent[first_dir + i]
+            if not full[i] and parent >= 0:
+                full[parent - first_dir] = 0
+        queue.collapse_trees(first_dir, full)
+
+    return queue
+
+
+def remove_tree(path, expected, should_stop=None):
+    """Removes the recorded files below a folder and the folders left empty, deepest first.
+
+    expected maps each file's path relative to `path` to the (size, mtime)
+    it was scanned with; anything else, including files that appeared or
+    changed since the scan, is left in place together with the folders
+    that hold it. Files that cannot be removed (typically in use) are left
+    too, and links, junctions and special files are never followed or
+    removed. Returns (deleted, freed_bytes, failed).
+    """
+    deleted = freed = failed = 0
+    stack = [(path, "", False)]
+    while stack:
+        folder, rel, emptied = stack.pop()
+        if emptied:
+            try:
+                os.rmdir(folder)
+            except OSError:
+                pass    # Something below was kept
+            continue
+        if should_stop and should_stop():
+            break
+        stack.append((folder, rel, True))
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            entry_rel = os.path.join(rel, entry.name) if rel else entry.name
+            if stat.S_ISDIR(st.st_mode) and not is_reparse_point(st):
+                stack.append((entry.path, entry_rel, False))
+            elif stat.S_ISREG(st.st_mode):
+                if expected.get(entry_rel) != (st.st_size, st.st_mtime):
+                    continue
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    failed += 1
+                    continue
+                deleted += 1
+                freed += st.st_size
+    return deleted, freed, failed
+
+
+class DeletionEngine:
+    """Removes queued junk files on a bounded thread pool per cleaner location.
+
+    Each location's files are split into batches of DELETE_BATCH and removed
+    by up to `workers` threads, next to its whole-folder entries, which are
+    removed one task per folder; locations are processed one after another.
+    Sizes recorded during the scan are credited on success, so no loose file
+    is stat'ed again. A file that is already gone counts as removed without
+    bytes; any other failure (typically a file in use) counts as failed.
+
+    progress(done, total, freed_bytes) receives aggregate counters at most
+    every PROGRESS_SECONDS, from whichever worker crosses the interval, and
+    once more at the end. on_done(kind, which) is called from the workers
+    after each batch of loose files ("files", indices of the files that are
+    gone now) and each whole folder removed without failures ("tree", tree
+    index), e.g. to record progress in a CleanPlan. Files that could not be
+    removed are left out, so a resumed plan retries them.
+    """
+    def __init__(self, workers=None, should_stop=None, progress=None, on_done=None):
+        self.workers = max(1, workers or CLEANER_DELETE_WORKERS)
+        self.on_done = on_done
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = progress
+        self.total = 0
+        self.done = 0
+        self.deleted = 0
+        self.freed_bytes = 0
+        self.missing = 0
+        self.failed = 0
+        self.failed_by_location = {}
+        self._lock = threading.Lock()
+        self._last_report = 0.0
+
+    def _report(self, force=False):
+        if not self.progress:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_report < PROGRESS_SECONDS:
+                return
+            self._last_report = now
+            done, total, freed = self.done, self.total, self.freed_bytes
+        self.progress(done, total, freed)
+
+    def _remove_batch(self, queue, indices):
+        """Worker: removes one range of queued files and returns the failure count."""
+        deleted = freed = missing = failed = 0
+        removed = []
+        for i in indices:
+            if self.should_stop():
+                break
+            try:
+                os.remove(queue.path(i))
+            except FileNotFoundError:
+                missing += 1
+                removed.append(i)
+                continue
+            except OSError:
+                failed += 1
+                continue
+            deleted += 1
+            freed += queue.file_size[i]
+            removed.append(i)
+
+        with self._lock:
+            self.deleted += deleted
+            self.freed_bytes += freed
+            self.missing += missing
+            self.failed += failed
+            self.done += deleted + missing + failed
+        if self.on_done and removed:
+            self.on_done("files", removed)
+        self._report()
+        return failed
+
+    def _remove_tree(self, queue, tree):
+        """Worker: removes one whole-folder entry and returns the failure count."""
+        deleted, freed, failed = remove_tree(queue.dirs[queue.tree_dir[tree]], queue.tree_members(tree), self.should_stop)
+        with self._lock:
+            self.deleted += deleted
+            self.freed_bytes += freed
+            self.failed += failed
+            self.done += queue.tree_files[tree]
+        if self.on_done and not failed and not self.should_stop():
+            self.on_done("tree", tree)
+        self._report()
+        return failed
+
+    def run(self, queue):
+        """Deletes every file of a CleanQueue and returns self with the final counters."""
+        self.total = len(queue)
+        for category, name in enumerate(queue.categories):
+            if self.should_stop():
+                break
+            indices = queue.category_range(category)
+            failed = 0
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(self._remove_tree, queue, t) for t in queue.category_trees(category)]
+                futures += [pool.submit(self._remove_batch, queue, indices[i:i + DELETE_BATCH]) for i in range(0, len(indices), DELETE_BATCH)]
+                for fut in as_completed(futures):
+                    failed += fut.result()
+            if failed:
+                self.failed_by_location[name] = failed
+        self._report(force=True)
+        return self
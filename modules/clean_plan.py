@@ -0,0 +1,313 @@
+import os
+import sys
+import stat
+import time
+import sqlite3
+import argparse
+import threading
+from itertools import groupby
+
+from modules.clean_queue import CleanQueue
+from modules.clean_engine import CLEANER_PATHS, scan_junk, DeletionEngine
+from modules.ndjson import NDJSONWriter
+
+PLAN_FORMAT = "winoptimizer-clean-plan-2"
+# Completed entries are committed at most this often while cleaning
+PLAN_COMMIT_SECONDS = 2.0
+
+# Row states; every state but PENDING is final
+PENDING, DONE, CHANGED, GONE = 0, 1, 2, 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS categories (
+    id    INTEGER PRIMARY KEY,
+    name  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    id    INTEGER PRIMARY KEY,
+    path  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id       INTEGER PRIMARY KEY,
+    category INTEGER NOT NULL,
+    dir      INTEGER NOT NULL,
+    name     TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime    REAL NOT NULL,
+    tree     INTEGER,
+    state    INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS trees (
+    id       INTEGER PRIMARY KEY,
+    category INTEGER NOT NULL,
+    dir      INTEGER NOT NULL,
+    files    INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    state    INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class CleanPlan:
+    """Cleaner scan result stored in a small SQLite file, to be cleaned later or headless.
+
+    The plan keeps the interned folder table of the CleanQueue, and per
+    file its name, size and mtime as a fingerprint, including the files of
+    whole-folder entries. load() rebuilds a queue of the pending entries,
+    verifying every loose file with one directory listing per folder, so
+    files that changed or vanished since the scan are left alone. Whole
+    folders are verified while they are removed: only their recorded,
+    unchanged files are deleted. Cleaning marks entries done as the
+    deletion engine finishes them, so an interrupted run resumes with what
+    is left.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.changed = 0
+        self.gone = 0
+        self._file_rows = []
+        self._tree_rows = []
+        self._lock = threading.Lock()
+        self._last_commit = time.monotonic()
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No such plan: {path}")
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+        if row is None or row[0] != PLAN_FORMAT:
+            self.conn.close()
+            raise ValueError(f"Not a cleaning plan: {path}")
+
+    @classmethod
+    def save(cls, path, queue):
+        """Writes a queue to a new plan file (replacing any file at path) and returns it opened."""
+        for suffix in ("", "-journal"):
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+        conn = sqlite3.connect(path)
+        try:
+            conn.executescript(SCHEMA)
+            conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                ("format", PLAN_FORMAT), ("created", str(time.time())),
+            ])
+            conn.executemany("INSERT INTO categories (id, name) VALUES (?, ?)", enumerate(queue.categories))
+            conn.executemany("INSERT INTO dirs (id, path) VALUES (?, ?)", enumerate(queue.dirs))
+            conn.executemany(
+                "INSERT INTO files (category, dir, name, size, mtime) VALUES (?, ?, ?, ?, ?)",
+                ((c, queue.file_dir[i], queue.name(i), queue.file_size[i], queue.file_mtime[i])
+                 for c in range(len(queue.categories)) for i in queue.category_range(c))
+            )
+            conn.executemany(
+                "INSERT INTO trees (id, category, dir, files, size) VALUES (?, ?, ?, ?, ?)",
+                ((t, c, queue.tree_dir[t], queue.tree_files[t], queue.tree_size[t])
+                 for c in range(len(queue.categories)) for t in queue.category_trees(c))
+            )
+            conn.executemany(
+                "INSERT INTO files (category, dir, name, size, mtime, tree) VALUES (?, ?, ?, ?, ?, ?)",
+                ((queue.file_category[i], queue.file_dir[i], queue.name(i), queue.file_size[i], queue.file_mtime[i], t)
+                 for t in range(len(queue.tree_dir)) for i in queue.tree_range(t))
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return cls(path)
+
+    @property
+    def created(self):
+        return float(self.conn.execute("SELECT value FROM meta WHERE key = 'created'").fetchone()[0])
+
+    def pending(self):
+        """Returns (files, bytes) not yet handled, counting whole folders by their contents."""
+        files, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files WHERE state = 0 AND tree IS NULL"
+        ).fetchone()
+        t_files, t_size = self.conn.execute("SELECT COALESCE(SUM(files), 0), COALESCE(SUM(size), 0) FROM trees WHERE state = 0").fetchone()
+        return files + t_files, size + t_size
+
+    # ===========================
+    # Loading and Verifying
+    # ===========================
+    def load(self, should_stop=None, record=True):
+        """Returns a CleanQueue of the pending entries whose fingerprint still matches.
+
+        Files whose size or mtime changed are counted in `changed`, missing
+        files and folders in `gone`; with record=True (the default) they are
+        marked so in the plan and never looked at again.
+        """
+        queue = CleanQueue()
+        self._file_rows, self._tree_rows = [], []
+        self.changed = self.gone = 0
+        settled = []
+        dir_ids = {}
+
+        def _dir_id(plan_dir, path):
+            if plan_dir not in dir_ids:
+                dir_ids[plan_dir] = queue.add_dir(path)
+            return dir_ids[plan_dir]
+
+        for category, name in self.conn.execute("SELECT id, name FROM categories ORDER BY id").fetchall():
+            queue.add_category(name)
+            rows = self.conn.execute(
+                "SELECT f.id, f.dir, d.path, f.name, f.size, f.mtime FROM files f JOIN dirs d ON d.id = f.dir "
+                "WHERE f.category = ? AND f.tree IS NULL AND f.state = 0 ORDER BY f.dir, f.id", (category,)
+            )
+            for (plan_dir, path), group in groupby(rows, key=lambda r: (r[1], r[2])):
+                if should_stop and should_stop():
+                    return queue
+                # One listing per folder verifies all of its files
+                try:
+                    with os.scandir(path) as it:
+                        current = {entry.name: entry for entry in it}
+                except FileNotFoundError:
+                    current = {}
+                except OSError:
+                    continue    # Unreadable right now, stays pending
+                for row_id, _, _, file_name, size, mtime in group:
+                    entry = current.get(file_name)
+                    try:
+                        st = entry.stat(follow_symlinks=False) if entry else None
+                    except OSError:
+                        st = None
+                    if st is None:
+                        self.gone += 1
+                        settled.append((GONE, "files", row_id))
+                    elif not stat.S_ISREG(st.st_mode) or st.st_size != size or st.st_mtime != mtime:
+                        self.changed += 1
+                        settled.append((CHANGED, "files", row_id))
+                    else:
+                        queue.add_file(_dir_id(plan_dir, path), file_name, size, mtime)
+                        self._file_rows.append(row_id)
+
+            for row_id, plan_dir, path, files, size in self.conn.execute(
+                "SELECT t.id, t.dir, d.path, t.files, t.size FROM trees t JOIN dirs d ON d.id = t.dir "
+                "WHERE t.category = ? AND t.state = 0 ORDER BY t.id", (category,)
+            ).fetchall():
+                if not os.path.isdir(path):
+                    self.gone += files
+                    settled.append((GONE, "trees", row_id))
+                    continue
+                queue.add_tree(_dir_id(plan_dir, path))
+                self._tree_rows.append(row_id)
+                for member_id, member_dir, member_path, file_name, f_size, mtime in self.conn.execute(
+                    "SELECT f.id, f.dir, d.path, f.name, f.size, f.mtime FROM files f JOIN dirs d ON d.id = f.dir "
+                    "WHERE f.tree = ? ORDER BY f.id", (row_id,)
+                ).fetchall():
+                    queue.add_tree_file(_dir_id(member_dir, member_path), file_name, f_size, mtime)
+                    self._file_rows.append(member_id)
+
+        if record and settled:
+            for (state, table), group in groupby(sorted(settled), key=lambda r: (r[0], r[1])):
+                self.conn.executemany(f"UPDATE {table} SET state = {state} WHERE id = ?", [(r[2],) for r in group])
+            self.conn.commit()
+        return queue
+
+    # ===========================
+    # Progress
+    # ===========================
+    def mark(self, kind, which):
+        """DeletionEngine on_done hook: marks a batch of files or a whole folder of the loaded queue done."""
+        with self._lock:
+            if kind == "tree":
+                self.conn.execute("UPDATE trees SET state = 1 WHERE id = ?", (self._tree_rows[which],))
+            else:
+                self.conn.executemany("UPDATE files SET state = 1 WHERE id = ?", [(self._file_rows[i],) for i in which])
+            now = time.monotonic()
+            if now - self._last_commit >= PLAN_COMMIT_SECONDS:
+                self.conn.commit()
+                self._last_commit = now
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+
+# ===========================
+# Command Line
+# ===========================
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="python -m modules.clean_plan", description="Headless WinOptimizer System Cleaner (NDJSON output).")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--plan", metavar="FILE", help="Scan the cleaner locations and write a cleaning plan")
+    action.add_argument("--execute", metavar="FILE", help="Clean the files of a plan (resumes an interrupted run)")
+    parser.add_argument("--location", action="append", metavar="NAME", help="Only scan this CLEANER_PATHS location (repeatable)")
+    parser.add_argument("--workers", type=int, default=None, help="Deletion threads per location")
+    parser.add_argument("--dry-run", action="store_true", help="With --execute: verify the plan and report, without deleting")
+    return parser
+
+
+def _write_plan(args, emit):
+    locations = [(name, path) for name, path in CLEANER_PATHS if not args.location or name in args.location]
+    unknown = set(args.location or ()) - {name for name, _ in CLEANER_PATHS}
+    if unknown:
+        print(f"Unknown location: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    emit({"type": "start", "plan": args.plan, "locations": [name for name, _ in locations]})
+    queue = scan_junk(
+        locations,
+        on_error=lambda name, path, exc: emit({"type": "error", "location": name, "path": path, "error": str(exc)})
+    )
+    for name, files, size, folders in queue.totals():
+        emit({"type": "location", "name": name, "files": files, "size": size, "whole_folders": folders})
+    CleanPlan.save(args.plan, queue).close()
+    emit({"type": "summary", "plan": args.plan, "files": len(queue), "size": queue.total_size,
+          "kept_by_rules": queue.kept_files, "kept_reasons": queue.kept_reasons})
+    return 0
+
+
+def _execute_plan(args, emit):
+    try:
+        plan = CleanPlan(args.execute)
+    except (OSError, sqlite3.DatabaseError, ValueError) as e:
+        print(f"Cannot open plan {args.execute}: {e}", file=sys.stderr)
+        return 2
+
+    stop = threading.Event()
+    try:
+        emit({"type": "start", "plan": args.execute, "created": plan.created, "dry_run": args.dry_run})
+        queue = plan.load(stop.is_set, record=not args.dry_run)
+        emit({"type": "verified", "files": len(queue), "size": queue.total_size, "changed": plan.changed, "gone": plan.gone})
+        if args.dry_run or not len(queue):
+            return 0
+
+        engine = DeletionEngine(
+            workers=args.workers, should_stop=stop.is_set, on_done=plan.mark,
+            progress=lambda done, total, freed: emit({"type": "progress", "done": done, "total": total, "freed": freed})
+        )
+        worker = threading.Thread(target=engine.run, args=(queue,), daemon=True)
+        worker.start()
+        try:
+            while worker.is_alive():
+                worker.join(0.5)
+        except KeyboardInterrupt:
+            # Let the running batches finish so their progress is recorded
+            stop.set()
+            worker.join()
+        files, size = plan.pending()
+        emit({"type": "summary", "deleted": engine.deleted, "freed": engine.freed_bytes, "failed": engine.failed,
+              "failed_by_location": engine.failed_by_location, "stopped": stop.is_set(),
+              "remaining_files": files, "remaining_size": size})
+        return 130 if stop.is_set() else 0
+    finally:
+        plan.close()
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    emit = NDJSONWriter(sys.stdout)
+    if args.plan:
+        return _write_plan(args, emit)
+    return _execute_plan(args, emit)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
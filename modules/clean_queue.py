@@ -0,0 +1,235 @@
+import os
+from array import array
+
+
+class CleanQueue:
+    """Compact queue of the files found by a cleaner scan.
+
+    Every directory path is stored once and files refer to it by id. File
+    names are packed into one UTF-8 buffer addressed by offsets, and sizes,
+    mtimes, directory ids and category (cleaner location) ids live in typed
+    arrays, so a queued file costs about 30 bytes plus its name instead of a full
+    path string and a tuple. Files are appended location by location, which
+    keeps each category a contiguous index range.
+
+    Folders whose whole subtree qualifies can be collapsed into tree
+    entries (collapse_trees). Their files stay in the arrays, after the
+    category's loose files and grouped per tree, so a tree is removed in
+    one pass but only the files recorded for it (with the same size and
+    mtime) are deleted.
+    """
+    def __init__(self):
+        self.categories = []        # location names; list index = category id
+        self.dirs = []              # directory paths; list index = dir id
+        self.dir_parent = array('l')
+        self.file_dir = array('l')
+        self.file_size = array('q')
+        self.file_mtime = array('d')
+        self.file_category = array('B')
+        self._names = bytearray()
+        self._name_end = array('Q')
+        self.tree_dir = array('l')
+        self.tree_start = array('q')        # index of the tree's first file
+        self.tree_files = array('q')
+        self.tree_size = array('q')
+        self.category_start = array('q')
+        self.category_tree_start = array('q')
+        self.category_files = array('q')    # including the files inside trees
+        self.category_bytes = array('q')
+        self.category_kept_files = array('q')   # left in place by the cleaning rules
+        self.category_kept_bytes = array('q')
+        self.kept_reasons = {}      # reason -> files
+
+    def __len__(self):
+        return sum(self.category_files)
+
+    @property
+    def total_size(self):
+        return sum(self.category_bytes)
+
+    # ===========================
+    # Building
+    # ===========================
+    def add_category(self, name):
+        """Starts a new location; files added from now on belong to it. Returns its id."""
+        if len(self.categories) >= 256:
+            raise ValueError("Too many cleaner locations")
+        self.categories.append(name)
+        self.category_start.append(len(self.file_size))
+        self.category_tree_start.append(len(self.tree_dir))
+        self.category_files.append(0)
+        self.category_bytes.append(0)
+        self.category_kept_files.append(0)
+        self.category_kept_bytes.append(0)
+        return len(self.categories) - 1
+
+    def add_dir(self, path, parent=-1):
+        """Adds a folder below `parent` (-1 for a location root); parents must come first."""
+        self.dirs.append(path)
+        self.dir_parent.append(parent)
+        return len(self.dirs) - 1
+
+    def add_file(self, dir_id, name, size, mtime=0.0):
+        """Queues a loose file of the current (last added) category, before any of its trees."""
+        category = len(self.categories) - 1
+        self._append(dir_id, name, size, mtime, category)
+        self.category_files[category] += 1
+        self.category_bytes[category] += size
+
+    def _append(self, dir_id, name, size, mtime, category):
+        self.file_dir.append(dir_id)
+        self.file_size.append(size)
+        self.file_mtime.append(mtime)
+        self.file_category.append(category)
+        self._names += name.encode("utf-8", "surrogatepass")
+        self._name_end.append(len(self._names))
+
+    def add_tree(self, dir_id):
+        """Starts a whole-folder entry of the current category; add its files with add_tree_file."""
+        self.tree_dir.append(dir_id)
+        self.tree_start.append(len(self.file_size))
+        self.tree_files.append(0)
+        self.tree_size.append(0)
+        return len(self.tree_dir) - 1
+
+    def add_tree_file(self, dir_id, name, size, mtime):
+        """Adds a file below the last added tree."""
+        category = len(self.categories) - 1
+        tree = len(self.tree_dir) - 1
+        self._append(dir_id, name, size, mtime, category)
+        self.tree_files[tree] += 1
+        self.tree_size[tree] += size
+        self.category_files[category] += 1
+        self.category_bytes[category] += size
+
+    def add_kept(self, reason, size):
+        """Counts a file of the current category that the cleaning rules leave in place."""
+        category = len(self.categories) - 1
+        self.category_kept_files[category] += 1
+        self.category_kept_bytes[category] += size
+        self.kept_reasons[reason] = self.kept_reasons.get(reason, 0) + 1
+
+    @property
+    def kept_files(self):
+        return sum(self.category_kept_files)
+
+    @property
+    def kept_size(self):
+        return sum(self.category_kept_bytes)
+
+    def collapse_trees(self, first_dir, full):
+        """Turns the topmost fully qualifying folders of the current category into tree entries.
+
+        full[i] tells whether dirs[first_dir + i] and everything below it
+        qualify. Location roots are never removed themselves, so a fully
+        qualifying root contributes its subfolders. The category's files are
+        reordered: loose files first, then the files of each tree in turn.
+        The category totals are unchanged.
+        """
+        category = len(self.categories) - 1
+        tree_of = array('l', [-1]) * (len(self.dirs) - first_dir)
+        tree_dirs = []
+        for i in range(len(tree_of)):
+            parent = self.dir_parent[first_dir + i]
+            if parent < 0:
+                continue
+            if tree_of[parent - first_dir] >= 0:
+                tree_of[i] = tree_of[parent - first_dir]
+            elif full[i]:
+                tree_of[i] = len(tree_dirs)
+                tree_dirs.append(first_dir + i)
+        if not tree_dirs:
+            return
+
+        # Stable counting sort of the category's files by group (0 = loose,
+        # t + 1 = tree t), kept in typed arrays rather than per-file tuples
+        start, end = self.category_start[category], len(self.file_size)
+        group_end = array('q', [0]) * (len(tree_dirs) + 1)
+        for i in range(start, end):
+            group_end[tree_of[self.file_dir[i] - first_dir] + 1] += 1
+        offset = start
+        for g in range(len(group_end)):
+            group_end[g], offset = offset, offset + group_end[g]
+        order = array('q', [0]) * (end - start)
+        for i in range(start, end):
+            g = tree_of[self.file_dir[i] - first_dir] + 1
+            order[group_end[g] - start] = i
+            group_end[g] += 1
+
+        for column in (self.file_dir, self.file_size, self.file_mtime):
+            column[start:] = array(column.typecode, (column[i] for i in order))
+        name_start = self._name_end[start - 1] if start else 0
+        names, name_end = bytearray(), array('Q')
+        with memoryview(self._names) as view:
+            for i in order:
+                names += view[self._name_end[i - 1] if i else 0:self._name_end[i]]
+                name_end.append(name_start + len(names))
+        self._names[name_start:] = names
+        self._name_end[start:] = name_end
+
+        for t, dir_id in enumerate(tree_dirs):
+            first, last = group_end[t], group_end[t + 1]
+            self.tree_dir.append(dir_id)
+            self.tree_start.append(first)
+            self.tree_files.append(last - first)
+            self.tree_size.append(sum(self.file_size[first:last]))
+
+    # ===========================
+    # Reading
+    # ===========================
+    def name(self, i):
+        start = self._name_end[i - 1] if i else 0
+        return self._names[start:self._name_end[i]].decode("utf-8", "surrogatepass")
+
+    def path(self, i):
+        return os.path.join(self.dirs[self.file_dir[i]], self.name(i))
+
+    def _range(self, starts, category, count):
+        end = starts[category + 1] if category + 1 < len(starts) else count
+        return range(starts[category], end)
+
+    def category_range(self, category):
+        """Indices of the loose (not collapsed) files of one category."""
+        files = self._range(self.category_start, category, len(self.file_size))
+        trees = self.category_trees(category)
+        return range(files.start, self.tree_start[trees.start]) if trees else files
+
+    def category_trees(self, category):
+        return self._range(self.category_tree_start, category, len(self.tree_dir))
+
+    def tree_range(self, tree):
+        """Indices of the files recorded below one tree."""
+        start = self.tree_start[tree]
+        return range(start, start + self.tree_files[tree])
+
+    def tree_members(self, tree):
+        """Returns {path relative to the tree folder: (size, mtime)} for one tree."""
+        prefix = len(os.path.join(self.dirs[self.tree_dir[tree]], ""))
+        return {
+            os.path.join(self.dirs[self.file_dir[i]], self.name(i))[prefix:]: (self.file_size[i], self.file_mtime[i])
+            for i in self.tree_range(tree)
+        }
+
+    def totals(self):
+        """Returns [(location name, files, bytes, whole folders)] in scan order."""
+        return [
+            (name, self.category_files[c], self.category_bytes[c], len(self.category_trees(c)))
+            for c, name in enumerate(self.categories)
+        ]
+
+    def preview(self, limit=100, category=None):
+        """Yields up to `limit` (path, size) pairs, whole folders (with a trailing separator) first."""
+        categories = [category] if category is not None else range(len(self.categories))
+        shown = 0
+        for c in categories:
+            for t in self.category_trees(c):
+                if shown >= limit:
+                    return
+                yield os.path.join(self.dirs[self.tree_dir[t]], ""), self.tree_size[t]
+                shown += 1
+        for c in categories:
+            for i in self.category_range(c):
+                if shown >= limit:
+                    return
+                yield self.path(i), self.file_size[i]
+                shown += 1
@@ -0,0 +1,95 @@
+import os
+import time
+import ctypes
+
+from modules.scan_rules import normalize_extensions
+
+try:
+    from config import CLEANER_DEFAULT_RULES, CLEANER_RULES
+except ImportError:
+    CLEANER_DEFAULT_RULES = {"min_age_hours": 24, "extensions": None, "max_file_mb": None, "skip_locked": True}
+    CLEANER_RULES = {}
+
+SECONDS_PER_HOUR = 3600
+
+# Reasons a file is kept, as reported by CleanRules.check and CleanRules.reason
+RECENT = "recently modified"
+EXTENSION = "extension not allowed"
+TOO_LARGE = "too large"
+IN_USE = "in use"
+
+DELETE = 0x00010000
+FILE_SHARE_ALL = 0x7
+OPEN_EXISTING = 3
+FILE_FLAG_OPEN_REPARSE_POINT = 0x00200000
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+if os.name == "nt":
+    from ctypes import wintypes
+
+    # Own kernel32 instance, so these prototypes are set once and shared with no other module
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.CreateFileW.argtypes = (
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE
+    )
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+
+def is_locked(path):
+    """True when another process holds the file open without allowing deletion.
+
+    Opens the file for DELETE access while sharing everything, which fails
+    exactly when a delete would; the handle is closed again right away and
+    the file is left untouched. Files on POSIX systems can always be
+    unlinked, so this is False there.
+    """
+    if os.name != "nt":
+        return False
+    handle = _kernel32.CreateFileW(path, DELETE, FILE_SHARE_ALL, None, OPEN_EXISTING, FILE_FLAG_OPEN_REPARSE_POINT, None)
+    if handle in (None, INVALID_HANDLE_VALUE):
+        return True
+    _kernel32.CloseHandle(handle)
+    return False
+
+
+class CleanRules:
+    """Policy deciding which files below one cleaner location may be removed.
+
+    min_age_hours keeps files modified more recently than that, extensions
+    (an allow-list, e.g. config.SAFE_JUNK_EXTENSIONS) keeps every other
+    file, max_file_mb keeps larger files and skip_locked keeps files that
+    are open in another process. None disables a rule. Ages are measured
+    from mtime when the rules are built.
+    """
+    def __init__(self, min_age_hours=None, extensions=None, max_file_mb=None, skip_locked=False, now=None):
+        now = time.time() if now is None else now
+        self.newest_mtime = now - min_age_hours * SECONDS_PER_HOUR if min_age_hours is not None else None
+        self.extensions = normalize_extensions(extensions)
+        self.max_size = int(max_file_mb * 1024 * 1024) if max_file_mb is not None else None
+        self.skip_locked = skip_locked
+
+    @classmethod
+    def for_location(cls, name, now=None):
+        """Rules for a CLEANER_PATHS entry: CLEANER_DEFAULT_RULES overridden by CLEANER_RULES[name]."""
+        settings = dict(CLEANER_DEFAULT_RULES)
+        settings.update(CLEANER_RULES.get(name, {}))
+        return cls(now=now, **settings)
+
+    def check(self, name, size, mtime):
+        """Returns the reason to keep a file based on its listing alone, or None."""
+        if self.newest_mtime is not None and mtime > self.newest_mtime:
+            return RECENT
+        if self.max_size is not None and size > self.max_size:
+            return TOO_LARGE
+        if self.extensions and not name.lower().endswith(self.extensions):
+            return EXTENSION
+        return None
+
+    def reason(self, entry):
+        """Returns the reason to keep a FileEntry, or None. The lock check runs last."""
+        reason = self.check(entry.name, entry.size, entry.mtime)
+        if reason is None and self.skip_locked and is_locked(entry.path):
+            return IN_USE
+        return reason
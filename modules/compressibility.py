@@ -0,0 +1,109 @@
+import os
+import lzma
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from modules.throttle import Throttle
+
+try:
+    from config import SCANNER_COMPRESS_METHOD, SCANNER_COMPRESS_SAMPLE_BLOCKS, SCANNER_COMPRESS_BLOCK_KB
+except ImportError:
+    SCANNER_COMPRESS_METHOD = "zlib"
+    SCANNER_COMPRESS_SAMPLE_BLOCKS = 16
+    SCANNER_COMPRESS_BLOCK_KB = 64
+
+METHODS = ("zlib", "lzma")
+
+
+def compressed_size(data, method):
+    if method == "lzma":
+        return len(lzma.compress(data, preset=1))
+    return len(zlib.compress(data, 6))
+
+
+def sample_offsets(size, blocks, block_bytes):
+    """Evenly spaced block offsets covering the start, the end and the middle of a file."""
+    if size <= blocks * block_bytes:
+        return [0]
+    last = size - block_bytes
+    return [last * i // (blocks - 1) for i in range(blocks)] if blocks > 1 else [0]
+
+
+def estimate_file(path, size, method, blocks, block_bytes, throttle_settings=None):
+    """Process pool worker: returns (path, size, sampled_bytes, compressed_sampled_bytes).
+
+    Files no larger than the sample are compressed whole; otherwise only
+    `blocks` blocks of block_bytes are read. Each block is compressed on its
+    own, like the fixed-size compression units of NTFS.
+    """
+    throttle = Throttle(**throttle_settings) if throttle_settings else None
+    if throttle:
+        throttle.enter_worker()
+    raw = packed = 0
+    with open(path, "rb") as f:
+        for offset in sample_offsets(size, blocks, block_bytes):
+            f.seek(offset)
+            data = f.read(block_bytes if size > blocks * block_bytes else size)
+            if not data:
+                break
+            if throttle:
+                throttle.bytes(len(data))
+            for start in range(0, len(data), block_bytes):
+                block = data[start:start + block_bytes]
+                raw += len(block)
+                packed += compressed_size(block, method)
+    return path, size, raw, packed
+
+
+class CompressionReport:
+    """Estimates how much space compressing each file would give back.
+
+    The ratio measured on the sampled blocks is extrapolated to the whole
+    file. Files are estimated on a process pool, one file per task, and the
+    results are ranked by reclaimable bytes, most first.
+    """
+    def __init__(self, method=None, blocks=None, block_bytes=None, workers=None, should_stop=None, progress=None, throttle=None):
+        self.method = method or SCANNER_COMPRESS_METHOD
+        if self.method not in METHODS:
+            raise ValueError(f"Unknown compression method: {self.method}")
+        self.blocks = blocks or SCANNER_COMPRESS_SAMPLE_BLOCKS
+        self.block_bytes = block_bytes or SCANNER_COMPRESS_BLOCK_KB * 1024
+        self.workers = workers or os.cpu_count() or 2
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = progress
+        self.throttle = throttle
+        self.total_bytes = 0
+        self.sampled_bytes = 0
+        self.reclaimable = 0
+        self.per_file = []      # (path, bytes, estimated_bytes, reclaimable)
+        self.errors = 0
+
+    def run(self, files):
+        """Estimates [(path, size)] and returns self."""
+        settings = self.throttle.process_settings(self.workers) if self.throttle else None
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(estimate_file, path, size, self.method, self.blocks, self.block_bytes, settings)
+                for path, size in files if size > 0
+            ]
+            for done, fut in enumerate(as_completed(futures), 1):
+                if self.should_stop():
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    return self
+                try:
+                    path, size, raw, packed = fut.result()
+                except OSError:
+                    self.errors += 1
+                    continue
+                if not raw:
+                    continue
+                estimated = min(size, round(size * packed / raw))
+                self.total_bytes += size
+                self.sampled_bytes += raw
+                self.reclaimable += size - estimated
+                self.per_file.append((path, size, estimated, size - estimated))
+
+                if self.progress:
+                    self.progress("Estimating compression", done, len(futures))
+        self.per_file.sort(key=lambda item: item[3], reverse=True)
+        return self
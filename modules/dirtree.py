@@ -0,0 +1,147 @@
+import os
+import sys
+import heapq
+from array import array
+
+
+class DirTree:
+    """Compact du-style directory size tree built incrementally from DirListings.
+
+    Nodes are integer ids into parallel arrays. Each node stores only its own
+    name component (interned), so full path strings are never kept except for
+    the roots and for directories that are discovered but not yet listed.
+    Totals are pushed up to every ancestor as each listing arrives, so the
+    tree can be queried at any point during a scan.
+    """
+    def __init__(self):
+        self.names = []
+        self.parent = array('q')
+        self.first_child = array('q')
+        self.next_sibling = array('q')
+        self.own_bytes = array('q')
+        self.own_files = array('q')
+        self.total_bytes = array('q')
+        self.total_files = array('q')
+        self.roots = []
+        self._pending = {}    # path -> node id, for subdirectories not listed yet
+
+    def __len__(self):
+        return len(self.names)
+
+    def _new_node(self, name, parent):
+        node = len(self.names)
+        self.names.append(name)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        for arr in (self.own_bytes, self.own_files, self.total_bytes, self.total_files):
+            arr.append(0)
+        if parent >= 0:
+            self.next_sibling[node] = self.first_child[parent]
+            self.first_child[parent] = node
+        return node
+
+    # ===========================
+    # Building
+    # ===========================
+    def node_for_listing(self, listing):
+        """Returns the node of a listing's directory, registering its subdirectories."""
+        node = self._pending.pop(listing.path, None)
+        if node is None:
+            node = self._new_node(listing.path, -1)
+            self.roots.append(node)
+        for sub_path, _ in listing.dirs:
+            self._pending[sub_path] = self._new_node(sys.intern(os.path.basename(sub_path)), node)
+        return node
+
+    def add_listing(self, listing):
+        node = self.node_for_listing(listing)
+        nbytes = 0
+        for entry in listing.files:
+            nbytes += entry.size
+        nfiles = len(listing.files)
+
+        self.own_bytes[node] += nbytes
+        self.own_files[node] += nfiles
+        p = node
+        while p >= 0:
+            self.total_bytes[p] += nbytes
+            self.total_files[p] += nfiles
+            p = self.parent[p]
+        return node
+
+    # ===========================
+    # Queries
+    # ===========================
+    def path(self, node):
+        parts = []
+        while node >= 0:
+            parts.append(self.names[node])
+            node = self.parent[node]
+        return os.path.join(*reversed(parts))
+
+    def children(self, node):
+        out = []
+        child = self.first_child[node]
+        while child >= 0:
+            out.append(child)
+            child = self.next_sibling[child]
+        return out
+
+    def largest_children(self, node, n=None):
+        kids = sorted(self.children(node), key=lambda c: self.total_bytes[c], reverse=True)
+        return kids if n is None else kids[:n]
+
+    def find(self, path):
+        """Returns the node id for path, or None if it is not part of the tree."""
+        norm = os.path.normcase(os.path.normpath(path))
+        for root in self.roots:
+            root_norm = os.path.normcase(os.path.normpath(self.names[root]))
+            if norm == root_norm:
+                return root
+            prefix = root_norm.rstrip(os.sep) + os.sep
+            if not norm.startswith(prefix):
+                continue
+            node = root
+            for part in norm[len(prefix):].split(os.sep):
+                node = next((c for c in self.children(node) if os.path.normcase(self.names[c]) == part), None)
+                if node is None:
+                    break
+            if node is not None:
+                return node
+        return None
+
+    def top_dirs(self, n=20, own=False):
+        """The n directories with the most bytes (own files only, or whole subtree)."""
+        values = self.own_bytes if own else self.total_bytes
+        return heapq.nlargest(n, range(len(self.names)), key=values.__getitem__)
+
+    def treemap(self, node, max_depth=2, min_fraction=0.01):
+        """Nested {name, path, size, files, children} dicts for drawing a treemap.
+
+        Children smaller than min_fraction of their parent are merged into a
+        single "(other)" item; a directory's own files become a "(files)" item.
+        """
+        total = self.total_bytes[node]
+        item = {
+            "name": self.names[node] if self.parent[node] >= 0 else self.path(node),
+            "path": self.path(node),
+            "size": total,
+            "files": self.total_files[node],
+            "children": [],
+        }
+        if max_depth <= 0:
+            return item
+
+        other = 0
+        for child in self.largest_children(node):
+            size = self.total_bytes[child]
+            if total and size / total < min_fraction:
+                other += size
+            else:
+                item["children"].append(self.treemap(child, max_depth - 1, min_fraction))
+        if self.own_bytes[node]:
+            item["children"].append({"name": "(files)", "path": item["path"], "size": self.own_bytes[node], "files": self.own_files[node], "children": []})
+        if other:
+            item["children"].append({"name": "(other)", "path": None, "size": other, "files": 0, "children": []})
+        return item
@@ -0,0 +1,307 @@
+import os
+import mmap
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from config import SCANNER_HASH_WORKERS, SCANNER_SAMPLE_BYTES
+except ImportError:
+    SCANNER_HASH_WORKERS = 8
+    SCANNER_SAMPLE_BYTES = 64 * 1024
+
+# Read buffer used for full-content hashing
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Byte verification maps both files in windows of this size (aligned for mmap offsets)
+VERIFY_WINDOW_BYTES = (64 * 1024 * 1024 // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+
+
+def _new_hasher():
+    return hashlib.blake2b(digest_size=20)
+
+
+def _views_equal(a, b):
+    """Compares two equal-length buffers in place, 8 bytes per step where possible."""
+    n = len(a)
+    body = n - n % 8
+    if body:
+        with a[:body] as va, b[:body] as vb, va.cast('Q') as qa, vb.cast('Q') as qb:
+            if qa != qb:
+                return False
+    return a[body:] == b[body:]
+
+
+def files_identical(path_a, path_b, size, window=VERIFY_WINDOW_BYTES, throttle=None):
+    """Byte-compares two files of `size` bytes through aligned mmap windows.
+
+    Nothing is copied into Python bytes objects and the comparison stops at
+    the first window that differs. A Throttle, if given, is charged per window.
+    """
+    with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+        if os.fstat(fa.fileno()).st_size != size or os.fstat(fb.fileno()).st_size != size:
+            return False
+        offset = 0
+        while offset < size:
+            length = min(window, size - offset)
+            if throttle:
+                throttle.bytes(2 * length)
+            with mmap.mmap(fa.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as ma, \
+                 mmap.mmap(fb.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as mb:
+                with memoryview(ma) as va, memoryview(mb) as vb:
+                    if not _views_equal(va, vb):
+                        return False
+            offset += length
+    return True
+
+
+class DuplicateFinder:
+    """Staged content-verified duplicate detection.
+
+    Candidates arrive grouped by size. Each surviving group is narrowed by a
+    head/tail sample hash and only the remaining files are hashed in full.
+    Hashing runs on a thread pool since it is dominated by disk latency.
+    When a FileIndex is given, hashes are reused from it for files whose
+    fresh size and mtime still match the ones they were hashed at.
+    With verify=True every hash group is finally confirmed byte-for-byte.
+    A Throttle, when given, paces every read in low-impact mode.
+
+    Paths that are hard links to one file are collapsed to a single
+    candidate before anything is read (the others are kept in `links`), so
+    a file linked twice is neither reported as its own duplicate nor
+    counted as reclaimable twice.
+    """
+    def __init__(self, workers=None, sample_bytes=None, should_stop=None, progress=None, index=None, verify=False,
+                 throttle=None):
+        self.workers = workers or SCANNER_HASH_WORKERS
+        self.sample_bytes = sample_bytes or SCANNER_SAMPLE_BYTES
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = progress
+        self.index = index
+        self.verify = verify
+        self.throttle = throttle
+        self.links = {}         # representative path -> other paths to the same file
+        self.linked_bytes = 0   # bytes already shared through hard links
+        self.bytes_verified = 0
+        self.bytes_read = 0
+        self.files_hashed = 0
+        self.hashes_reused = 0
+        self._lock = threading.Lock()
+
+    # ===========================
+    # Hash Primitives
+    # ===========================
+    def _count(self, nbytes):
+        with self._lock:
+            self.bytes_read += nbytes
+            self.files_hashed += 1
+
+    def _pool(self):
+        """Hashing thread pool; its threads drop to background priority in low-impact mode."""
+        return ThreadPoolExecutor(max_workers=self.workers, initializer=self.throttle.enter_worker if self.throttle else None)
+
+    def _fingerprint(self, path):
+        """Fresh (size, mtime) of a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime
+
+    def _cached(self, path, kind):
+        """Stored hash of path, only if the file still has the size and mtime it was hashed at."""
+        if self.index is None:
+            return None
+        fingerprint = self._fingerprint(path)
+        if fingerprint is None:
+            return None
+        digest = self.index.cached_hash(path, kind, *fingerprint)
+        if digest is not None:
+            with self._lock:
+                self.hashes_reused += 1
+        return digest
+
+    def _remember(self, path, kind, digest, fingerprint):
+        if self.index is not None and fingerprint is not None:
+            self.index.store_hash(path, kind, digest, *fingerprint)
+
+    def hash_sample(self, path, size):
+        """Hashes the first and last sample_bytes of a file (whole file if small)."""
+        cached = self._cached(path, "sample")
+        if cached is not None:
+            return cached
+
+        # Taken before reading, so a file changing during the read is never cached as unchanged
+        fingerprint = self._fingerprint(path) if self.index is not None else None
+        h = _new_hasher()
+        read = 0
+        if self.throttle:
+            self.throttle.bytes(min(size, 2 * self.sample_bytes))
+        with open(path, "rb") as f:
+            if size <= 2 * self.sample_bytes:
+                data = f.read()
+                h.update(data)
+                read = len(data)
+            else:
+                head = f.read(self.sample_bytes)
+                f.seek(size - self.sample_bytes)
+                tail = f.read(self.sample_bytes)
+                h.update(head)
+                h.update(tail)
+                read = len(head) + len(tail)
+        self._count(read)
+        digest = h.digest()
+        self._remember(path, "sample", digest, fingerprint)
+        return digest
+
+    def hash_full(self, path):
+        """Hashes the full file content using a reused read buffer."""
+        cached = self._cached(path, "full")
+        if cached is not None:
+            return cached
+
+        fingerprint = self._fingerprint(path) if self.index is not None else None
+        h = _new_hasher()
+        buf = bytearray(HASH_CHUNK_BYTES)
+        view = memoryview(buf)
+        read = 0
+        with open(path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
+                read += n
+                if self.throttle:
+                    self.throttle.bytes(n)
+        self._count(read)
+        digest = h.digest()
+        self._remember(path, "full", digest, fingerprint)
+        return digest
+
+    # ===========================
+    # Pipeline
+    # ===========================
+    def _refine(self, groups, stage, hash_fn):
+        """Splits every (size, paths) group by hash_fn, dropping singletons."""
+        total = sum(len(paths) for _, paths in groups)
+        buckets = {}
+        done = 0
+
+        with self._pool() as pool:
+            futures = {}
+            for size, paths in groups:
+                for path in paths:
+                    futures[pool.submit(hash_fn, path, size)] = (size, path)
+
+            for fut in as_completed(futures):
+                if self.should_stop():
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    return []
+
+                size, path = futures[fut]
+                done += 1
+                try:
+                    digest = fut.result()
+                except OSError:
+                    continue
+                buckets.setdefault((size, digest), []).append(path)
+
+                if self.progress and done % 50 == 0:
+                    self.progress(stage, done, total)
+
+        return [(size, sorted(paths)) for (size, _), paths in buckets.items() if len(paths) > 1]
+
+    def _collapse_links(self, groups):
+        """Keeps one path per (device, inode) in every size group; drops groups left with one file."""
+        def _stat_group(paths):
+            by_inode = {}
+            for path in paths:
+                try:
+                    st = os.stat(path, follow_symlinks=False)
+                except OSError:
+                    continue
+                # Filesystems without inode numbers report 0; treat those files as distinct
+                key = (st.st_dev, st.st_ino) if st.st_ino and st.st_nlink > 1 else path
+                by_inode.setdefault(key, []).append(path)
+            return list(by_inode.values())
+
+        collapsed = []
+        with self._pool() as pool:
+            for (size, _), sets in zip(groups, pool.map(_stat_group, [paths for _, paths in groups])):
+                reps = []
+                for paths in sets:
+                    paths.sort()
+                    reps.append(paths[0])
+                    if len(paths) > 1:
+                        self.links[paths[0]] = paths[1:]
+                        self.linked_bytes += size * (len(paths) - 1)
+                if len(reps) > 1:
+                    collapsed.append((size, reps))
+        return collapsed
+
+    def find(self, files_by_size):
+        """Returns confirmed duplicate groups as a list of (size, [paths])."""
+        groups = [(size, paths) for size, paths in files_by_size.items() if size > 0 and len(paths) > 1]
+        if not groups:
+            return []
+
+        groups = self._collapse_links(groups)
+        if not groups or self.should_stop():
+            return []
+
+        groups = self._refine(groups, "Sampling", self.hash_sample)
+
+        # Files no larger than two samples were read completely in the first pass
+        small = [g for g in groups if g[0] <= 2 * self.sample_bytes]
+        large = [g for g in groups if g[0] > 2 * self.sample_bytes]
+        if large and not self.should_stop():
+            large = self._refine(large, "Hashing", lambda path, size: self.hash_full(path))
+
+        groups = small + large
+        if self.verify and groups and not self.should_stop():
+            groups = self._verify(groups)
+
+        if self.should_stop():
+            return []
+        return groups
+
+    def _split_identical(self, size, paths):
+        """Partitions a hash group into byte-identical subgroups, dropping singletons."""
+        subgroups = []
+        compared = 0
+        for path in paths:
+            placed = False
+            for group in subgroups:
+                compared += 1
+                try:
+                    same = files_identical(group[0], path, size, throttle=self.throttle)
+                except (OSError, ValueError):
+                    # Unreadable or changed since hashing: drop it rather than guess
+                    placed = True
+                    break
+                if same:
+                    group.append(path)
+                    placed = True
+                    break
+            if not placed:
+                subgroups.append([path])
+
+        with self._lock:
+            self.bytes_verified += 2 * size * compared
+        return [(size, g) for g in subgroups if len(g) > 1]
+
+    def _verify(self, groups):
+        verified = []
+        done = 0
+        with self._pool() as pool:
+            futures = [pool.submit(self._split_identical, size, paths) for size, paths in groups]
+            for fut in as_completed(futures):
+                if self.should_stop():
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    return []
+                done += 1
+                verified.extend(fut.result())
+                if self.progress:
+                    self.progress("Verifying", done, len(groups))
+        return verified
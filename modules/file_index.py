@@ -0,0 +1,216 @@
+import os
+import sqlite3
+import threading
+
+from modules.traversal import TreeWalker
+
+try:
+    from config import SCANNER_INDEX_PATH
+except ImportError:
+    SCANNER_INDEX_PATH = os.path.join(
+        os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), "WinOptimizer", "scan_index.sqlite3"
+    )
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path   TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime  REAL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE TABLE IF NOT EXISTS files (
+    path        TEXT PRIMARY KEY,
+    dir         TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime       REAL NOT NULL,
+    atime       REAL NOT NULL DEFAULT 0,
+    sample_hash BLOB,
+    full_hash   BLOB
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+CREATE INDEX IF NOT EXISTS files_size ON files(size);
+"""
+
+HASH_COLUMNS = {"sample": "sample_hash", "full": "full_hash"}
+
+# Pending writes are flushed in one transaction after this many statements
+COMMIT_EVERY = 5000
+
+
+def _subtree_bounds(path):
+    """Key range covering every path strictly below `path` (sep-terminated prefix)."""
+    prefix = path.rstrip("\\/") + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+class FileIndex:
+    """Persistent on-disk index of directory listings and file hashes.
+
+    Directory rows store the mtime observed when the directory was last
+    listed, file rows store size, mtime and any hashes computed for them.
+    Hashes are cleared automatically when a file's size or mtime changes.
+    A single connection is shared between threads behind a lock.
+    """
+    def __init__(self, db_path=None):
+        self.db_path = db_path or SCANNER_INDEX_PATH
+        folder = os.path.dirname(self.db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def _maybe_commit(self, ops):
+        self._pending += ops
+        if self._pending >= COMMIT_EVERY:
+            self.conn.commit()
+            self._pending = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
+
+    # ===========================
+    # Directory Listings
+    # ===========================
+    def store_listing(self, listing):
+        """Records a freshly listed directory, keeping hashes of unchanged files.
+
+        Returns False, without writing anything, when the index already
+        holds exactly this listing (same mtime, files and subfolders).
+        """
+        path = listing.path
+        with self._lock:
+            cur = self.conn.cursor()
+            stored = {n: (p, size, mtime) for p, n, size, mtime in cur.execute("SELECT path, name, size, mtime FROM files WHERE dir = ?", (path,))}
+            known, old_subdirs = None, set()
+            for p, parent, mtime in cur.execute("SELECT path, parent, mtime FROM dirs WHERE path = ? OR parent = ?", (path, path)).fetchall():
+                if p == path:
+                    known = mtime
+                else:
+                    old_subdirs.add(p)
+
+            subdirs = {p for p, _ in listing.dirs}
+            if (
+                known is not None and known == listing.mtime and subdirs == old_subdirs
+                and len(stored) == len(listing.files)
+                and all(stored.get(e.name, ())[1:] == (e.size, e.mtime) for e in listing.files)
+            ):
+                return False
+
+            # Forget files and subtrees that disappeared since the last scan
+            names = {e.name for e in listing.files}
+            cur.executemany("DELETE FROM files WHERE path = ?", [(p,) for n, (p, _, _) in stored.items() if n not in names])
+            for old in old_subdirs - subdirs:
+                self._drop_subtree(cur, old)
+
+            cur.executemany(
+                """INSERT INTO files (path, dir, name, size, mtime, atime) VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET
+                       sample_hash = CASE WHEN size = excluded.size AND mtime = excluded.mtime THEN sample_hash END,
+                       full_hash   = CASE WHEN size = excluded.size AND mtime = excluded.mtime THEN full_hash END,
+                       size = excluded.size, mtime = excluded.mtime, atime = excluded.atime""",
+                [(e.path, path, e.name, e.size, e.mtime, e.atime) for e in listing.files]
+            )
+            # Subdirectories get a row without mtime until they are listed themselves
+            cur.executemany(
+                "INSERT OR IGNORE INTO dirs (path, parent, mtime) VALUES (?, ?, NULL)",
+                [(p, path) for p in subdirs]
+            )
+            cur.execute(
+                """INSERT INTO dirs (path, parent, mtime) VALUES (?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET mtime = excluded.mtime""",
+                (path, os.path.dirname(path), listing.mtime)
+            )
+            self._maybe_commit(len(listing.files) + len(subdirs) + 1)
+        return True
+
+    def store_file(self, entry):
+        """Upserts a single file reported by change tracking, keeping hashes if it is unchanged."""
+        folder = os.path.dirname(entry.path)
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute(
+                """INSERT INTO files (path, dir, name, size, mtime, atime) VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET
+                       sample_hash = CASE WHEN size = excluded.size AND mtime = excluded.mtime THEN sample_hash END,
+                       full_hash   = CASE WHEN size = excluded.size AND mtime = excluded.mtime THEN full_hash END,
+                       size = excluded.size, mtime = excluded.mtime, atime = excluded.atime""",
+                (entry.path, folder, entry.name, entry.size, entry.mtime, entry.atime)
+            )
+            cur.execute("INSERT OR IGNORE INTO dirs (path, parent, mtime) VALUES (?, ?, NULL)", (folder, os.path.dirname(folder)))
+            self._maybe_commit(2)
+
+    def remove_path(self, path):
+        """Forgets a deleted file, or a deleted directory with everything below it."""
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._drop_subtree(cur, path)
+            self._maybe_commit(3)
+
+    def files_of_size(self, size):
+        """Paths of every indexed file with exactly this size."""
+        with self._lock:
+            return [r[0] for r in self.conn.execute("SELECT path FROM files WHERE size = ?", (size,))]
+
+    def _drop_subtree(self, cur, path):
+        low, high = _subtree_bounds(path)
+        cur.execute("DELETE FROM files WHERE dir = ? OR (dir >= ? AND dir < ?)", (path, low, high))
+        cur.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, low, high))
+
+    # ===========================
+    # Hashes
+    # ===========================
+    def cached_hash(self, path, kind, size, mtime):
+        """Returns the stored 'sample' or 'full' hash for path if it was taken at this size and mtime, else None."""
+        column = HASH_COLUMNS[kind]
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT {column} FROM files WHERE path = ? AND size = ? AND mtime = ?", (path, size, mtime)
+            ).fetchone()
+        return row[0] if row else None
+
+    def store_hash(self, path, kind, digest, size, mtime):
+        """Stores a hash taken at this size and mtime; a row describing another version is left alone."""
+        column = HASH_COLUMNS[kind]
+        with self._lock:
+            self.conn.execute(
+                f"UPDATE files SET {column} = ? WHERE path = ? AND size = ? AND mtime = ?", (digest, path, size, mtime)
+            )
+            self._maybe_commit(1)
+
+
+class IndexedTreeWalker(TreeWalker):
+    """TreeWalker that keeps the index in step with every directory it lists.
+
+    The index only caches file hashes; it does not save any directory
+    listing. Every directory is still listed from disk, because a folder's
+    mtime does not change when a file in it is rewritten in place. Listings
+    that differ from the index are stored (dirs_stored), which drops the
+    hashes of changed files; identical ones are left alone (dirs_unchanged).
+    """
+    def __init__(self, index, prune_dir=None, on_error=None, should_stop=None, workers=None, throttle=None):
+        super().__init__(prune_dir=prune_dir, on_error=on_error, should_stop=should_stop, workers=workers, throttle=throttle)
+        self.index = index
+        self.dirs_stored = 0
+        self.dirs_unchanged = 0
+        self._stats_lock = threading.Lock()
+
+    def list_dir(self, path, mtime=0.0):
+        listing = super().list_dir(path, mtime)
+        if listing is None:
+            return None
+        stored = self.index.store_listing(listing)
+        with self._stats_lock:
+            if stored:
+                self.dirs_stored += 1
+            else:
+                self.dirs_unchanged += 1
+        return listing
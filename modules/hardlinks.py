@@ -0,0 +1,276 @@
+import os
+import sys
+import json
+import time
+import errno
+import ctypes
+import shutil
+
+from modules.duplicates import files_identical
+
+try:
+    from config import SCANNER_LINK_JOURNAL_DIR
+except ImportError:
+    SCANNER_LINK_JOURNAL_DIR = os.path.join(
+        os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), "WinOptimizer", "link_journals"
+    )
+
+LINK_MODES = ("hardlink", "reflink", "auto")
+
+# Linux ioctl that clones the extents of one file into another (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+TEMP_SUFFIX = ".wolink"
+
+
+def reflink(source, dest):
+    """Creates dest as a copy-on-write clone of source; raises OSError where unsupported."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        with open(source, "rb") as src, open(dest, "xb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError:
+                dst.close()
+                os.remove(dest)
+                raise
+        return
+    if sys.platform == "darwin":
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(dest), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), dest)
+        return
+    raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform", dest)
+
+
+def _temp_path(target):
+    folder, name = os.path.split(target)
+    return os.path.join(folder, f".{name}.{os.getpid()}{TEMP_SUFFIX}")
+
+
+# ===========================
+# Planning
+# ===========================
+class LinkAction:
+    """Replace `target` by a link to `source`, both `size` bytes of identical content."""
+    __slots__ = ("source", "target", "size")
+
+    def __init__(self, source, target, size):
+        self.source = source
+        self.target = target
+        self.size = size
+
+    def to_dict(self):
+        return {"source": self.source, "target": self.target, "size": self.size}
+
+
+class LinkPlan:
+    """Dry-run result: the replacements that would be made and the copies that cannot be linked."""
+    def __init__(self):
+        self.actions = []
+        self.skipped = []       # (path, reason)
+
+    @property
+    def reclaimable(self):
+        return sum(action.size for action in self.actions)
+
+
+def plan_links(groups):
+    """Plans linking every copy of each (size, [paths]) group to its first path.
+
+    Copies on another volume than the original cannot be linked, and files
+    that changed size since the scan are left alone. Nothing is modified.
+    """
+    plan = LinkPlan()
+    for size, paths in groups:
+        source = paths[0]
+        try:
+            src = os.stat(source)
+        except OSError as e:
+            plan.skipped.extend((p, f"original unreadable: {e}") for p in paths[1:])
+            continue
+        for target in paths[1:]:
+            try:
+                st = os.stat(target, follow_symlinks=False)
+            except OSError as e:
+                plan.skipped.append((target, str(e)))
+                continue
+            if st.st_dev != src.st_dev:
+                plan.skipped.append((target, "on a different volume than the original"))
+            elif st.st_ino and st.st_ino == src.st_ino:
+                plan.skipped.append((target, "already linked"))
+            elif st.st_size != size or src.st_size != size:
+                plan.skipped.append((target, "changed since the scan"))
+            else:
+                plan.actions.append(LinkAction(source, target, size))
+    return plan
+
+
+# ===========================
+# Journal
+# ===========================
+def new_journal_path():
+    return os.path.join(SCANNER_LINK_JOURNAL_DIR, time.strftime("links_%Y%m%d_%H%M%S.ndjson"))
+
+
+def latest_journal():
+    """Most recent journal that has not been undone, or None."""
+    try:
+        names = [n for n in os.listdir(SCANNER_LINK_JOURNAL_DIR) if n.startswith("links_") and n.endswith(".ndjson")]
+    except OSError:
+        return None
+    return os.path.join(SCANNER_LINK_JOURNAL_DIR, max(names)) if names else None
+
+
+class LinkJournal:
+    """Append-only NDJSON record of replaced files, synced before each replacement.
+
+    An entry is written before its file is replaced, so after a crash the
+    journal may name a file that was never replaced; undo checks the file
+    itself and skips those.
+    """
+    def __init__(self, path):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def record(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+
+# ===========================
+# Replacing and Undoing
+# ===========================
+class LinkReplacer:
+    """Replaces planned duplicates with hard links or reflinks, one file at a time.
+
+    Each replacement is atomic: the link is created under a temporary name
+    next to the target and renamed over it, so the target path always holds
+    either the old copy or the link. With verify=True (the default) the two
+    files are byte-compared right before replacing. In 'auto' mode a reflink
+    is tried first and a hard link used where the filesystem has none.
+    A hard link shares the original's timestamps and permissions; a reflink
+    keeps the target's own.
+    """
+    def __init__(self, mode="hardlink", journal_path=None, verify=True, should_stop=None, progress=None, on_result=None):
+        if mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {mode}")
+        self.mode = mode
+        self.journal_path = journal_path or new_journal_path()
+        self.verify = verify
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = progress
+        self.on_result = on_result
+        self.replaced = 0
+        self.reclaimed = 0
+        self.failed = []        # (path, reason)
+        self._no_reflink = set()    # st_dev of volumes found without reflink support
+
+    def _link(self, action, tmp, dev):
+        """Creates tmp as a link to the source; returns the mode used."""
+        if self.mode != "hardlink" and dev not in self._no_reflink:
+            try:
+                reflink(action.source, tmp)
+                shutil.copystat(action.target, tmp)
+                return "reflink"
+            except OSError as e:
+                if self.mode == "reflink":
+                    raise
+                if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+                    # No reflinks on this volume, stop trying there for the rest of the run
+                    self._no_reflink.add(dev)
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        os.link(action.source, tmp)
+        return "hardlink"
+
+    def _replace(self, action, journal):
+        if self.verify and not files_identical(action.source, action.target, action.size):
+            raise ValueError("content differs from the original")
+        st = os.stat(action.target, follow_symlinks=False)
+        tmp = _temp_path(action.target)
+        try:
+            mode = self._link(action, tmp, st.st_dev)
+            journal.record({
+                "source": action.source, "target": action.target, "size": action.size, "mode": mode,
+                "perm": st.st_mode & 0o7777, "atime": st.st_atime, "mtime": st.st_mtime,
+            })
+            os.replace(tmp, action.target)
+        except BaseException:
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            raise
+        return mode
+
+    def run(self, plan):
+        if not plan.actions:
+            return self
+        journal = LinkJournal(self.journal_path)
+        try:
+            for done, action in enumerate(plan.actions, 1):
+                if self.should_stop():
+                    break
+                try:
+                    mode = self._replace(action, journal)
+                except (OSError, ValueError) as e:
+                    self.failed.append((action.target, str(e)))
+                    if self.on_result:
+                        self.on_result(action, None, str(e))
+                    continue
+                self.replaced += 1
+                self.reclaimed += action.size
+                if self.on_result:
+                    self.on_result(action, mode, None)
+                if self.progress and done % 20 == 0:
+                    self.progress("Linking", done, len(plan.actions))
+        finally:
+            journal.close()
+        return self
+
+
+def undo_links(journal_path, on_error=None):
+    """Turns the hard links made by one run back into independent copies.
+
+    Entries are undone newest first. A target that is still linked to its
+    source gets a fresh copy of the content with its recorded permissions
+    and timestamps, swapped in through the same temp-and-rename step.
+    Reflinked files are already independent and are left as they are.
+    Returns (restored, skipped); the journal is renamed to *.undone after.
+    """
+    with open(journal_path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+
+    restored = skipped = 0
+    for entry in reversed(entries):
+        target = entry["target"]
+        try:
+            if entry["mode"] != "hardlink" or not os.path.samefile(entry["source"], target):
+                skipped += 1
+                continue
+        except OSError:
+            # The original may be gone; the target then is the only copy and needs no undo
+            skipped += 1
+            continue
+        tmp = _temp_path(target)
+        try:
+            shutil.copyfile(target, tmp)
+            os.chmod(tmp, entry["perm"])
+            os.utime(tmp, (entry["atime"], entry["mtime"]))
+            os.replace(tmp, target)
+            restored += 1
+        except OSError as e:
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            if on_error:
+                on_error(target, e)
+
+    os.replace(journal_path, journal_path + ".undone")
+    return restored, skipped
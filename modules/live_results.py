@@ -0,0 +1,245 @@
+import os
+import stat
+import threading
+
+from modules.traversal import TreeWalker, FileEntry
+from modules.duplicates import DuplicateFinder, files_identical
+from modules.file_index import FileIndex
+from modules.watcher import open_watcher
+
+
+class LiveResults:
+    """Applies filesystem change events to the results of a finished scan.
+
+    Every event path is stat'ed again, so the event kind is only a hint: a
+    path that is gone is removed everywhere, a file is re-ranked in the
+    large file top-K and re-matched against duplicate groups of its size
+    (and, with an index, against indexed files of that size), unless it is
+    still byte-identical to another member of its own group, and a new
+    folder is listed and each of its files handled the same way. The
+    persistent index, when given, is updated with every change.
+    """
+    def __init__(self, analyzers, index=None, rules=None, verify=False):
+        dup = analyzers.get("duplicates")
+        large = analyzers.get("large")
+        self.dup_analyzer = dup
+        self.tracker = large.tracker if large else None
+        self.index = index
+        self.rules = rules
+        self.verify = verify
+        self.finder = DuplicateFinder(workers=1, index=index)
+        self.lock = threading.Lock()
+        self.applied = 0
+        self.needs_rescan = False
+        self._digests = {}      # (path, size, mtime) -> content digest
+
+        self._group_of = {}     # path -> paths list of its duplicate group
+        self._by_size = {}      # size -> [paths list, ...]
+        if dup:
+            for size, paths in dup.groups:
+                self._by_size.setdefault(size, []).append(paths)
+                for path in paths:
+                    self._group_of[path] = paths
+
+    # ===========================
+    # Duplicate Groups
+    # ===========================
+    def _digest(self, path, size):
+        """Content digest of a file, cached per (path, size, mtime); None if unreadable."""
+        try:
+            mtime = os.stat(path).st_mtime
+            key = (path, size, mtime)
+            digest = self._digests.get(key)
+            if digest is None:
+                if size <= 2 * self.finder.sample_bytes:
+                    digest = self.finder.hash_sample(path, size)
+                else:
+                    digest = self.finder.hash_full(path)
+                self._digests[key] = digest
+            return digest
+        except OSError:
+            return None
+
+    def _same(self, path_a, path_b, size):
+        digest = self._digest(path_a, size)
+        if digest is None or digest != self._digest(path_b, size):
+            return False
+        return not self.verify or files_identical(path_a, path_b, size)
+
+    def _still_duplicate(self, path, size):
+        """True when a file already in a group still matches another member, e.g. it was only touched."""
+        for other in self._group_of.get(path, ()):
+            if other == path:
+                continue
+            try:
+                if files_identical(path, other, size):
+                    return True
+            except (OSError, ValueError):
+                continue
+        return False
+
+    def _drop_from_groups(self, path):
+        """Removes path (or a whole folder) from duplicate groups. Returns True if any group changed."""
+        if path in self._group_of:
+            hits = [path]
+        else:
+            prefix = path.rstrip("\\/") + os.sep
+            hits = [p for p in self._group_of if p.startswith(prefix)]
+        for p in hits:
+            paths = self._group_of.pop(p, None)
+            if paths is None:
+                continue
+            paths.remove(p)
+            if len(paths) < 2:
+                for other in paths:
+                    self._group_of.pop(other, None)
+                paths.clear()
+        if hits:
+            self._prune_groups()
+        return bool(hits)
+
+    def _prune_groups(self):
+        self.dup_analyzer.groups[:] = [(size, paths) for size, paths in self.dup_analyzer.groups if len(paths) > 1]
+        for size in list(self._by_size):
+            self._by_size[size] = [paths for paths in self._by_size[size] if len(paths) > 1]
+            if not self._by_size[size]:
+                del self._by_size[size]
+
+    def _match_file(self, path, size):
+        """Adds a new or rewritten file to the group it duplicates, if any. Returns True if it joined one."""
+        for paths in self._by_size.get(size, ()):
+            if self._same(path, paths[0], size):
+                paths.append(path)
+                paths.sort()
+                self._group_of[path] = paths
+                return True
+
+        if self.index is None:
+            return False
+        # Files outside any group are only known through the index
+        for other in self.index.files_of_size(size):
+            if other == path or other in self._group_of or not os.path.isfile(other):
+                continue
+            if self._same(path, other, size):
+                paths = sorted([path, other])
+                self.dup_analyzer.groups.append((size, paths))
+                self._by_size.setdefault(size, []).append(paths)
+                for p in paths:
+                    self._group_of[p] = paths
+                return True
+        return False
+
+    # ===========================
+    # Applying Events
+    # ===========================
+    def _removed(self, path, changed):
+        if self.tracker and self.tracker.discard(path):
+            changed.add("large")
+        if self.dup_analyzer and self._drop_from_groups(path):
+            changed.add("duplicates")
+        if self.index:
+            self.index.remove_path(path)
+
+    def _file(self, entry, changed):
+        if self.index:
+            self.index.store_file(entry)
+        if self.rules and not self.rules.accepts(entry):
+            self._removed(entry.path, changed)
+            return
+        if self.tracker:
+            version = self.tracker.version
+            self.tracker.update(entry.path, entry.size)
+            if self.tracker.version != version:
+                changed.add("large")
+        if self.dup_analyzer:
+            # Re-verify against the old group before leaving it: a touch does not change content
+            if self._still_duplicate(entry.path, entry.size):
+                return
+            # A rewritten file may no longer match its old group
+            if self._drop_from_groups(entry.path):
+                changed.add("duplicates")
+            if entry.size > 0 and self._match_file(entry.path, entry.size):
+                changed.add("duplicates")
+
+    def _folder(self, path, changed):
+        walker = TreeWalker(prune_dir=self.rules.prune_dir if self.rules else None, workers=1)
+        for listing in walker.walk(path):
+            if self.index:
+                self.index.store_listing(listing)
+            for entry in listing.files:
+                self._file(entry, changed)
+
+    def apply(self, events):
+        """Applies a batch of ChangeEvents; returns the set of result kinds that changed."""
+        changed = set()
+        with self.lock:
+            for event in events:
+                if event.kind == "rescan":
+                    self.needs_rescan = True
+                    continue
+                path = event.path
+                try:
+                    st = os.stat(path, follow_symlinks=False)
+                except OSError:
+                    self._removed(path, changed)
+                    continue
+                if stat.S_ISDIR(st.st_mode):
+                    name = os.path.basename(path)
+                    if self.rules and self.rules.prune_dir(path, name):
+                        continue
+                    self._folder(path, changed)
+                elif stat.S_ISREG(st.st_mode):
+                    self._file(FileEntry.from_stat(path, os.path.basename(path), st), changed)
+            self.applied += len(events)
+        return changed
+
+    def snapshot(self):
+        """Returns (duplicate rows, large file rows, large matched) taken under the lock."""
+        with self.lock:
+            rows = self.dup_analyzer.rows() if self.dup_analyzer else None
+            large = (self.tracker.snapshot(), self.tracker.matched) if self.tracker else (None, 0)
+        return rows, large[0], large[1]
+
+
+class LiveSession:
+    """Watches the roots of a finished ScanJob and keeps its results current.
+
+    on_update(live, changed) is called from the watcher thread after each
+    applied batch that changed something. With an incremental scan the
+    index is reopened here since the job closes its own connection.
+    """
+    def __init__(self, job, on_update, on_error=None, poll_interval=None):
+        options = job.options
+        self.index = None
+        if options["use_index"]:
+            try:
+                self.index = FileIndex(options["index_path"])
+            except Exception as e:
+                if on_error:
+                    on_error(options["index_path"] or "scan index", e)
+        self.live = LiveResults(job.analyzers, index=self.index, rules=job.rules, verify=options["verify"])
+        self.on_update = on_update
+        self.watcher = open_watcher(
+            job.roots, self._on_changes, prune_dir=job.rules.prune_dir if job.rules else None,
+            on_error=on_error, poll_interval=poll_interval
+        )
+
+    @property
+    def backend(self):
+        return self.watcher.backend
+
+    def _on_changes(self, events):
+        changed = self.live.apply(events)
+        if changed or self.live.needs_rescan:
+            self.on_update(self.live, changed)
+
+    def start(self):
+        self.watcher.start()
+        return self
+
+    def stop(self):
+        self.watcher.stop()
+        if self.index:
+            with self.live.lock:
+                self.index.close()
+            self.index = None
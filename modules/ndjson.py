@@ -0,0 +1,16 @@
+"""Line-per-record JSON output shared by the scanner and cleaner command lines."""
+import json
+import threading
+
+
+class NDJSONWriter:
+    """Thread-safe line-per-record JSON writer that flushes every record."""
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+
+from modules.traversal import DirListing, FileEntry
+
+try:
+    from config import SCANNER_CHECKPOINT_DIR, SCANNER_CHECKPOINT_SECONDS
+except ImportError:
+    SCANNER_CHECKPOINT_DIR = os.path.join(
+        os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), "WinOptimizer", "checkpoints"
+    )
+    SCANNER_CHECKPOINT_SECONDS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS listings (
+    seq   INTEGER PRIMARY KEY,
+    path  TEXT NOT NULL,
+    mtime REAL,
+    files TEXT NOT NULL,
+    dirs  TEXT NOT NULL,
+    skipped INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    path  TEXT PRIMARY KEY,
+    mtime REAL
+);
+"""
+
+
+def scan_fingerprint(roots, prune_key=None):
+    """Identifies a traversal: the same roots pruned the same way produce the same listings."""
+    norm = [os.path.normcase(os.path.abspath(r)) for r in roots]
+    return json.dumps({"roots": norm, "prune": prune_key}, sort_keys=True)
+
+
+def default_checkpoint_path(fingerprint):
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(SCANNER_CHECKPOINT_DIR, f"scan_{digest}.sqlite3")
+
+
+class ScanCheckpoint:
+    """Resumable traversal state kept in a small SQLite file.
+
+    Every directory listing the consumer receives is stored with its files,
+    and the frontier (directories discovered but not yet received) is kept
+    alongside. Both are committed together every `interval` seconds, so the
+    file always holds a consistent cut of the walk. Resuming replays the
+    stored listings from the file, without touching the disk being scanned,
+    then walks only the frontier. Analyzers see the same listings either way.
+
+    A checkpoint written for a different fingerprint is discarded.
+    """
+    def __init__(self, path, fingerprint, interval=None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.interval = SCANNER_CHECKPOINT_SECONDS if interval is None else interval
+        self.replayed = 0
+        self.recorded = 0
+        self._last_commit = time.monotonic()
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(listings)")}
+        if "skipped" not in columns:
+            # Checkpoints written before skipped entries were recorded
+            self.conn.execute("ALTER TABLE listings ADD COLUMN skipped INTEGER NOT NULL DEFAULT 0")
+
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            self._reset()
+
+    def _reset(self):
+        cur = self.conn.cursor()
+        cur.execute("DELETE FROM listings")
+        cur.execute("DELETE FROM frontier")
+        cur.execute("DELETE FROM meta")
+        cur.execute("INSERT INTO meta (key, value) VALUES ('fingerprint', ?)", (self.fingerprint,))
+        self.conn.commit()
+
+    @property
+    def started(self):
+        return self.conn.execute("SELECT 1 FROM meta WHERE key = 'started'").fetchone() is not None
+
+    def pending_dirs(self):
+        return self.conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+
+    # ===========================
+    # Walking
+    # ===========================
+    def walk(self, walker, roots):
+        """Yields DirListings like walker.walk(roots), resuming from the stored state."""
+        if self.started:
+            yield from self._replay()
+            frames = self.conn.execute("SELECT path, mtime FROM frontier").fetchall()
+        else:
+            frames = walker.root_frames(roots)
+            self.conn.executemany("INSERT OR REPLACE INTO frontier (path, mtime) VALUES (?, ?)", frames)
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('started', ?)", (str(time.time()),))
+            self.conn.commit()
+
+        try:
+            for listing in walker.walk_frames(frames):
+                self._record(listing)
+                yield listing
+        finally:
+            self.conn.commit()
+
+    def _replay(self):
+        for path, mtime, files, dirs, skipped in self.conn.execute("SELECT path, mtime, files, dirs, skipped FROM listings ORDER BY seq"):
+            listing = DirListing(path, mtime)
+            listing.skipped = skipped
+            listing.files = [
+                FileEntry(os.path.join(path, name), name, size, f_mtime, f_atime, ino, dev)
+                for name, size, f_mtime, f_atime, ino, dev in json.loads(files)
+            ]
+            listing.dirs = [(os.path.join(path, name), d_mtime) for name, d_mtime in json.loads(dirs)]
+            self.replayed += 1
+            yield listing
+
+    def _record(self, listing):
+        """Stores a received listing and moves the frontier past it, committing periodically."""
+        files = json.dumps([[e.name, e.size, e.mtime, e.atime, e.ino, e.dev] for e in listing.files])
+        dirs = json.dumps([[os.path.basename(p), m] for p, m in listing.dirs])
+        cur = self.conn.cursor()
+        cur.execute(
+            "INSERT INTO listings (path, mtime, files, dirs, skipped) VALUES (?, ?, ?, ?, ?)",
+            (listing.path, listing.mtime, files, dirs, listing.skipped)
+        )
+        cur.execute("DELETE FROM frontier WHERE path = ?", (listing.path,))
+        cur.executemany("INSERT OR REPLACE INTO frontier (path, mtime) VALUES (?, ?)", listing.dirs)
+        self.recorded += 1
+
+        now = time.monotonic()
+        if now - self._last_commit >= self.interval:
+            self.conn.commit()
+            self._last_commit = now
+
+    # ===========================
+    # Lifecycle
+    # ===========================
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def discard(self):
+        """Closes and deletes the checkpoint once the scan has completed."""
+        self.conn.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except OSError:
+                pass
@@ -0,0 +1,446 @@
+"""Headless File Scanner engine shared by the Tk tab and the command line.
+
+Usage:
+    python -m modules.scan_engine C:\\Data --mode duplicates --mode large --threshold-mb 500
+    python -m modules.scan_engine D:\\ --mode all --output report.ndjson
+
+This module must not import tkinter, so the command line works without it.
+Results are streamed as NDJSON, one record per line, as soon as they are known.
+"""
+import os
+import sys
+import re
+import time
+import argparse
+import threading
+
+from modules.traversal import TreeWalker
+from modules.file_index import FileIndex, IndexedTreeWalker
+from modules.scan_rules import ScanRules, SCANNER_EXCLUDE_DIRS
+from modules.scan_checkpoint import ScanCheckpoint, scan_fingerprint, default_checkpoint_path
+from modules.throttle import Throttle
+from modules.volumes import VolumeScheduler
+from modules.hardlinks import LINK_MODES, LinkReplacer, plan_links, undo_links
+from modules.analyzers import (
+    DuplicateAnalyzer, DuplicateDirsAnalyzer, ChunkingAnalyzer, LargeFileAnalyzer, CompressibilityAnalyzer, ColdDataAnalyzer, ExtensionStatsAnalyzer, EmptyItemsAnalyzer, DirSizeAnalyzer,
+    run_analysis
+)
+from modules.compressibility import METHODS as COMPRESS_METHODS
+from modules.ndjson import NDJSONWriter
+
+try:
+    from config import SCANNER_WALK_WORKERS, SCANNER_LARGE_THRESHOLD_MB, SCANNER_TOP_K, SCANNER_CHUNK_MIN_FILE_MB, SCANNER_CHUNK_MAX_TOTAL_GB, SCANNER_COMPRESS_METHOD, SCANNER_COLD_DAYS
+except ImportError:
+    SCANNER_COLD_DAYS = 365
+    SCANNER_COMPRESS_METHOD = "zlib"
+    SCANNER_WALK_WORKERS = 4
+    SCANNER_LARGE_THRESHOLD_MB = 100
+    SCANNER_TOP_K = 100
+    SCANNER_CHUNK_MIN_FILE_MB = 64
+    SCANNER_CHUNK_MAX_TOTAL_GB = 16
+
+MODES = ("duplicates", "dup_dirs", "chunks", "large", "compress", "cold", "extensions", "empty", "dirs")
+
+
+def default_options(**overrides):
+    """Scan options shared by every front end; unknown keys are rejected."""
+    options = {
+        "modes": ["duplicates"],
+        "extensions": None,
+        "threshold_bytes": SCANNER_LARGE_THRESHOLD_MB * 1024 * 1024,
+        "top_k": SCANNER_TOP_K,
+        "workers": SCANNER_WALK_WORKERS,
+        "use_index": False,
+        "index_path": None,
+        "verify": False,
+        "chunk_min_bytes": SCANNER_CHUNK_MIN_FILE_MB * 1024 * 1024,
+        "chunk_max_total_bytes": int(SCANNER_CHUNK_MAX_TOTAL_GB * 1024 ** 3),
+        "compress_method": SCANNER_COMPRESS_METHOD,
+        "cold_days": SCANNER_COLD_DAYS,
+        "exclude_extensions": None,
+        "include": None,
+        "exclude": None,
+        "include_regex": None,
+        "exclude_regex": None,
+        "exclude_dirs": list(SCANNER_EXCLUDE_DIRS),
+        "min_size": None,
+        "max_size": None,
+        "min_age_days": None,
+        "max_age_days": None,
+        "resume": False,
+        "checkpoint_path": None,
+        "throttle": False,
+        "throttle_bytes_per_sec": None,
+        "throttle_entries_per_sec": None,
+        "parallel_devices": True,
+    }
+    for key, value in overrides.items():
+        if key not in options:
+            raise KeyError(f"Unknown scan option: {key}")
+        options[key] = value
+    return options
+
+
+def parse_extensions(text):
+    """Turns 'mp4, .JPG,pdf' into ['.mp4', '.jpg', '.pdf'] (None when empty)."""
+    if not text:
+        return None
+    exts = [f".{e.strip().lstrip('.').lower()}" for e in text.split(',') if e.strip().lstrip('.')]
+    return exts or None
+
+
+def build_rules(options):
+    """Compiles the include/exclude options into ScanRules."""
+    return ScanRules(
+        include_ext=options["extensions"],
+        exclude_ext=options["exclude_extensions"],
+        include=options["include"],
+        exclude=options["exclude"],
+        include_regex=options["include_regex"],
+        exclude_regex=options["exclude_regex"],
+        exclude_dirs=options["exclude_dirs"],
+        min_size=options["min_size"],
+        max_size=options["max_size"],
+        min_age_days=options["min_age_days"],
+        max_age_days=options["max_age_days"],
+    )
+
+
+def open_checkpoint(roots, options):
+    """Returns the ScanCheckpoint for a resumable scan, or None when resume is off or unavailable."""
+    if not options["resume"]:
+        return None
+    prune_key = [sorted(options["exclude_dirs"] or []), options["exclude"], options["exclude_regex"]]
+    fingerprint = scan_fingerprint(roots, prune_key)
+    try:
+        return ScanCheckpoint(options["checkpoint_path"] or default_checkpoint_path(fingerprint), fingerprint)
+    except Exception as e:
+        print(f"Scan checkpoint unavailable, scanning without one: {e}", file=sys.stderr)
+        return None
+
+
+def build_throttle(options, should_stop=None):
+    """Returns the low-impact Throttle for options['throttle'], or None."""
+    if not options["throttle"]:
+        return None
+    return Throttle.from_config(
+        should_stop=should_stop,
+        bytes_per_sec=options["throttle_bytes_per_sec"],
+        entries_per_sec=options["throttle_entries_per_sec"],
+    )
+
+
+def open_walker(options, should_stop=None, on_error=None, rules=None, throttle=None):
+    """Returns (walker, index); index is None unless incremental mode is enabled."""
+    workers = options["workers"]
+    prune_dir = rules.prune_dir if rules else None
+    if options["use_index"]:
+        try:
+            index = FileIndex(options["index_path"])
+        except Exception as e:
+            print(f"Scan index unavailable, falling back to a full scan: {e}", file=sys.stderr)
+        else:
+            return IndexedTreeWalker(index, prune_dir=prune_dir, on_error=on_error, should_stop=should_stop, workers=workers, throttle=throttle), index
+    return TreeWalker(prune_dir=prune_dir, on_error=on_error, should_stop=should_stop, workers=workers, throttle=throttle), None
+
+
+def build_analyzers(options, index=None, emit=None, throttle=None):
+    """Creates the analyzers for options['modes'], keyed by mode name."""
+    analyzers = {}
+    modes = options["modes"]
+    if "duplicates" in modes:
+        analyzers["duplicates"] = DuplicateAnalyzer(index=index, verify=options["verify"], throttle=throttle)
+    if "dup_dirs" in modes:
+        # Must come after "duplicates" so the shared groups are final when it finishes
+        analyzers["dup_dirs"] = DuplicateDirsAnalyzer(duplicates=analyzers.get("duplicates"), index=index, verify=options["verify"], throttle=throttle)
+    if "chunks" in modes:
+        analyzers["chunks"] = ChunkingAnalyzer(min_file_size=options["chunk_min_bytes"], max_bytes=options["chunk_max_total_bytes"], throttle=throttle)
+    if "large" in modes:
+        analyzers["large"] = LargeFileAnalyzer(k=options["top_k"], threshold=options["threshold_bytes"])
+    if "compress" in modes:
+        # Must come after "large" so it estimates the final top-K
+        analyzers["compress"] = CompressibilityAnalyzer(
+            large=analyzers.get("large"), k=options["top_k"], threshold=options["threshold_bytes"],
+            method=options["compress_method"], throttle=throttle
+        )
+    if "cold" in modes:
+        analyzers["cold"] = ColdDataAnalyzer(cold_days=options["cold_days"])
+    if "extensions" in modes:
+        analyzers["extensions"] = ExtensionStatsAnalyzer()
+    if "empty" in modes:
+        analyzers["empty"] = EmptyItemsAnalyzer()
+    if "dirs" in modes:
+        analyzers["dirs"] = DirSizeAnalyzer()
+    for analyzer in analyzers.values():
+        analyzer.emit = emit
+    return analyzers
+
+
+class ScanJob:
+    """One traversal over roots feeding every analyzer requested in options.
+
+    The walker, the optional index and the analyzers are created up front so
+    a front end can reach into them (e.g. the live top-K) before run().
+    With options['resume'], progress is checkpointed; a stopped or crashed
+    scan continues from there next time and the checkpoint is deleted once
+    a scan completes. With options['throttle'] the walk and every content
+    read share one low-impact Throttle. With options['parallel_devices']
+    roots on different disks are walked at the same time (VolumeScheduler).
+    """
+    def __init__(self, roots, options, emit=None, should_stop=None, progress=None, on_error=None):
+        self.roots = [roots] if isinstance(roots, str) else list(roots)
+        self.options = options
+        self.should_stop = should_stop or (lambda: False)
+        self.progress = progress
+        self.rules = build_rules(options)
+        self.throttle = build_throttle(options, should_stop=self.should_stop)
+        self.walker, self.index = open_walker(options, should_stop=self.should_stop, on_error=on_error, rules=self.rules, throttle=self.throttle)
+        self.analyzers = build_analyzers(options, index=self.index, emit=emit, throttle=self.throttle)
+        self.scheduler = VolumeScheduler(self.walker, self.roots) if options["parallel_devices"] else None
+        self.checkpoint = open_checkpoint(self.roots, options)
+        self.resumed = bool(self.checkpoint and self.checkpoint.started)
+        self.scanned = 0
+
+    def run(self):
+        """Runs the scan and returns the number of files seen. The index is closed afterwards."""
+        completed = False
+        try:
+            self.scanned = run_analysis(
+                self.scheduler or self.walker, self.roots, list(self.analyzers.values()),
+                should_stop=self.should_stop, progress=self.progress, rules=self.rules, checkpoint=self.checkpoint
+            )
+            completed = not self.should_stop()
+        finally:
+            if self.index:
+                self.index.close()
+            if self.checkpoint:
+                if completed:
+                    self.checkpoint.discard()
+                else:
+                    self.checkpoint.close()
+        return self.scanned
+
+
+def run_scan(roots, options, emit=None, should_stop=None, progress=None, on_error=None):
+    """Convenience wrapper returning (analyzers, scanned_file_count)."""
+    job = ScanJob(roots, options, emit=emit, should_stop=should_stop, progress=progress, on_error=on_error)
+    job.run()
+    return job.analyzers, job.scanned
+
+
+# ===========================
+# Command Line
+# ===========================
+def watch_changes(job, emit, on_error=None):
+    """Applies filesystem changes to a finished job's results until interrupted, emitting 'update' records."""
+    from modules.live_results import LiveSession
+
+    def _on_update(live, changed):
+        rows, large_files, matched = live.snapshot()
+        record = {"type": "update", "changed": sorted(changed), "rescan_recommended": live.needs_rescan}
+        if rows is not None:
+            record["duplicate_groups"] = len(live.dup_analyzer.groups)
+            record["duplicates"] = [{"path": d, "original": o, "size": s} for d, o, s in rows]
+        if large_files is not None:
+            record["large_files"] = matched
+            record["largest"] = [{"path": p, "size": s} for p, s in large_files]
+        emit(record)
+
+    session = LiveSession(job, _on_update, on_error=on_error).start()
+    emit({"type": "watching", "roots": job.roots, "backend": session.backend})
+    try:
+        while session.watcher.running:
+            time.sleep(1.0)
+    finally:
+        session.stop()
+
+
+def link_duplicates(groups, mode, emit, dry_run=False, should_stop=None):
+    """Plans (and unless dry_run, performs) replacing duplicate copies with links, emitting records."""
+    plan = plan_links(groups)
+    for path, reason in plan.skipped:
+        emit({"type": "link_skipped", "path": path, "reason": reason})
+    if dry_run:
+        for action in plan.actions:
+            emit({"type": "link_planned", **action.to_dict()})
+        emit({"type": "link_summary", "dry_run": True, "files": len(plan.actions), "reclaimable": plan.reclaimable})
+        return
+
+    def _on_result(action, used, error):
+        if error:
+            emit({"type": "link_failed", "path": action.target, "error": error})
+        else:
+            emit({"type": "linked", **action.to_dict(), "mode": used})
+
+    replacer = LinkReplacer(mode=mode, should_stop=should_stop, on_result=_on_result).run(plan)
+    emit({"type": "link_summary", "dry_run": False, "files": replacer.replaced, "reclaimed": replacer.reclaimed,
+          "failed": len(replacer.failed), "journal": replacer.journal_path if replacer.replaced else None})
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="python -m modules.scan_engine", description="Headless WinOptimizer File Scanner (NDJSON output).")
+    parser.add_argument("roots", nargs="*", help="Folders to scan")
+    parser.add_argument("--mode", action="append", choices=MODES + ("all",), help="Analyzer to run (repeatable, default: duplicates)")
+    parser.add_argument("--ext", default="", help="Only include these extensions, e.g. '.mp4, jpg'")
+    parser.add_argument("--exclude-ext", default="", help="Skip these extensions, e.g. '.tmp, log'")
+    parser.add_argument("--include", action="append", metavar="GLOB", help="Only include matching files (repeatable)")
+    parser.add_argument("--exclude", action="append", metavar="GLOB", help="Skip matching files and folders (repeatable)")
+    parser.add_argument("--include-regex", action="append", metavar="REGEX", help="Only include files whose path matches (repeatable)")
+    parser.add_argument("--exclude-regex", action="append", metavar="REGEX", help="Skip files and folders whose path matches (repeatable)")
+    parser.add_argument("--exclude-dir", action="append", metavar="NAME", help="Extra folder name to prune (repeatable)")
+    parser.add_argument("--no-default-excludes", action="store_true", help=f"Do not prune {', '.join(SCANNER_EXCLUDE_DIRS)}")
+    parser.add_argument("--min-size-mb", type=float, default=None, help="Skip files smaller than this")
+    parser.add_argument("--max-size-mb", type=float, default=None, help="Skip files larger than this")
+    parser.add_argument("--min-age-days", type=float, default=None, help="Skip files modified more recently")
+    parser.add_argument("--max-age-days", type=float, default=None, help="Skip files not modified within this many days")
+    parser.add_argument("--threshold-mb", type=float, default=SCANNER_LARGE_THRESHOLD_MB, help="Minimum size for large files")
+    parser.add_argument("--top", type=int, default=SCANNER_TOP_K, help="Number of largest files kept in the summary")
+    parser.add_argument("--chunk-min-mb", type=float, default=SCANNER_CHUNK_MIN_FILE_MB, help="Minimum file size for the chunks mode")
+    parser.add_argument("--chunk-max-gb", type=float, default=SCANNER_CHUNK_MAX_TOTAL_GB, help="Total size of the files read by the chunks mode")
+    parser.add_argument("--compress-method", choices=COMPRESS_METHODS, default=SCANNER_COMPRESS_METHOD, help="Codec for the compress mode estimate")
+    parser.add_argument("--cold-days", type=int, default=SCANNER_COLD_DAYS, help="Age after which unused files count as cold (cold mode)")
+    parser.add_argument("--workers", type=int, default=SCANNER_WALK_WORKERS, help="Directory listing threads")
+    parser.add_argument("--incremental", action="store_true", help="Reuse the persistent scan index")
+    parser.add_argument("--index", default=None, help="Path of the scan index database")
+    parser.add_argument("--verify", action="store_true", help="Byte-verify duplicate groups")
+    parser.add_argument("--resume", action="store_true", help="Checkpoint progress and continue an interrupted scan of the same roots")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file for --resume (default: one per set of roots)")
+    parser.add_argument("--throttle", action="store_true", help="Low-impact mode: rate-limited, background priority, pauses while the system is busy")
+    parser.add_argument("--max-mb-per-sec", type=float, default=None, help="Content read limit for --throttle")
+    parser.add_argument("--max-entries-per-sec", type=int, default=None, help="Directory entry limit for --throttle")
+    parser.add_argument("--serial-devices", action="store_true", help="Walk roots one after another even when they are on different disks")
+    parser.add_argument("--link-duplicates", choices=LINK_MODES, default=None, help="After the scan, replace duplicate copies with hard links or reflinks")
+    parser.add_argument("--dry-run", action="store_true", help="With --link-duplicates, only report what would be linked")
+    parser.add_argument("--undo-links", metavar="JOURNAL", default=None, help="Turn the links recorded in a journal back into separate copies, then exit")
+    parser.add_argument("--watch", action="store_true", help="Keep running and stream 'update' records as files change (Ctrl+C to quit)")
+    parser.add_argument("--output", "-o", default="-", help="NDJSON output file (default: stdout)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    if args.undo_links:
+        emit = NDJSONWriter(sys.stdout)
+        try:
+            restored, skipped = undo_links(args.undo_links, on_error=lambda path, e: emit({"type": "error", "path": path, "error": str(e)}))
+        except OSError as e:
+            print(f"Cannot undo {args.undo_links}: {e}", file=sys.stderr)
+            return 2
+        emit({"type": "undo_summary", "journal": args.undo_links, "restored": restored, "skipped": skipped})
+        return 0
+    if not args.roots:
+        parser.error("at least one folder to scan is required")
+
+    modes = args.mode or ["duplicates"]
+    if "all" in modes:
+        modes = list(MODES)
+    if args.link_duplicates and "duplicates" not in modes:
+        modes = ["duplicates"] + modes
+
+    exclude_dirs = [] if args.no_default_excludes else list(SCANNER_EXCLUDE_DIRS)
+    exclude_dirs += args.exclude_dir or []
+    to_bytes = lambda mb: int(mb * 1024 * 1024) if mb is not None else None
+
+    options = default_options(
+        modes=modes,
+        extensions=parse_extensions(args.ext),
+        exclude_extensions=parse_extensions(args.exclude_ext),
+        include=args.include,
+        exclude=args.exclude,
+        include_regex=args.include_regex,
+        exclude_regex=args.exclude_regex,
+        exclude_dirs=exclude_dirs,
+        min_size=to_bytes(args.min_size_mb),
+        max_size=to_bytes(args.max_size_mb),
+        min_age_days=args.min_age_days,
+        max_age_days=args.max_age_days,
+        threshold_bytes=int(args.threshold_mb * 1024 * 1024),
+        top_k=max(1, args.top),
+        chunk_min_bytes=int(args.chunk_min_mb * 1024 * 1024),
+        chunk_max_total_bytes=int(args.chunk_max_gb * 1024 ** 3),
+        compress_method=args.compress_method,
+        cold_days=max(1, args.cold_days),
+        workers=max(1, args.workers),
+        use_index=args.incremental,
+        index_path=args.index,
+        verify=args.verify,
+        resume=args.resume or bool(args.checkpoint),
+        checkpoint_path=args.checkpoint,
+        throttle=args.throttle or args.max_mb_per_sec is not None or args.max_entries_per_sec is not None,
+        throttle_bytes_per_sec=to_bytes(args.max_mb_per_sec),
+        throttle_entries_per_sec=args.max_entries_per_sec,
+        parallel_devices=not args.serial_devices,
+    )
+
+    for root in args.roots:
+        if not os.path.isdir(root):
+            print(f"Not a directory: {root}", file=sys.stderr)
+            return 2
+
+    try:
+        build_rules(options)
+    except re.error as e:
+        print(f"Invalid regex: {e}", file=sys.stderr)
+        return 2
+
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    emit = NDJSONWriter(stream)
+    started = time.monotonic()
+    errors = [0]
+    errors_lock = threading.Lock()
+
+    def _on_error(path, exc):
+        # Called from the walker's worker threads in a parallel walk
+        with errors_lock:
+            errors[0] += 1
+        emit({"type": "error", "path": path, "error": str(exc)})
+
+    try:
+        job = ScanJob(args.roots, options, emit=emit, on_error=_on_error)
+        start = {"type": "start", "roots": args.roots, "modes": modes}
+        if job.resumed:
+            start["resumed_from"] = job.checkpoint.path
+        emit(start)
+        scanned = job.run()
+        analyzers = job.analyzers
+
+        summary = {"type": "summary", "files": scanned, "errors": errors[0], "seconds": round(time.monotonic() - started, 3)}
+        if job.scheduler:
+            summary["devices"] = job.scheduler.devices
+        if job.throttle:
+            summary["throttle_paused_seconds"] = round(job.throttle.paused_seconds, 1)
+        if "duplicates" in analyzers:
+            summary["duplicate_groups"] = len(analyzers["duplicates"].groups)
+            summary["bytes_hashed"] = analyzers["duplicates"].bytes_read
+        if "dup_dirs" in analyzers:
+            summary["duplicate_dir_groups"] = len(analyzers["dup_dirs"].groups)
+            summary["duplicate_dir_reclaimable"] = analyzers["dup_dirs"].reclaimable
+        if "large" in analyzers:
+            tracker = analyzers["large"].tracker
+            summary["large_files"] = tracker.matched
+            summary["largest"] = [{"path": p, "size": s} for p, s in tracker.snapshot()]
+        if "cold" in analyzers:
+            summary["cold_bytes"] = analyzers["cold"].cold_bytes
+        if "compress" in analyzers and analyzers["compress"].report:
+            summary["compression_reclaimable"] = analyzers["compress"].report.reclaimable
+        emit(summary)
+
+        if args.link_duplicates and not job.should_stop():
+            link_duplicates(analyzers["duplicates"].groups, args.link_duplicates, emit, dry_run=args.dry_run)
+
+        if args.watch and not ({"duplicates", "large"} & set(analyzers)):
+            print("--watch only tracks the duplicates and large modes", file=sys.stderr)
+        elif args.watch:
+            watch_changes(job, emit, _on_error)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
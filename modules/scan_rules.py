@@ -0,0 +1,139 @@
+import os
+import re
+import time
+import fnmatch
+
+try:
+    from config import SCANNER_EXCLUDE_DIRS
+except ImportError:
+    SCANNER_EXCLUDE_DIRS = ["node_modules", ".git", ".svn", ".hg", "__pycache__", "WinSxS"]
+
+# Windows paths compare case-insensitively, POSIX paths do not
+CASE_INSENSITIVE = os.name == "nt"
+
+SECONDS_PER_DAY = 86400
+
+
+def _fold(text):
+    return text.lower() if CASE_INSENSITIVE else text
+
+
+def normalize_extensions(exts):
+    """Turns ['mp4', '.JPG'] into ('.mp4', '.jpg'); None or empty stays None."""
+    if not exts:
+        return None
+    out = tuple(f".{e.strip().lstrip('.').lower()}" for e in exts if e.strip().lstrip('.'))
+    return out or None
+
+
+def _compile_globs(patterns):
+    """Splits globs into (name_regex, path_regex); a pattern containing a separator matches the full path."""
+    by_name, by_path = [], []
+    for pattern in patterns or ():
+        pattern = pattern.replace("/", os.sep) if os.sep != "/" else pattern
+        if os.sep not in pattern:
+            by_name.append(fnmatch.translate(pattern))
+            continue
+        # Relative path globs like 'build/*.obj' match at any depth
+        if not os.path.isabs(pattern) and not pattern.startswith("*"):
+            pattern = "*" + os.sep + pattern
+        by_path.append(fnmatch.translate(pattern))
+    flags = re.IGNORECASE if CASE_INSENSITIVE else 0
+    name_re = re.compile("|".join(by_name), flags) if by_name else None
+    path_re = re.compile("|".join(by_path), flags) if by_path else None
+    return name_re, path_re
+
+
+def _compile_regexes(patterns):
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if CASE_INSENSITIVE else 0
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+class ScanRules:
+    """Compiled include/exclude rules shared by every scan front end.
+
+    Files must match the include extensions and patterns (when given), none of
+    the exclude extensions and patterns, and the size and age limits. Globs
+    without a path separator match the entry name, others the full path
+    (relative ones at any depth); regexes are searched in the full path. Directories whose name is in
+    exclude_dirs, or that match an exclude glob or regex, are pruned before
+    they are listed, so nothing below them is ever read.
+
+    Ages are in days and measured from mtime when the rules are compiled.
+    """
+    def __init__(self, include_ext=None, exclude_ext=None, include=None, exclude=None,
+                 include_regex=None, exclude_regex=None, exclude_dirs=None,
+                 min_size=None, max_size=None, min_age_days=None, max_age_days=None, now=None):
+        self.include_ext = normalize_extensions(include_ext)
+        self.exclude_ext = normalize_extensions(exclude_ext)
+        self.include_name, self.include_path = _compile_globs(include)
+        self.exclude_name, self.exclude_path = _compile_globs(exclude)
+        self.include_re = _compile_regexes(include_regex)
+        self.exclude_re = _compile_regexes(exclude_regex)
+        self.exclude_dirs = frozenset(_fold(d) for d in exclude_dirs or () if d)
+        self.min_size = min_size
+        self.max_size = max_size
+
+        now = time.time() if now is None else now
+        # An entry older than min_age has mtime <= newest_mtime, and so on
+        self.newest_mtime = now - min_age_days * SECONDS_PER_DAY if min_age_days is not None else None
+        self.oldest_mtime = now - max_age_days * SECONDS_PER_DAY if max_age_days is not None else None
+
+        self.has_includes = bool(self.include_name or self.include_path or self.include_re)
+        self.has_excludes = bool(self.exclude_name or self.exclude_path or self.exclude_re)
+        self.filters_files = bool(
+            self.include_ext or self.exclude_ext or self.has_includes or self.has_excludes
+            or min_size is not None or max_size is not None
+            or self.newest_mtime is not None or self.oldest_mtime is not None
+        )
+
+    def _excluded(self, path, name):
+        return bool(
+            (self.exclude_name and self.exclude_name.match(name))
+            or (self.exclude_path and self.exclude_path.match(path))
+            or (self.exclude_re and self.exclude_re.search(path))
+        )
+
+    def prune_dir(self, path, name):
+        """TreeWalker hook: True when the directory and everything below it is skipped."""
+        if _fold(name) in self.exclude_dirs:
+            return True
+        return self.has_excludes and self._excluded(path, name)
+
+    def accepts(self, entry):
+        """True when a FileEntry passes every rule. Cheap checks run first."""
+        size = entry.size
+        if self.min_size is not None and size < self.min_size:
+            return False
+        if self.max_size is not None and size > self.max_size:
+            return False
+        if self.newest_mtime is not None and entry.mtime > self.newest_mtime:
+            return False
+        if self.oldest_mtime is not None and entry.mtime < self.oldest_mtime:
+            return False
+
+        if self.include_ext or self.exclude_ext:
+            lname = entry.name.lower()
+            if self.include_ext and not lname.endswith(self.include_ext):
+                return False
+            if self.exclude_ext and lname.endswith(self.exclude_ext):
+                return False
+
+        path, name = entry.path, entry.name
+        if self.has_includes and not (
+            (self.include_name and self.include_name.match(name))
+            or (self.include_path and self.include_path.match(path))
+            or (self.include_re and self.include_re.search(path))
+        ):
+            return False
+        return not (self.has_excludes and self._excluded(path, name))
+
+    def filter_listing(self, listing):
+        """Drops rejected files from a DirListing in place, counting them in listing.filtered, and returns it."""
+        if self.filters_files:
+            before = len(listing.files)
+            listing.files = [entry for entry in listing.files if self.accepts(entry)]
+            listing.filtered += before - len(listing.files)
+        return listing
@@ -1,399 +1,884 @@
-import os
-import threading
-import subprocess
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-
-def format_size(size_bytes):
-    """Formats raw byte counts into human-readable strings (KB, MB, GB)."""
-    try:
-        size_bytes = int(size_bytes)
-    except (TypeError, ValueError):
-        return "0 B"
-    
-    if size_bytes == 0:
-        return "0 B"
-    
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(units) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    return f"{size_bytes:.2f} {units[i]}"
-
-
-class ScannerModule(tk.Frame):
-    """Unified, single-scroll File Scanner Module (Duplicates & Large Files)."""
-    def __init__(self, parent):
-        super().__init__(parent, bg="#1c1c1c")
-        self.scan_running = False
-
-        # --- Master Single-Scroll Canvas Setup ---
-        self.canvas = tk.Canvas(self, bg="#1c1c1c", highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.inner_frame = tk.Frame(self.canvas, bg="#1c1c1c")
-
-        self.inner_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.window_id = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        
-        # Make inner frame match window width dynamically
-        self.canvas.bind('<Configure>', lambda e: self.canvas.itemconfig(self.window_id, width=e.width))
-        
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
-
-        # Global mousewheel binding for smooth full-page scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
-        # ===========================
-        # Section 1: Duplicate Finder
-        # ===========================
-        dup_container = tk.Frame(self.inner_frame, bg="#222222", bd=1, relief="solid")
-        dup_container.pack(fill="x", padx=20, pady=15)
-
-        tk.Label(
-            dup_container, text="📁 Find Duplicate Files (Name & Size Only)", 
-            font=("Segoe UI", 13, "bold"), fg="#ffffff", bg="#222222"
-        ).pack(anchor="w", padx=20, pady=(15, 10))
-
-        # Path Row
-        path_row = tk.Frame(dup_container, bg="#222222")
-        path_row.pack(fill="x", padx=20, pady=5)
-        
-        self.dup_path_entry = tk.Entry(path_row, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
-        self.dup_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), ipady=6)
-        self.dup_path_entry.insert(0, "Select folder to scan...")
-        self.dup_path_entry.bind("<FocusIn>", lambda e: self.dup_path_entry.delete(0, 'end') if self.dup_path_entry.get() == "Select folder to scan..." else None)
-
-        tk.Button(path_row, text="Browse", width=12, command=lambda: self.browse_folder(self.dup_path_entry), bg="#3B8ED0", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", pady=6).pack(side="right")
-
-        # Extension Filter Row
-        ext_row = tk.Frame(dup_container, bg="#222222")
-        ext_row.pack(fill="x", padx=20, pady=5)
-        
-        tk.Label(ext_row, text="Filter extensions (comma separated):", fg="#b0b0b0", bg="#222222", font=("Segoe UI", 9)).pack(side="left", padx=(0, 10))
-        
-        self.ext_entry = tk.Entry(ext_row, width=30, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
-        self.ext_entry.pack(side="left", ipady=4)
-        self.ext_entry.insert(0, "e.g. .mp4, jpg, .pdf")
-        self.ext_entry.bind("<FocusIn>", lambda e: self.ext_entry.delete(0, 'end') if self.ext_entry.get() == "e.g. .mp4, jpg, .pdf" else None)
-
-        # Control Area
-        ctrl_frame = tk.Frame(dup_container, bg="#222222")
-        ctrl_frame.pack(fill="x", padx=20, pady=10)
-        
-        self.btn_scan_dup = tk.Button(ctrl_frame, text="Scan for Duplicates", command=self.toggle_dup_scan, bg="#3B8ED0", fg="white", font=("Segoe UI", 10, "bold"), bd=0, cursor="hand2", padx=16, pady=6)
-        self.btn_scan_dup.pack(side="left")
-        
-        self.lbl_dup_status = tk.Label(ctrl_frame, text="Ready", fg="#888888", bg="#222222", font=("Segoe UI", 9))
-        self.lbl_dup_status.pack(side="left", padx=15)
-
-        # Results Container
-        self.dup_results_outer = tk.Frame(dup_container, bg="#1c1c1c", bd=1, relief="solid")
-        self.dup_results_outer.pack(fill="x", padx=20, pady=(5, 20))
-        tk.Label(self.dup_results_outer, text=" Found Duplicates ", fg="#888888", bg="#1c1c1c", font=("Segoe UI", 9, "bold")).pack(anchor="w", padx=10, pady=(8, 0))
-        
-        self.dup_results_list = tk.Frame(self.dup_results_outer, bg="#1c1c1c")
-        self.dup_results_list.pack(fill="x", padx=5, pady=5)
-
-        # ===========================
-        # Section 2: Large Files
-        # ===========================
-        large_container = tk.Frame(self.inner_frame, bg="#222222", bd=1, relief="solid")
-        large_container.pack(fill="x", padx=20, pady=(10, 25))
-
-        tk.Label(
-            large_container, text="🗄️ Find Large Files (>100MB)", 
-            font=("Segoe UI", 13, "bold"), fg="#ffffff", bg="#222222"
-        ).pack(anchor="w", padx=20, pady=(15, 10))
-
-        # Path Row
-        large_path_row = tk.Frame(large_container, bg="#222222")
-        large_path_row.pack(fill="x", padx=20, pady=5)
-        
-        self.large_path_entry = tk.Entry(large_path_row, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
-        self.large_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), ipady=6)
-        self.large_path_entry.insert(0, "Select folder to scan...")
-        self.large_path_entry.bind("<FocusIn>", lambda e: self.large_path_entry.delete(0, 'end') if self.large_path_entry.get() == "Select folder to scan..." else None)
-
-        tk.Button(large_path_row, text="Browse", width=12, command=lambda: self.browse_folder(self.large_path_entry), bg="#3B8ED0", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", pady=6).pack(side="right")
-
-        # Control Area
-        l_ctrl_frame = tk.Frame(large_container, bg="#222222")
-        l_ctrl_frame.pack(fill="x", padx=20, pady=10)
-
-        self.btn_scan_large = tk.Button(l_ctrl_frame, text="Scan for Large Files", command=self.toggle_large_scan, bg="#3B8ED0", fg="white", font=("Segoe UI", 10, "bold"), bd=0, cursor="hand2", padx=16, pady=6)
-        self.btn_scan_large.pack(side="left")
-        
-        self.lbl_large_status = tk.Label(l_ctrl_frame, text="Ready", fg="#888888", bg="#222222", font=("Segoe UI", 9))
-        self.lbl_large_status.pack(side="left", padx=15)
-
-        # Results Container
-        self.large_results_outer = tk.Frame(large_container, bg="#1c1c1c", bd=1, relief="solid")
-        self.large_results_outer.pack(fill="x", padx=20, pady=(5, 20))
-        tk.Label(self.large_results_outer, text=" Files > 100MB ", fg="#888888", bg="#1c1c1c", font=("Segoe UI", 9, "bold")).pack(anchor="w", padx=10, pady=(8, 0))
-
-        self.large_results_list = tk.Frame(self.large_results_outer, bg="#1c1c1c")
-        self.large_results_list.pack(fill="x", padx=5, pady=5)
-
-    def _on_mousewheel(self, event):
-        try:
-            if self.winfo_exists():
-                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        except Exception:
-            pass
-
-    def clear_container(self, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
-
-    # ===========================
-    # Helpers
-    # ===========================
-    def browse_folder(self, entry_widget):
-        path = filedialog.askdirectory()
-        if path:
-            entry_widget.delete(0, "end")
-            entry_widget.insert(0, path)
-
-    def open_file_location(self, filepath):
-        try:
-            norm_path = os.path.normpath(filepath)
-            if os.path.exists(norm_path):
-                # Using /select ensures Windows Explorer opens and highlights the target file
-                subprocess.run(f'explorer.exe /select, "{norm_path}"', shell=True)
-            else:
-                messagebox.showerror("Error", f"File not found:\n{norm_path}")
-        except Exception as e:
-            print(f"Error opening location: {e}")
-
-    # ===========================
-    # Duplicate Logic
-    # ===========================
-    def toggle_dup_scan(self):
-        if self.scan_running:
-            self.scan_running = False
-            self.btn_scan_dup.config(text="Stopping...", state="disabled")
-        else:
-            self.start_duplicate_scan()
-
-    def start_duplicate_scan(self):
-        scan_path = self.dup_path_entry.get()
-        if not scan_path or scan_path == "Select folder to scan..." or not os.path.isdir(scan_path):
-            messagebox.showerror("Error", "Invalid directory path.")
-            return
-        
-        ext_filter = self.ext_entry.get().strip()
-        if ext_filter and ext_filter != "e.g. .mp4, jpg, .pdf":
-            extensions = [f".{e.strip().lstrip('.')}" for e in ext_filter.split(',')]
-        else:
-            extensions = None
-        
-        self.scan_running = True
-        self.btn_scan_dup.config(text="Stop Scan", bg="#c42b1c", fg="white")
-        self.lbl_dup_status.config(text="Initializing...", fg="gray")
-        
-        self.clear_container(self.dup_results_list)
-
-        threading.Thread(target=self.scan_duplicates_thread, args=(scan_path, extensions), daemon=True).start()
-
-    def scan_duplicates_thread(self, scan_path, extensions):
-        files_by_name_size = {}
-        duplicates = []
-        scanned_count = 0
-        
-        self.after(0, lambda: self.lbl_dup_status.config(text="Scanning file system..."))
-        
-        for root, _, files in os.walk(scan_path):
-            if not self.scan_running: break
-            
-            for file in files:
-                if extensions:
-                    if not any(file.lower().endswith(ext.lower()) for ext in extensions):
-                        continue
-                
-                full_path = os.path.join(root, file)
-                
-                try:
-                    file_size = os.path.getsize(full_path)
-                    key = (file, file_size)
-                    
-                    if key in files_by_name_size:
-                        files_by_name_size[key].append(full_path)
-                    else:
-                        files_by_name_size[key] = [full_path]
-                        
-                    scanned_count += 1
-                    
-                    if scanned_count % 200 == 0:
-                        self.after(0, lambda c=scanned_count: self.lbl_dup_status.config(text=f"Scanned: {c} files"))
-                        
-                except OSError:
-                    continue
-
-        self.after(0, lambda: self.lbl_dup_status.config(text="Processing duplicates..."))
-        
-        for key, paths in files_by_name_size.items():
-            if not self.scan_running: break
-            
-            if len(paths) > 1:
-                file_size = key[1]
-                original = paths[0]
-                for duplicate in paths[1:]:
-                    duplicates.append((duplicate, original, file_size))
-            
-        status_msg = "Scan stopped." if not self.scan_running else f"Done. Found {len(duplicates)} duplicates."
-        self.finish_dup_scan(duplicates, status_msg)
-
-    def finish_dup_scan(self, duplicates, msg):
-        self.scan_running = False
-        
-        def _update_ui():
-            self.btn_scan_dup.config(text="Scan for Duplicates", bg="#3B8ED0", fg="white", state="normal")
-            self.lbl_dup_status.config(text=msg)
-            
-            if not duplicates: return
-
-            duplicates.sort(key=lambda x: x[2], reverse=True)
-            display_limit = 100
-            
-            self.clear_container(self.dup_results_list)
-
-            if len(duplicates) > display_limit:
-                 tk.Label(
-                     self.dup_results_list, text=f"Showing largest {display_limit} of {len(duplicates)} results...", 
-                     fg="#FFA500", bg="#1c1c1c", font=("Segoe UI", 9, "bold")
-                 ).pack(pady=8, padx=10, anchor="w")
-
-            for i, (dup_file, original_file, size) in enumerate(duplicates):
-                if i >= display_limit: break
-                
-                row = tk.Frame(self.dup_results_list, bg="#2a2a2a", bd=1, relief="solid")
-                row.pack(fill="x", pady=4, padx=5)
-                row.grid_columnconfigure(0, weight=1)
-                row.grid_columnconfigure(1, weight=0)
-
-                info_frame = tk.Frame(row, bg="#2a2a2a")
-                info_frame.grid(row=0, column=0, sticky="nsew", padx=12, pady=8)
-                
-                top_line = tk.Frame(info_frame, bg="#2a2a2a")
-                top_line.pack(fill="x", pady=(0, 2))
-                
-                tk.Label(top_line, text=os.path.basename(dup_file), font=("Segoe UI", 10, "bold"), fg="#ffffff", bg="#2a2a2a").pack(side="left")
-                tk.Label(top_line, text=f"({format_size(size)})", font=("Segoe UI", 10, "bold"), fg="#3B8ED0", bg="#2a2a2a").pack(side="left", padx=10)
-
-                tk.Label(info_frame, text=f"Duplicate: {dup_file}", font=("Segoe UI", 9), fg="#cccccc", bg="#2a2a2a", anchor="w").pack(anchor="w", fill="x")
-                tk.Label(info_frame, text=f"Original:  {original_file}", font=("Segoe UI", 9), fg="#888888", bg="#2a2a2a", anchor="w").pack(anchor="w", fill="x")
-                
-                btn_frame = tk.Frame(row, bg="#2a2a2a")
-                btn_frame.grid(row=0, column=1, sticky="e", padx=12, pady=8)
-                
-                tk.Button(btn_frame, text="Open Duplicate", width=14, bg="#383838", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", padx=5, pady=4, command=lambda p=dup_file: self.open_file_location(p)).pack(pady=3)
-                tk.Button(btn_frame, text="Open Original", width=14, bg="#444444", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", padx=5, pady=4, command=lambda p=original_file: self.open_file_location(p)).pack(pady=3)
-
-        self.after(0, _update_ui)
-
-    # ===========================
-    # Large File Logic
-    # ===========================
-    def toggle_large_scan(self):
-        if self.scan_running:
-            self.scan_running = False
-            self.btn_scan_large.config(text="Stopping...", state="disabled")
-        else:
-            self.start_large_scan()
-
-    def start_large_scan(self):
-        scan_path = self.large_path_entry.get()
-        if not scan_path or scan_path == "Select folder to scan..." or not os.path.isdir(scan_path):
-            messagebox.showerror("Error", "Invalid directory path.")
-            return
-            
-        self.scan_running = True
-        self.btn_scan_large.config(text="Stop Scan", bg="#c42b1c", fg="white")
-        self.lbl_large_status.config(text="Scanning...", fg="gray")
-        
-        self.clear_container(self.large_results_list)
-            
-        threading.Thread(target=self.scan_large_files_thread, args=(scan_path,), daemon=True).start()
-
-    def scan_large_files_thread(self, scan_path):
-        large_files = []
-        limit_bytes = 100 * 1024 * 1024 # 100 MB
-        scanned_count = 0
-        
-        for root, _, files in os.walk(scan_path):
-            if not self.scan_running: break
-            
-            for file in files:
-                if not self.scan_running: break
-                
-                fpath = os.path.join(root, file)
-                scanned_count += 1
-                
-                try:
-                    size = os.path.getsize(fpath)
-                    if size > limit_bytes:
-                        large_files.append((fpath, size))
-                except (OSError, PermissionError):
-                    continue
-                
-                if scanned_count % 200 == 0:
-                     self.after(0, lambda c=scanned_count: self.lbl_large_status.config(text=f"Scanned: {c} files"))
-            
-        status_msg = "Scan stopped." if not self.scan_running else f"Done. Found {len(large_files)} large files."
-        self.finish_large_scan(large_files, status_msg)
-
-    def finish_large_scan(self, large_files, msg):
-        self.scan_running = False
-        
-        def _update_ui():
-            self.btn_scan_large.config(text="Scan for Large Files", bg="#3B8ED0", fg="white", state="normal")
-            self.lbl_large_status.config(text=msg)
-            
-            if not large_files: return
-             
-            large_files.sort(key=lambda x: x[1], reverse=True)
-            self.clear_container(self.large_results_list)
-            
-            display_limit = 100
-            if len(large_files) > display_limit:
-                 tk.Label(
-                     self.large_results_list, text=f"Showing largest {display_limit} of {len(large_files)} results...", 
-                     fg="#FFA500", bg="#1c1c1c", font=("Segoe UI", 9, "bold")
-                 ).pack(pady=8, padx=10, anchor="w")
-            
-            for i, (fpath, size) in enumerate(large_files):
-                if i >= display_limit: break
-                
-                row = tk.Frame(self.large_results_list, bg="#2a2a2a", bd=1, relief="solid")
-                row.pack(fill="x", pady=4, padx=5)
-                row.grid_columnconfigure(0, weight=0)
-                row.grid_columnconfigure(1, weight=1)
-                row.grid_columnconfigure(2, weight=0)
-
-                size_lbl = tk.Label(
-                    row, text=format_size(size), width=12, anchor="e", 
-                    font=("Segoe UI", 10, "bold"), fg="#3B8ED0", bg="#2a2a2a"
-                )
-                size_lbl.grid(row=0, column=0, padx=12, pady=10, sticky="w")
-                
-                name_lbl = tk.Label(row, text=fpath, anchor="w", fg="#ffffff", bg="#2a2a2a", font=("Segoe UI", 9))
-                name_lbl.grid(row=0, column=1, padx=5, sticky="ew")
-
-                btn = tk.Button(
-                    row, text="Open Location", width=14, height=1, 
-                    bg="#383838", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", padx=5, pady=4,
-                    command=lambda p=fpath: self.open_file_location(p)
-                )
-                btn.grid(row=0, column=2, padx=12, pady=8, sticky="e")
-
-        self.after(0, _update_ui)
-
-# Compatibility alias for main.py dynamic routing
-FileScannerTab = ScannerModule
\ No newline at end of file
+import os
+import time
+import threading
+import subprocess
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from modules.live_results import LiveSession
+from modules.hardlinks import LinkReplacer, plan_links, undo_links, latest_journal
+from modules.scan_engine import (
+    ScanJob, default_options, parse_extensions,
+    SCANNER_EXCLUDE_DIRS, SCANNER_WALK_WORKERS, SCANNER_LARGE_THRESHOLD_MB, SCANNER_TOP_K
+)
+
+# Minimum delay between live redraws of scan results
+LIVE_REFRESH_SECONDS = 1.0
+
+# Full analysis checkboxes mapped to scan engine modes
+COMBO_MODES = [("dup", "duplicates"), ("dupdirs", "dup_dirs"), ("chunks", "chunks"), ("large", "large"), ("cold", "cold"), ("ext", "extensions"), ("empty", "empty"), ("dirs", "dirs")]
+
+def format_size(size_bytes):
+    """Formats raw byte counts into human-readable strings (KB, MB, GB)."""
+    try:
+        size_bytes = int(size_bytes)
+    except (TypeError, ValueError):
+        return "0 B"
+    
+    if size_bytes == 0:
+        return "0 B"
+    
+    units = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    while size_bytes >= 1024 and i < len(units) - 1:
+        size_bytes /= 1024.0
+        i += 1
+    return f"{size_bytes:.2f} {units[i]}"
+
+
+class ScannerModule(tk.Frame):
+    """Unified, single-scroll File Scanner Module (Duplicates & Large Files)."""
+    def __init__(self, parent):
+        super().__init__(parent, bg="#1c1c1c")
+        self.scan_running = False
+        self.active_scan = None
+        self.use_index = tk.BooleanVar(value=False)
+        self.resumable = tk.BooleanVar(value=False)
+        self.low_impact = tk.BooleanVar(value=False)
+        self.watch_changes = tk.BooleanVar(value=False)
+        self.watch_changes.trace_add("write", lambda *_: None if self.watch_changes.get() else self.stop_watch())
+        self.live_session = None
+        self.dup_groups = []
+        self.watch_token = None
+        self.verify_bytes = tk.BooleanVar(value=False)
+        self.walk_workers = tk.StringVar(value=str(SCANNER_WALK_WORKERS))
+        self.skip_dirs = tk.StringVar(value=", ".join(SCANNER_EXCLUDE_DIRS))
+
+        # --- Master Single-Scroll Canvas Setup ---
+        self.canvas = tk.Canvas(self, bg="#1c1c1c", highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.inner_frame = tk.Frame(self.canvas, bg="#1c1c1c")
+
+        self.inner_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+        
+        self.window_id = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        
+        # Make inner frame match window width dynamically
+        self.canvas.bind('<Configure>', lambda e: self.canvas.itemconfig(self.window_id, width=e.width))
+        
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Global mousewheel binding for smooth full-page scrolling
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+
+        # ===========================
+        # Shared Scan Options
+        # ===========================
+        opts_row = tk.Frame(self.inner_frame, bg="#1c1c1c")
+        opts_row.pack(fill="x", padx=20, pady=(15, 0))
+
+        tk.Checkbutton(opts_row, text="Incremental (reuse index)", variable=self.use_index, font=("Segoe UI", 9), fg="#b0b0b0", bg="#1c1c1c", selectcolor="#111111", activebackground="#1c1c1c", activeforeground="#ffffff").pack(side="left")
+        tk.Checkbutton(opts_row, text="Resumable (checkpoint)", variable=self.resumable, font=("Segoe UI", 9), fg="#b0b0b0", bg="#1c1c1c", selectcolor="#111111", activebackground="#1c1c1c", activeforeground="#ffffff").pack(side="left", padx=(15, 0))
+        tk.Checkbutton(opts_row, text="Low impact", variable=self.low_impact, font=("Segoe UI", 9), fg="#b0b0b0", bg="#1c1c1c", selectcolor="#111111", activebackground="#1c1c1c", activeforeground="#ffffff").pack(side="left", padx=(15, 0))
+        tk.Checkbutton(opts_row, text="Watch for changes", variable=self.watch_changes, font=("Segoe UI", 9), fg="#b0b0b0", bg="#1c1c1c", selectcolor="#111111", activebackground="#1c1c1c", activeforeground="#ffffff").pack(side="left", padx=(15, 0))
+
+        tk.Label(opts_row, text="Traversal threads:", fg="#b0b0b0", bg="#1c1c1c", font=("Segoe UI", 9)).pack(side="left", padx=(20, 6))
+        tk.Spinbox(opts_row, from_=1, to=32, width=4, textvariable=self.walk_workers, bg="#111111", fg="#ffffff", buttonbackground="#333333", insertbackground="white", font=("Segoe UI", 9), bd=1, relief="solid").pack(side="left")
+
+        tk.Label(opts_row, text="Skip folders:", fg="#b0b0b0", bg="#1c1c1c", font=("Segoe UI", 9)).pack(side="left", padx=(20, 6))
+        tk.Entry(opts_row, textvariable=self.skip_dirs, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 9), bd=1, relief="solid").pack(side="left", fill="x", expand=True, ipady=2)
+
+        # ===========================
+        # Section 1: Duplicate Finder
+        # ===========================
+        dup_container = tk.Frame(self.inner_frame, bg="#222222", bd=1, relief="solid")
+        dup_container.pack(fill="x", padx=20, pady=15)
+
+        tk.Label(
+            dup_container, text="📁 Find Duplicate Files (Content Verified)", 
+            font=("Segoe UI", 13, "bold"), fg="#ffffff", bg="#222222"
+        ).pack(anchor="w", padx=20, pady=(15, 10))
+
+        # Path Row
+        path_row = tk.Frame(dup_container, bg="#222222")
+        path_row.pack(fill="x", padx=20, pady=5)
+        
+        self.dup_path_entry = tk.Entry(path_row, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
+        self.dup_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), ipady=6)
+        self.dup_path_entry.insert(0, "Select folder to scan...")
+        self.dup_path_entry.bind("<FocusIn>", lambda e: self.dup_path_entry.delete(0, 'end') if self.dup_path_entry.get() == "Select folder to scan..." else None)
+
+        tk.Button(path_row, text="Browse", width=12, command=lambda: self.browse_folder(self.dup_path_entry), bg="#3B8ED0", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", pady=6).pack(side="right")
+
+        # Extension Filter Row
+        ext_row = tk.Frame(dup_container, bg="#222222")
+        ext_row.pack(fill="x", padx=20, pady=5)
+        
+        tk.Label(ext_row, text="Filter extensions (comma separated):", fg="#b0b0b0", bg="#222222", font=("Segoe UI", 9)).pack(side="left", padx=(0, 10))
+        
+        self.ext_entry = tk.Entry(ext_row, width=30, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
+        self.ext_entry.pack(side="left", ipady=4)
+        self.ext_entry.insert(0, "e.g. .mp4, jpg, .pdf")
+        self.ext_entry.bind("<FocusIn>", lambda e: self.ext_entry.delete(0, 'end') if self.ext_entry.get() == "e.g. .mp4, jpg, .pdf" else None)
+
+        tk.Checkbutton(ext_row, text="Byte-verify matches (slower, certain)", variable=self.verify_bytes, font=("Segoe UI", 9), fg="#b0b0b0", bg="#222222", selectcolor="#111111", activebackground="#222222", activeforeground="#ffffff").pack(side="left", padx=(20, 0))
+
+        # Control Area
+        ctrl_frame = tk.Frame(dup_container, bg="#222222")
+        ctrl_frame.pack(fill="x", padx=20, pady=10)
+        
+        self.btn_scan_dup = tk.Button(ctrl_frame, text="Scan for Duplicates", command=self.toggle_dup_scan, bg="#3B8ED0", fg="white", font=("Segoe UI", 10, "bold"), bd=0, cursor="hand2", padx=16, pady=6)
+        self.btn_scan_dup.pack(side="left")
+        
+        self.lbl_dup_status = tk.Label(ctrl_frame, text="Ready", fg="#888888", bg="#222222", font=("Segoe UI", 9))
+        self.lbl_dup_status.pack(side="left", padx=15)
+
+        tk.Button(ctrl_frame, text="Undo Last Linking", command=self.undo_last_links, bg="#383838", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", padx=12, pady=6).pack(side="right")
+        tk.Button(ctrl_frame, text="Replace with Hard Links", command=self.link_duplicates, bg="#383838", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", padx=12, pady=6).pack(side="right", padx=(0, 8))
+
+        # Results Container
+        self.dup_results_outer = tk.Frame(dup_container, bg="#1c1c1c", bd=1, relief="solid")
+        self.dup_results_outer.pack(fill="x", padx=20, pady=(5, 20))
+        tk.Label(self.dup_results_outer, text=" Found Duplicates ", fg="#888888", bg="#1c1c1c", font=("Segoe UI", 9, "bold")).pack(anchor="w", padx=10, pady=(8, 0))
+        
+        self.dup_results_list = tk.Frame(self.dup_results_outer, bg="#1c1c1c")
+        self.dup_results_list.pack(fill="x", padx=5, pady=5)
+
+        # ===========================
+        # Section 2: Large Files
+        # ===========================
+        large_container = tk.Frame(self.inner_frame, bg="#222222", bd=1, relief="solid")
+        large_container.pack(fill="x", padx=20, pady=(10, 25))
+
+        tk.Label(
+            large_container, text="🗄️ Find Large Files", 
+            font=("Segoe UI", 13, "bold"), fg="#ffffff", bg="#222222"
+        ).pack(anchor="w", padx=20, pady=(15, 10))
+
+        # Path Row
+        large_path_row = tk.Frame(large_container, bg="#222222")
+        large_path_row.pack(fill="x", padx=20, pady=5)
+        
+        self.large_path_entry = tk.Entry(large_path_row, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
+        self.large_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), ipady=6)
+        self.large_path_entry.insert(0, "Select folder to scan...")
+        self.large_path_entry.bind("<FocusIn>", lambda e: self.large_path_entry.delete(0, 'end') if self.large_path_entry.get() == "Select folder to scan..." else None)
+
+        tk.Button(large_path_row, text="Browse", width=12, command=lambda: self.browse_folder(self.large_path_entry), bg="#3B8ED0", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", pady=6).pack(side="right")
+
+        # Threshold & Top-K Row
+        limit_row = tk.Frame(large_container, bg="#222222")
+        limit_row.pack(fill="x", padx=20, pady=5)
+
+        tk.Label(limit_row, text="Minimum size (MB):", fg="#b0b0b0", bg="#222222", font=("Segoe UI", 9)).pack(side="left", padx=(0, 10))
+        self.large_threshold_entry = tk.Entry(limit_row, width=8, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
+        self.large_threshold_entry.pack(side="left", ipady=4)
+        self.large_threshold_entry.insert(0, str(SCANNER_LARGE_THRESHOLD_MB))
+
+        tk.Label(limit_row, text="Show top:", fg="#b0b0b0", bg="#222222", font=("Segoe UI", 9)).pack(side="left", padx=(20, 10))
+        self.large_topk_entry = tk.Entry(limit_row, width=6, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
+        self.large_topk_entry.pack(side="left", ipady=4)
+        self.large_topk_entry.insert(0, str(SCANNER_TOP_K))
+
+        self.estimate_compression = tk.BooleanVar(value=False)
+        tk.Checkbutton(limit_row, text="Estimate compression savings", variable=self.estimate_compression, font=("Segoe UI", 9), fg="#b0b0b0", bg="#222222", selectcolor="#111111", activebackground="#222222", activeforeground="#ffffff").pack(side="left", padx=(20, 0))
+
+        # Control Area
+        l_ctrl_frame = tk.Frame(large_container, bg="#222222")
+        l_ctrl_frame.pack(fill="x", padx=20, pady=10)
+
+        self.btn_scan_large = tk.Button(l_ctrl_frame, text="Scan for Large Files", command=self.toggle_large_scan, bg="#3B8ED0", fg="white", font=("Segoe UI", 10, "bold"), bd=0, cursor="hand2", padx=16, pady=6)
+        self.btn_scan_large.pack(side="left")
+        
+        self.lbl_large_status = tk.Label(l_ctrl_frame, text="Ready", fg="#888888", bg="#222222", font=("Segoe UI", 9))
+        self.lbl_large_status.pack(side="left", padx=15)
+
+        # Results Container
+        self.large_results_outer = tk.Frame(large_container, bg="#1c1c1c", bd=1, relief="solid")
+        self.large_results_outer.pack(fill="x", padx=20, pady=(5, 20))
+        self.lbl_large_results = tk.Label(self.large_results_outer, text=f" Files > {SCANNER_LARGE_THRESHOLD_MB}MB ", fg="#888888", bg="#1c1c1c", font=("Segoe UI", 9, "bold"))
+        self.lbl_large_results.pack(anchor="w", padx=10, pady=(8, 0))
+
+        self.large_results_list = tk.Frame(self.large_results_outer, bg="#1c1c1c")
+        self.large_results_list.pack(fill="x", padx=5, pady=5)
+
+        # ===========================
+        # Section 3: Full Analysis (Single Pass)
+        # ===========================
+        combo_container = tk.Frame(self.inner_frame, bg="#222222", bd=1, relief="solid")
+        combo_container.pack(fill="x", padx=20, pady=(0, 25))
+
+        tk.Label(
+            combo_container, text="🧮 Full Analysis (Single Pass)", 
+            font=("Segoe UI", 13, "bold"), fg="#ffffff", bg="#222222"
+        ).pack(anchor="w", padx=20, pady=(15, 2))
+        tk.Label(
+            combo_container, text="Reads the folder once and feeds every selected analyzer. Duplicate and large file results appear in their sections above.", 
+            font=("Segoe UI", 9), fg="#888888", bg="#222222"
+        ).pack(anchor="w", padx=20, pady=(0, 10))
+
+        # Path Row
+        combo_path_row = tk.Frame(combo_container, bg="#222222")
+        combo_path_row.pack(fill="x", padx=20, pady=5)
+
+        self.combo_path_entry = tk.Entry(combo_path_row, bg="#111111", fg="#ffffff", insertbackground="white", font=("Segoe UI", 10), bd=1, relief="solid")
+        self.combo_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), ipady=6)
+        self.combo_path_entry.insert(0, "Select folder to scan...")
+        self.combo_path_entry.bind("<FocusIn>", lambda e: self.combo_path_entry.delete(0, 'end') if self.combo_path_entry.get() == "Select folder to scan..." else None)
+
+        tk.Button(combo_path_row, text="Browse", width=12, command=lambda: self.browse_folder(self.combo_path_entry), bg="#3B8ED0", fg="white", font=("Segoe UI", 9, "bold"), bd=0, cursor="hand2", pady=6).pack(side="right")
+
+        # Analyzer Selection Row
+        combo_opts_row = tk.Frame(combo_container, bg="#222222")
+        combo_opts_row.pack(fill="x", padx=20, pady=5)
+
+        self.combo_vars = {}
+        for key, label in [("dup", "Duplicates"), ("dupdirs", "Duplicate folders"), ("chunks", "Shared chunks"), ("large", "Large files"), ("cold", "Cold data"), ("ext", "Extension breakdown"), ("empty", "Empty files & folders"), ("dirs", "Folder sizes")]:
+            # Chunking reads every large file in full, so it is opt-in
+            var = tk.BooleanVar(value=key != "chunks")
+            self.combo_vars[key] = var
+            tk.Checkbutton(combo_opts_row, text=label, variable=var, font=("Segoe UI", 9), fg="#b0b0b0", bg="#222222", selectcolor="#111111", activebackground="#222222", activeforeground="#ffffff").pack(side="left", padx=(0, 12))
+
+        # Control Area
+        c_ctrl_frame = tk.Frame(combo_container, bg="#222222")
+        c_ctrl_frame.pack(fill="x", padx=20, pady=10)
+
+        self.btn_scan_combo = tk.Button(c_ctrl_frame, text="Run Full Analysis", command=self.toggle_combo_scan, bg="#3B8ED0", fg="white", font=("Segoe UI", 10, "bold"), bd=0, cursor="hand2", padx=16, pady=6)
+        self.btn_scan_combo.pack(side="left")
+
+        self.lbl_combo_status = tk.Label(c_ctrl_frame, text="Ready", fg="#888888", bg="#222222", font=("Segoe UI", 9))
+        self.lbl_combo_status.pack(side="left", padx=15)
+
+        # Report Area
+        self.combo_report = tk.Text(combo_container, height=16, bg="#0B0B0E", fg="#cccccc", font=("Consolas", 9), bd=1, relief="flat", insertbackground="white")
+        self.combo_report.pack(fill="x", padx=20, pady=(5, 10))
+        self.combo_report.configure(state="disabled")
+
+        # Folder Size Drill-Down
+        self.dir_tree = None
+        self.dir_node = None
+
+        tree_outer = tk.Frame(combo_container, bg="#1c1c1c", bd=1, relief="solid")
+        tree_outer.pack(fill="x", padx=20, pady=(5, 20))
+
+        tree_nav = tk.Frame(tree_outer, bg="#1c1c1c")
+        tree_nav.pack(fill="x", padx=10, pady=(8, 0))
+        tk.Button(tree_nav, text="⬆ Up", width=6, command=self.dir_tree_up, bg="#383838", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", pady=3).pack(side="left")
+        self.lbl_dir_path = tk.Label(tree_nav, text=" Folder Sizes (run a full analysis with 'Folder sizes') ", fg="#888888", bg="#1c1c1c", font=("Segoe UI", 9, "bold"), anchor="w")
+        self.lbl_dir_path.pack(side="left", padx=10, fill="x", expand=True)
+
+        self.dir_results_list = tk.Frame(tree_outer, bg="#1c1c1c")
+        self.dir_results_list.pack(fill="x", padx=5, pady=5)
+
+    def _on_mousewheel(self, event):
+        try:
+            if self.winfo_exists():
+                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        except Exception:
+            pass
+
+    def clear_container(self, frame):
+        for widget in frame.winfo_children():
+            widget.destroy()
+
+    # ===========================
+    # Helpers
+    # ===========================
+    def browse_folder(self, entry_widget):
+        path = filedialog.askdirectory()
+        if path:
+            entry_widget.delete(0, "end")
+            entry_widget.insert(0, path)
+
+    def get_scan_options(self, **overrides):
+        """Reads the shared option widgets on the UI thread for a worker thread."""
+        try:
+            workers = max(1, int(self.walk_workers.get()))
+        except ValueError:
+            workers = SCANNER_WALK_WORKERS
+        skip_dirs = [d.strip() for d in self.skip_dirs.get().split(',') if d.strip()]
+        return default_options(use_index=self.use_index.get(), workers=workers, verify=self.verify_bytes.get(), exclude_dirs=skip_dirs, resume=self.resumable.get(), throttle=self.low_impact.get(), **overrides)
+
+    def stop_scan(self, kind, button):
+        """Stops the running scan, but only from the section that started it."""
+        if self.active_scan != kind:
+            messagebox.showinfo("Scan Running", "Another scan is already running. Stop it first.")
+            return
+        self.scan_running = False
+        button.config(text="Stopping...", state="disabled")
+
+    def read_large_limits(self):
+        """Returns (threshold_mb, top_k) from the large file inputs, or None if invalid."""
+        try:
+            threshold_mb = float(self.large_threshold_entry.get())
+            top_k = int(self.large_topk_entry.get())
+            if threshold_mb < 0 or top_k < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Minimum size must be a number and top count a positive integer.")
+            return None
+        return threshold_mb, top_k
+
+    def make_progress(self, label, resumed=False):
+        """Returns a progress callback that posts traversal and hashing status to label."""
+        def _on_progress(stage, done, total):
+            text = f"{stage}: {done} files" if total is None else f"{stage}: {done}/{total} candidates"
+            if resumed:
+                text += " (resumed)"
+            self.after(0, lambda: label.config(text=text))
+        return _on_progress
+
+    def report_failure(self, label, title, error):
+        """Shows an exception raised on a worker thread in the status label and a message box."""
+        def _show():
+            label.config(text=f"{title} failed: {error}")
+            messagebox.showerror(title, f"{title} failed:\n{error}")
+        self.after(0, _show)
+
+    def reset_scan_button(self, button, text):
+        """Ends the running job and restores its start button; safe to call from any thread."""
+        self.scan_running = False
+        self.after(0, lambda: button.config(text=text, bg="#3B8ED0", fg="white", state="normal"))
+
+    # ===========================
+    # Change Tracking
+    # ===========================
+    def maybe_watch(self, job):
+        """Keeps a finished scan's results current while 'Watch for changes' is on (UI thread)."""
+        if not self.watch_changes.get() or not ({"duplicates", "large"} & set(job.analyzers)):
+            return
+        self.stop_watch()
+        token = self.watch_token = object()
+
+        def _start():
+            # Setting up watches walks the whole tree, so it stays off the UI thread
+            try:
+                session = LiveSession(job, on_update=self.on_live_update).start()
+            except Exception as e:
+                self.report_failure(self.lbl_dup_status if "duplicates" in job.analyzers else self.lbl_large_status, "Watching for changes", e)
+                return
+            self.after(0, lambda: self._attach_watch(session, token))
+
+        threading.Thread(target=_start, daemon=True).start()
+
+    def _attach_watch(self, session, token):
+        if token is not self.watch_token or not self.watch_changes.get():
+            threading.Thread(target=session.stop, daemon=True).start()
+            return
+        self.live_session = session
+
+    def stop_watch(self):
+        self.watch_token = None
+        if self.live_session is not None:
+            self.live_session.stop()
+            self.live_session = None
+
+    def on_live_update(self, live, changed):
+        """Watcher thread callback: redraws the result lists that changed."""
+        rows, large_files, matched = live.snapshot()
+        note = "rescan recommended, some changes were missed" if live.needs_rescan else time.strftime("updated %H:%M:%S")
+
+        def _update_ui():
+            if "duplicates" in changed and rows is not None:
+                self.lbl_dup_status.config(text=f"Live: {len(rows)} duplicates, {note}.")
+                self.render_duplicates(rows)
+            if "large" in changed and large_files is not None:
+                self.lbl_large_status.config(text=f"Live: {matched} large files, {note}.")
+                self.render_large_files(large_files, matched)
+
+        self.after(0, _update_ui)
+
+    def open_file_location(self, filepath):
+        try:
+            norm_path = os.path.normpath(filepath)
+            if os.path.exists(norm_path):
+                # Using /select ensures Windows Explorer opens and highlights the target file
+                subprocess.run(f'explorer.exe /select, "{norm_path}"', shell=True)
+            else:
+                messagebox.showerror("Error", f"File not found:\n{norm_path}")
+        except Exception as e:
+            print(f"Error opening location: {e}")
+
+    # ===========================
+    # Duplicate Logic
+    # ===========================
+    def toggle_dup_scan(self):
+        if self.scan_running:
+            self.stop_scan("dup", self.btn_scan_dup)
+        else:
+            self.start_duplicate_scan()
+
+    def start_duplicate_scan(self):
+        scan_path = self.dup_path_entry.get()
+        if not scan_path or scan_path == "Select folder to scan..." or not os.path.isdir(scan_path):
+            messagebox.showerror("Error", "Invalid directory path.")
+            return
+        
+        ext_filter = self.ext_entry.get().strip()
+        extensions = parse_extensions(ext_filter) if ext_filter != "e.g. .mp4, jpg, .pdf" else None
+        
+        self.stop_watch()
+        self.scan_running = True
+        self.active_scan = "dup"
+        self.btn_scan_dup.config(text="Stop Scan", bg="#c42b1c", fg="white")
+        self.lbl_dup_status.config(text="Initializing...", fg="gray")
+        
+        self.clear_container(self.dup_results_list)
+
+        options = self.get_scan_options(modes=["duplicates"], extensions=extensions)
+        threading.Thread(target=self.scan_duplicates_thread, args=(scan_path, options), daemon=True).start()
+
+    def scan_duplicates_thread(self, scan_path, options):
+        try:
+            self.after(0, lambda: self.lbl_dup_status.config(text="Scanning file system..."))
+
+            job = ScanJob(scan_path, options, should_stop=lambda: not self.scan_running)
+            job.progress = self.make_progress(self.lbl_dup_status, job.resumed)
+            job.run()
+
+            dup_analyzer = job.analyzers["duplicates"]
+            duplicates = dup_analyzer.rows()
+            self.dup_groups = dup_analyzer.groups if self.scan_running else []
+            if self.scan_running:
+                self.after(0, lambda: self.maybe_watch(job))
+            status_msg = "Scan stopped." if not self.scan_running else f"Done. Found {len(duplicates)} duplicates ({format_size(dup_analyzer.bytes_read)} read)."
+            self.finish_dup_scan(duplicates, status_msg)
+        except Exception as e:
+            self.dup_groups = []
+            self.report_failure(self.lbl_dup_status, "Duplicate scan", e)
+        finally:
+            self.reset_scan_button(self.btn_scan_dup, "Scan for Duplicates")
+
+    def finish_dup_scan(self, duplicates, msg):
+        def _update_ui():
+            self.lbl_dup_status.config(text=msg)
+            self.render_duplicates(duplicates)
+
+        self.after(0, _update_ui)
+
+    def render_duplicates(self, duplicates):
+        """Draws (duplicate, original, size) rows, largest first."""
+        self.clear_container(self.dup_results_list)
+        if not duplicates: return
+
+        duplicates.sort(key=lambda x: x[2], reverse=True)
+        display_limit = 100
+
+        if len(duplicates) > display_limit:
+             tk.Label(
+                 self.dup_results_list, text=f"Showing largest {display_limit} of {len(duplicates)} results...", 
+                 fg="#FFA500", bg="#1c1c1c", font=("Segoe UI", 9, "bold")
+             ).pack(pady=8, padx=10, anchor="w")
+
+        for i, (dup_file, original_file, size) in enumerate(duplicates):
+            if i >= display_limit: break
+            
+            row = tk.Frame(self.dup_results_list, bg="#2a2a2a", bd=1, relief="solid")
+            row.pack(fill="x", pady=4, padx=5)
+            row.grid_columnconfigure(0, weight=1)
+            row.grid_columnconfigure(1, weight=0)
+
+            info_frame = tk.Frame(row, bg="#2a2a2a")
+            info_frame.grid(row=0, column=0, sticky="nsew", padx=12, pady=8)
+            
+            top_line = tk.Frame(info_frame, bg="#2a2a2a")
+            top_line.pack(fill="x", pady=(0, 2))
+            
+            tk.Label(top_line, text=os.path.basename(dup_file), font=("Segoe UI", 10, "bold"), fg="#ffffff", bg="#2a2a2a").pack(side="left")
+            tk.Label(top_line, text=f"({format_size(size)})", font=("Segoe UI", 10, "bold"), fg="#3B8ED0", bg="#2a2a2a").pack(side="left", padx=10)
+
+            tk.Label(info_frame, text=f"Duplicate: {dup_file}", font=("Segoe UI", 9), fg="#cccccc", bg="#2a2a2a", anchor="w").pack(anchor="w", fill="x")
+            tk.Label(info_frame, text=f"Original:  {original_file}", font=("Segoe UI", 9), fg="#888888", bg="#2a2a2a", anchor="w").pack(anchor="w", fill="x")
+            
+            btn_frame = tk.Frame(row, bg="#2a2a2a")
+            btn_frame.grid(row=0, column=1, sticky="e", padx=12, pady=8)
+            
+            tk.Button(btn_frame, text="Open Duplicate", width=14, bg="#383838", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", padx=5, pady=4, command=lambda p=dup_file: self.open_file_location(p)).pack(pady=3)
+            tk.Button(btn_frame, text="Open Original", width=14, bg="#444444", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", padx=5, pady=4, command=lambda p=original_file: self.open_file_location(p)).pack(pady=3)
+
+
+    def link_duplicates(self):
+        """Asks for confirmation with the dry-run plan, then links the copies of the last duplicate scan."""
+        if self.scan_running:
+            messagebox.showinfo("Scan Running", "Wait for the running scan to finish first.")
+            return
+        if not self.dup_groups:
+            messagebox.showinfo("Hard Links", "Run a duplicate scan first.")
+            return
+
+        plan = plan_links(self.dup_groups)
+        if not plan.actions:
+            messagebox.showinfo("Hard Links", f"Nothing can be linked ({len(plan.skipped)} copies are on other volumes, changed or already linked).")
+            return
+        skipped = f"{len(plan.skipped)} copies will be skipped (other volume, changed or already linked).\n\n" if plan.skipped else ""
+        if not messagebox.askyesno(
+            "Replace with Hard Links",
+            f"Replace {len(plan.actions)} duplicate files with hard links to their originals?\n\n"
+            f"This frees about {format_size(plan.reclaimable)}. {skipped}"
+            "Linked files share one content: editing one of them changes all of them. "
+            "Every change is journaled and can be reverted with 'Undo Last Linking'."
+        ):
+            return
+
+        self.stop_watch()
+        self.scan_running = True
+        self.active_scan = "link"
+        self.lbl_dup_status.config(text="Linking...", fg="gray")
+        threading.Thread(target=self.link_duplicates_thread, args=(plan,), daemon=True).start()
+
+    def link_duplicates_thread(self, plan):
+        try:
+            replacer = LinkReplacer(mode="auto", progress=self.make_progress(self.lbl_dup_status)).run(plan)
+        except Exception as e:
+            self.report_failure(self.lbl_dup_status, "Linking", e)
+            return
+        finally:
+            self.scan_running = False
+        msg = f"Linked {replacer.replaced} files, freed {format_size(replacer.reclaimed)}."
+        if replacer.failed:
+            msg += f" {len(replacer.failed)} could not be replaced (in use or read-only)."
+        self.dup_groups = []
+
+        def _update_ui():
+            self.lbl_dup_status.config(text=msg)
+            self.clear_container(self.dup_results_list)
+
+        self.after(0, _update_ui)
+
+    def undo_last_links(self):
+        if self.scan_running:
+            messagebox.showinfo("Scan Running", "Wait for the running scan to finish first.")
+            return
+        journal = latest_journal()
+        if journal is None:
+            messagebox.showinfo("Undo Linking", "There is no linking to undo.")
+            return
+        if not messagebox.askyesno("Undo Linking", f"Turn the hard links recorded in\n{journal}\nback into separate copies?"):
+            return
+
+        self.scan_running = True
+        self.active_scan = "link"
+        self.lbl_dup_status.config(text="Restoring copies...", fg="gray")
+
+        def _undo():
+            errors = []
+            try:
+                restored, _ = undo_links(journal, on_error=lambda path, e: errors.append(path))
+                msg = f"Restored {restored} separate copies." + (f" {len(errors)} failed." if errors else "")
+            except OSError as e:
+                msg = f"Undo failed: {e}"
+            except Exception as e:
+                self.report_failure(self.lbl_dup_status, "Undo linking", e)
+                return
+            finally:
+                self.scan_running = False
+            self.after(0, lambda: self.lbl_dup_status.config(text=msg))
+
+        threading.Thread(target=_undo, daemon=True).start()
+
+    # ===========================
+    # Large File Logic
+    # ===========================
+    def toggle_large_scan(self):
+        if self.scan_running:
+            self.stop_scan("large", self.btn_scan_large)
+        else:
+            self.start_large_scan()
+
+    def start_large_scan(self):
+        scan_path = self.large_path_entry.get()
+        if not scan_path or scan_path == "Select folder to scan..." or not os.path.isdir(scan_path):
+            messagebox.showerror("Error", "Invalid directory path.")
+            return
+
+        limits = self.read_large_limits()
+        if limits is None:
+            return
+        threshold_mb, top_k = limits
+            
+        self.stop_watch()
+        self.scan_running = True
+        self.active_scan = "large"
+        self.btn_scan_large.config(text="Stop Scan", bg="#c42b1c", fg="white")
+        self.lbl_large_status.config(text="Scanning...", fg="gray")
+        self.lbl_large_results.config(text=f" Largest {top_k} files > {threshold_mb:g}MB ")
+        
+        self.clear_container(self.large_results_list)
+
+        modes = ["large", "compress"] if self.estimate_compression.get() else ["large"]
+        options = self.get_scan_options(modes=modes, threshold_bytes=int(threshold_mb * 1024 * 1024), top_k=top_k)
+        threading.Thread(target=self.scan_large_files_thread, args=(scan_path, options), daemon=True).start()
+
+    def scan_large_files_thread(self, scan_path, options):
+        try:
+            job = ScanJob(scan_path, options, should_stop=lambda: not self.scan_running)
+            tracker = job.analyzers["large"].tracker
+            job.progress = self.make_live_progress(self.lbl_large_status, tracker, job.resumed)
+            job.run()
+
+            if self.scan_running:
+                self.after(0, lambda: self.maybe_watch(job))
+            status_msg = "Scan stopped." if not self.scan_running else f"Done. Found {tracker.matched} large files."
+            report = job.analyzers["compress"].report if "compress" in job.analyzers else None
+            if report and self.scan_running:
+                status_msg += f" Compression could free ~{format_size(report.reclaimable)}."
+            self.finish_large_scan(tracker.snapshot(), tracker.matched, status_msg, report.per_file if report else None)
+        except Exception as e:
+            self.report_failure(self.lbl_large_status, "Large file scan", e)
+        finally:
+            self.reset_scan_button(self.btn_scan_large, "Scan for Large Files")
+
+    def make_live_progress(self, label, tracker, resumed=False):
+        """Progress callback that also redraws the live top-K view, at most once per interval."""
+        post_status = self.make_progress(label, resumed)
+        state = {"version": 0, "last": time.monotonic()}
+
+        def _on_progress(stage, done, total):
+            post_status(stage, done, total)
+            now = time.monotonic()
+            if tracker.version != state["version"] and now - state["last"] >= LIVE_REFRESH_SECONDS:
+                state["version"], state["last"] = tracker.version, now
+                rows, matched = tracker.snapshot(), tracker.matched
+                self.after(0, lambda: self.render_large_files(rows, matched))
+        return _on_progress
+
+    def finish_large_scan(self, large_files, matched, msg, estimates=None):
+        def _update_ui():
+            self.lbl_large_status.config(text=msg)
+            self.render_large_files(large_files, matched, estimates)
+
+        self.after(0, _update_ui)
+
+    def render_large_files(self, large_files, matched, estimates=None):
+        """Draws rows for a largest-first [(path, size)] list holding `matched` total hits.
+
+        With compression estimates the rows are ranked by reclaimable bytes instead.
+        """
+        self.clear_container(self.large_results_list)
+        if not large_files: return
+        savings = {}
+        if estimates:
+            savings = {path: (estimated, reclaimable) for path, _, estimated, reclaimable in estimates}
+            # Files that could not be read keep their place after the estimated ones
+            large_files = [(path, size) for path, size, _, _ in estimates] + [row for row in large_files if row[0] not in savings]
+        
+        if matched > len(large_files):
+             tk.Label(
+                 self.large_results_list, text=f"Showing largest {len(large_files)} of {matched} results...", 
+                 fg="#FFA500", bg="#1c1c1c", font=("Segoe UI", 9, "bold")
+             ).pack(pady=8, padx=10, anchor="w")
+        
+        for fpath, size in large_files:
+            row = tk.Frame(self.large_results_list, bg="#2a2a2a", bd=1, relief="solid")
+            row.pack(fill="x", pady=4, padx=5)
+            row.grid_columnconfigure(0, weight=0)
+            row.grid_columnconfigure(1, weight=1)
+            row.grid_columnconfigure(2, weight=0)
+
+            size_lbl = tk.Label(
+                row, text=format_size(size), width=12, anchor="e", 
+                font=("Segoe UI", 10, "bold"), fg="#3B8ED0", bg="#2a2a2a"
+            )
+            size_lbl.grid(row=0, column=0, padx=12, pady=10, sticky="w")
+            
+            name_lbl = tk.Label(row, text=fpath, anchor="w", fg="#ffffff", bg="#2a2a2a", font=("Segoe UI", 9))
+            name_lbl.grid(row=0, column=1, padx=5, sticky="ew")
+
+            if fpath in savings:
+                _, reclaimable = savings[fpath]
+                percent = reclaimable * 100 // size if size else 0
+                tk.Label(
+                    row, text=f"saves ~{format_size(reclaimable)} ({percent}%)", anchor="e",
+                    fg="#4CAF50" if percent >= 20 else "#888888", bg="#2a2a2a", font=("Segoe UI", 9)
+                ).grid(row=0, column=2, padx=(0, 4), sticky="e")
+
+            btn = tk.Button(
+                row, text="Open Location", width=14, height=1, 
+                bg="#383838", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", padx=5, pady=4,
+                command=lambda p=fpath: self.open_file_location(p)
+            )
+            btn.grid(row=0, column=3, padx=12, pady=8, sticky="e")
+
+    # ===========================
+    # Full Analysis Logic
+    # ===========================
+    def toggle_combo_scan(self):
+        if self.scan_running:
+            self.stop_scan("combo", self.btn_scan_combo)
+        else:
+            self.start_combo_scan()
+
+    def start_combo_scan(self):
+        scan_path = self.combo_path_entry.get()
+        if not scan_path or scan_path == "Select folder to scan..." or not os.path.isdir(scan_path):
+            messagebox.showerror("Error", "Invalid directory path.")
+            return
+
+        selected = {key: var.get() for key, var in self.combo_vars.items()}
+        if not any(selected.values()):
+            messagebox.showerror("Error", "Select at least one analyzer.")
+            return
+
+        limits = self.read_large_limits() if selected["large"] else (SCANNER_LARGE_THRESHOLD_MB, SCANNER_TOP_K)
+        if limits is None:
+            return
+        threshold_mb, top_k = limits
+
+        self.stop_watch()
+        self.scan_running = True
+        self.active_scan = "combo"
+        self.btn_scan_combo.config(text="Stop Scan", bg="#c42b1c", fg="white")
+        self.lbl_combo_status.config(text="Scanning...", fg="gray")
+        self.set_report("")
+
+        modes = [mode for key, mode in COMBO_MODES if selected[key]]
+        options = self.get_scan_options(modes=modes, threshold_bytes=int(threshold_mb * 1024 * 1024), top_k=top_k)
+        threading.Thread(target=self.scan_combo_thread, args=(scan_path, threshold_mb, top_k, options), daemon=True).start()
+
+    def scan_combo_thread(self, scan_path, threshold_mb, top_k, options):
+        try:
+            job = ScanJob(scan_path, options, should_stop=lambda: not self.scan_running)
+            job.progress = self.make_progress(self.lbl_combo_status, job.resumed)
+            scanned = job.run()
+            if self.scan_running:
+                self.after(0, lambda: self.maybe_watch(job))
+
+            status_msg = "Scan stopped." if not self.scan_running else f"Done. Analyzed {scanned} files in one pass."
+            self.finish_combo_scan(job.analyzers, threshold_mb, top_k, status_msg)
+        except Exception as e:
+            self.report_failure(self.lbl_combo_status, "Full analysis", e)
+        finally:
+            self.reset_scan_button(self.btn_scan_combo, "Run Full Analysis")
+
+    def finish_combo_scan(self, analyzers, threshold_mb, top_k, msg):
+        stopped = not self.scan_running
+
+        lines = []
+        if "dup_dirs" in analyzers:
+            dup_dirs = analyzers["dup_dirs"]
+            lines.append(f"=== Duplicate Folders: {len(dup_dirs.groups)} sets, {format_size(dup_dirs.reclaimable)} reclaimable ===")
+            for size, files, paths, reclaimable in dup_dirs.groups[:25]:
+                lines.append(f"  {format_size(size):>12} x{len(paths)}  ({files} files each, {format_size(reclaimable)} reclaimable)")
+                for path in paths:
+                    lines.append(f"      {path}")
+            if len(dup_dirs.groups) > 25:
+                lines.append(f"  ... and {len(dup_dirs.groups) - 25} more sets")
+            lines.append("")
+        if "chunks" in analyzers and analyzers["chunks"].report is not None:
+            report = analyzers["chunks"].report
+            share = report.redundant_bytes / report.total_bytes * 100 if report.total_bytes else 0
+            lines.append(f"=== Shared Chunks: {format_size(report.redundant_bytes)} of {format_size(report.total_bytes)} ({share:.1f}%) in {len(report.per_file)} large files ===")
+            for path, size, redundant in report.per_file[:25]:
+                if redundant:
+                    lines.append(f"  {format_size(redundant):>12} shared of {format_size(size):>12}  {path}")
+            if report.skipped_files:
+                lines.append(f"  {report.skipped_files} files ({format_size(report.skipped_bytes)}) left out: over the {format_size(report.max_bytes)} chunking limit")
+            lines.append("")
+        if "cold" in analyzers and analyzers["cold"].totals is not None:
+            cold = analyzers["cold"]
+            tree = cold.tree
+            lines.append(f"=== Cold Data: {format_size(cold.cold_bytes)} not used for {cold.cold_days}+ days ===")
+            labels = cold.bucket_labels()
+            for root in tree.roots:
+                lines.append(f"  {tree.path(root)}")
+                used, modified = cold.histogram(root, "used"), cold.histogram(root, "modified")
+                lines.append(f"    {'Age':<12} {'Last used':>12} {'Last modified':>14}")
+                for label, (u_bytes, _), (m_bytes, _) in zip(labels, used, modified):
+                    lines.append(f"    {label:<12} {format_size(u_bytes):>12} {format_size(m_bytes):>14}")
+            for node, cold_bytes, total in cold.cold_dirs[:25]:
+                lines.append(f"  {format_size(cold_bytes):>12} cold of {format_size(total):>12}  {tree.path(node)}")
+            lines.append("")
+        if "extensions" in analyzers:
+            lines.append("=== Extension Breakdown (by size) ===")
+            for ext, count, size in analyzers["extensions"].top(25):
+                lines.append(f"  {ext:<14} {count:>10} files   {format_size(size):>12}")
+            lines.append("")
+        if "empty" in analyzers:
+            empty = analyzers["empty"]
+            lines.append(f"=== Empty Items: {len(empty.empty_files)} zero-byte files, {len(empty.empty_dirs)} empty folders ===")
+            for path in empty.empty_dirs[:50]:
+                lines.append(f"  [dir]  {path}")
+            for path in empty.empty_files[:50]:
+                lines.append(f"  [file] {path}")
+            if len(empty.empty_dirs) > 50 or len(empty.empty_files) > 50:
+                lines.append("  ... (first 50 of each shown)")
+
+        def _update_ui():
+            self.lbl_combo_status.config(text=msg)
+            self.set_report("\n".join(lines))
+            if stopped:
+                return
+            if "duplicates" in analyzers:
+                self.dup_groups = analyzers["duplicates"].groups
+                self.lbl_dup_status.config(text=f"From full analysis: {len(analyzers['duplicates'].groups)} duplicate groups.")
+                self.render_duplicates(analyzers["duplicates"].rows())
+            if "dirs" in analyzers:
+                tree = analyzers["dirs"].tree
+                self.dir_tree = tree
+                self.render_dir_node(tree.roots[0] if tree.roots else None)
+            if "large" in analyzers:
+                tracker = analyzers["large"].tracker
+                self.lbl_large_status.config(text=f"From full analysis: {tracker.matched} large files.")
+                self.lbl_large_results.config(text=f" Largest {top_k} files > {threshold_mb:g}MB ")
+                self.render_large_files(tracker.snapshot(), tracker.matched)
+
+        self.after(0, _update_ui)
+
+    def dir_tree_up(self):
+        if self.dir_tree is None or self.dir_node is None:
+            return
+        parent = self.dir_tree.parent[self.dir_node]
+        if parent >= 0:
+            self.render_dir_node(parent)
+
+    def render_dir_node(self, node, display_limit=50):
+        """Shows the subfolders of a DirTree node, largest first, with a share bar."""
+        self.clear_container(self.dir_results_list)
+        self.dir_node = node
+        tree = self.dir_tree
+        if tree is None or node is None:
+            return
+
+        total = tree.total_bytes[node] or 1
+        self.lbl_dir_path.config(text=f" {tree.path(node)}  ({format_size(tree.total_bytes[node])}, {tree.total_files[node]} files) ")
+
+        rows = [(child, tree.names[child], tree.total_bytes[child], tree.total_files[child]) for child in tree.largest_children(node, display_limit)]
+        if tree.own_bytes[node]:
+            rows.append((None, "(files in this folder)", tree.own_bytes[node], tree.own_files[node]))
+            rows.sort(key=lambda r: r[2], reverse=True)
+
+        for child, name, size, files in rows:
+            row = tk.Frame(self.dir_results_list, bg="#2a2a2a", bd=1, relief="solid")
+            row.pack(fill="x", pady=2, padx=5)
+            row.grid_columnconfigure(2, weight=1)
+
+            tk.Label(row, text=format_size(size), width=12, anchor="e", font=("Segoe UI", 9, "bold"), fg="#3B8ED0", bg="#2a2a2a").grid(row=0, column=0, padx=(12, 6), pady=6)
+
+            bar = tk.Canvas(row, width=120, height=10, bg="#1c1c1c", highlightthickness=0)
+            bar.create_rectangle(0, 0, int(120 * size / total), 10, fill="#3B8ED0", width=0)
+            bar.grid(row=0, column=1, padx=6)
+
+            tk.Label(row, text=f"{name}   ({files} files)", anchor="w", fg="#ffffff", bg="#2a2a2a", font=("Segoe UI", 9)).grid(row=0, column=2, padx=5, sticky="ew")
+
+            if child is not None and tree.first_child[child] >= 0:
+                tk.Button(row, text="Open ▸", width=8, bg="#383838", fg="white", font=("Segoe UI", 8, "bold"), bd=0, cursor="hand2", pady=3, command=lambda c=child: self.render_dir_node(c)).grid(row=0, column=3, padx=12, pady=4)
+
+    def set_report(self, text):
+        self.combo_report.configure(state="normal")
+        self.combo_report.delete("1.0", "end")
+        self.combo_report.insert("end", text)
+        self.combo_report.configure(state="disabled")
+
+# Compatibility alias for main.py dynamic routing
+FileScannerTab = ScannerModule
+
+
+if __name__ == "__main__":
+    # Kept for old scripts; needs tkinter. The GUI-free entry point is python -m modules.scan_engine
+    import sys
+    from modules.scan_engine import main
+    sys.exit(main())
@@ -0,0 +1,254 @@
+import os
+import sys
+import time
+import ctypes
+import platform
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from config import (
+        SCANNER_THROTTLE_MB_PER_SEC, SCANNER_THROTTLE_ENTRIES_PER_SEC,
+        SCANNER_THROTTLE_CPU_PERCENT, SCANNER_THROTTLE_DISK_BUSY_PERCENT
+    )
+except ImportError:
+    SCANNER_THROTTLE_MB_PER_SEC = 20
+    SCANNER_THROTTLE_ENTRIES_PER_SEC = 2000
+    SCANNER_THROTTLE_CPU_PERCENT = 60
+    SCANNER_THROTTLE_DISK_BUSY_PERCENT = 50
+
+# System load is sampled at most this often
+LOAD_SAMPLE_SECONDS = 1.0
+# Back-off sleeps double from the first value up to the cap while the system stays busy
+BACKOFF_START_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+
+# Windows: background mode lowers CPU, I/O and memory priority of the calling thread
+THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+# Linux ioprio_set(2): idle class for one thread
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_IDLE = 3
+IOPRIO_CLASS_SHIFT = 13
+SYS_IOPRIO_SET = {"x86_64": 251, "aarch64": 30, "i686": 289, "armv7l": 314}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: consume(n) blocks until n tokens are available.
+
+    The bucket refills at `rate` tokens per second and holds at most `burst`
+    tokens (one second's worth by default). Requests larger than the burst
+    are let through once the bucket is full and leave it in debt, so large
+    reads are paced rather than rejected.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst or rate)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n, should_stop=None):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= min(n, self.burst):
+                    self._tokens -= n
+                    return
+                wait = (min(n, self.burst) - self._tokens) / self.rate
+            if should_stop and should_stop():
+                return
+            time.sleep(min(wait, 0.25))
+
+
+def lower_current_thread_priority():
+    """Moves the calling thread to background CPU and I/O priority (Windows and Linux only).
+
+    This is not undone: on Linux an unprivileged process cannot raise a
+    thread's priority again, so only call it from threads the scan owns.
+    """
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN))
+        if sys.platform.startswith("linux"):
+            tid = threading.get_native_id()
+            # On Linux both calls apply to the single thread identified by its tid
+            os.setpriority(os.PRIO_PROCESS, tid, 19)
+            nr = SYS_IOPRIO_SET.get(platform.machine())
+            if nr is not None:
+                libc = ctypes.CDLL(None, use_errno=True)
+                libc.syscall(nr, IOPRIO_WHO_PROCESS, tid, IOPRIO_CLASS_IDLE << IOPRIO_CLASS_SHIFT)
+            return True
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+class LoadMonitor:
+    """Samples the CPU and disk load caused by other programs through psutil (no-op without it).
+
+    The scan's own share is taken out first: CPU time of the scan process
+    (scan_pid, default this process) and its children is subtracted from
+    the system CPU figure, and each disk's busy time is scaled down by the
+    share of its traffic the scan itself read or wrote. psutil cannot tell
+    which disk the scan's bytes went to, so they are subtracted from every
+    disk. Disks are sampled one by one and the busiest one counts.
+    """
+    def __init__(self, cpu_percent, disk_busy_percent, scan_pid=None):
+        self.cpu_limit = cpu_percent
+        self.disk_limit = disk_busy_percent
+        self.available = psutil is not None
+        self.cpu = 0.0
+        self.disk = 0.0
+        self._last_time = 0.0
+        self._last_disks = None
+        self._last_own_bytes = None
+        self._lock = threading.Lock()
+        if self.available:
+            self._cpus = psutil.cpu_count() or 1
+            self._root = psutil.Process(scan_pid)
+            self._processes = {}
+            psutil.cpu_percent(interval=None)
+            self._own_usage()
+
+    def _own_usage(self):
+        """Returns (percent of all CPUs, bytes read and written) of the scan's processes."""
+        try:
+            processes = [self._root] + self._root.children(recursive=True)
+        except psutil.Error:
+            processes = [self._root]
+        # Keep the Process objects: cpu_percent measures since the previous call on the same object
+        self._processes = {p.pid: self._processes.get(p.pid, p) for p in processes}
+        cpu = 0.0
+        io_bytes = 0
+        for process in self._processes.values():
+            try:
+                cpu += process.cpu_percent(interval=None)
+                io = process.io_counters()
+                io_bytes += io.read_bytes + io.write_bytes
+            except (psutil.Error, AttributeError):
+                continue
+        return cpu / self._cpus, io_bytes
+
+    def _disk_counters(self):
+        """Returns {disk: (busy ms, bytes moved)} from the per-disk counters."""
+        disks = {}
+        for name, io in (psutil.disk_io_counters(perdisk=True) or {}).items():
+            busy = getattr(io, "busy_time", None)
+            # Windows has no busy_time; read plus write time is a close stand-in
+            disks[name] = (busy if busy is not None else io.read_time + io.write_time, io.read_bytes + io.write_bytes)
+        return disks
+
+    def _busiest_disk(self, disks, own_bytes, elapsed_ms):
+        """Busy percentage of the busiest disk, counting only other programs' share of its traffic."""
+        own = max(0, own_bytes - self._last_own_bytes)
+        busiest = 0.0
+        for name, (busy, moved) in disks.items():
+            last = self._last_disks.get(name)
+            if last is None:
+                continue
+            busy, moved = busy - last[0], moved - last[1]
+            others = (moved - min(own, moved)) / moved if moved > 0 else 1.0
+            busiest = max(busiest, busy * others / elapsed_ms * 100)
+        return busiest
+
+    def sample(self):
+        """Refreshes the readings at most every LOAD_SAMPLE_SECONDS."""
+        if not self.available:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_time < LOAD_SAMPLE_SECONDS:
+                return
+            own_cpu, own_bytes = self._own_usage()
+            self.cpu = max(0.0, psutil.cpu_percent(interval=None) - own_cpu)
+            disks = self._disk_counters()
+            if self._last_disks is not None and self._last_time:
+                self.disk = self._busiest_disk(disks, own_bytes, (now - self._last_time) * 1000)
+            self._last_disks, self._last_own_bytes, self._last_time = disks, own_bytes, now
+
+    def overloaded(self):
+        self.sample()
+        return (self.cpu_limit and self.cpu > self.cpu_limit) or (self.disk_limit and self.disk > self.disk_limit)
+
+
+class Throttle:
+    """Low-impact mode shared by the traversal and hashing threads of one scan.
+
+    Limits entries stat'ed and bytes read per second with token buckets,
+    and pauses with growing back-off while system CPU or disk load stays
+    above the configured limits. Any limit set to 0 or None is off. The
+    walker and hashing threads and the worker processes call enter_worker
+    to drop to background priority; the thread that runs the scan (the
+    command line's main thread or the GUI's scan thread) keeps its own.
+    The load of the scan itself (scan_pid and its child processes) does
+    not count towards those limits.
+    """
+    def __init__(self, bytes_per_sec=None, entries_per_sec=None, cpu_percent=None, disk_busy_percent=None,
+                 low_priority=True, should_stop=None, scan_pid=None):
+        self.byte_bucket = TokenBucket(bytes_per_sec) if bytes_per_sec else None
+        self.entry_bucket = TokenBucket(entries_per_sec) if entries_per_sec else None
+        self.load = LoadMonitor(cpu_percent, disk_busy_percent, scan_pid) if (cpu_percent or disk_busy_percent) else None
+        self.low_priority = low_priority
+        self.bytes_per_sec = bytes_per_sec
+        self.cpu_percent = cpu_percent
+        self.disk_busy_percent = disk_busy_percent
+        self.should_stop = should_stop or (lambda: False)
+        self.paused_seconds = 0.0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, should_stop=None, **overrides):
+        settings = {
+            "bytes_per_sec": SCANNER_THROTTLE_MB_PER_SEC * 1024 * 1024,
+            "entries_per_sec": SCANNER_THROTTLE_ENTRIES_PER_SEC,
+            "cpu_percent": SCANNER_THROTTLE_CPU_PERCENT,
+            "disk_busy_percent": SCANNER_THROTTLE_DISK_BUSY_PERCENT,
+        }
+        settings.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(should_stop=should_stop, **settings)
+
+    def process_settings(self, processes):
+        """Picklable settings for worker processes, which share the byte rate between them."""
+        return {
+            "bytes_per_sec": self.bytes_per_sec / max(1, processes) if self.bytes_per_sec else None,
+            "cpu_percent": self.cpu_percent,
+            "disk_busy_percent": self.disk_busy_percent,
+            "low_priority": self.low_priority,
+            "scan_pid": os.getpid(),
+        }
+
+    def enter_worker(self):
+        """Lowers the calling thread's priority once; call it only from threads the scan owns."""
+        if self.low_priority and not getattr(self._local, "lowered", False):
+            self._local.lowered = True
+            lower_current_thread_priority()
+
+    def wait_for_quiet_system(self):
+        if self.load is None:
+            return
+        delay = BACKOFF_START_SECONDS
+        while self.load.overloaded() and not self.should_stop():
+            time.sleep(delay)
+            with self._stats_lock:
+                self.paused_seconds += delay
+            delay = min(delay * 2, BACKOFF_MAX_SECONDS)
+
+    def entries(self, n):
+        """Called after listing a directory of n entries."""
+        if self.entry_bucket and n:
+            self.entry_bucket.consume(n, self.should_stop)
+        self.wait_for_quiet_system()
+
+    def bytes(self, n):
+        """Called before (or after) reading n bytes of file content."""
+        if self.byte_bucket and n:
+            self.byte_bucket.consume(n, self.should_stop)
+        self.wait_for_quiet_system()
@@ -0,0 +1,265 @@
+import os
+import stat
+import queue
+import threading
+from collections import deque
+
+try:
+    from config import SCANNER_WALK_WORKERS
+except ImportError:
+    SCANNER_WALK_WORKERS = 1
+
+# Windows reports junctions and symlinks through the reparse point attribute
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+
+class FileEntry:
+    """Regular file found during traversal, built from the cached scandir stat."""
+    __slots__ = ("path", "name", "size", "mtime", "atime", "ino", "dev")
+
+    def __init__(self, path, name, size, mtime, atime=0.0, ino=0, dev=0):
+        self.path = path
+        self.name = name
+        self.size = size
+        self.mtime = mtime
+        self.atime = atime
+        self.ino = ino
+        self.dev = dev
+
+    @classmethod
+    def from_stat(cls, path, name, st):
+        return cls(path, name, st.st_size, st.st_mtime, st.st_atime, st.st_ino, st.st_dev)
+
+
+class DirListing:
+    """Contents of one directory: its regular files and the subdirectories to visit.
+
+    skipped counts the entries that are neither: links, junctions, special
+    files, pruned subdirectories and entries that could not be stat'ed.
+    filtered counts the files later dropped by scan rules.
+    """
+    __slots__ = ("path", "mtime", "files", "dirs", "skipped", "filtered")
+
+    def __init__(self, path, mtime, files=None, dirs=None):
+        self.path = path
+        self.mtime = mtime
+        self.files = files if files is not None else []
+        self.dirs = dirs if dirs is not None else []   # [(path, mtime), ...]
+        self.skipped = 0
+        self.filtered = 0
+
+    @property
+    def is_empty(self):
+        """True when the directory itself holds nothing at all, whatever the scan rules kept."""
+        return not (self.files or self.dirs or self.skipped or self.filtered)
+
+
+def is_reparse_point(st):
+    return bool(getattr(st, "st_file_attributes", 0) & FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+class TreeWalker:
+    """Iterative os.scandir traversal shared by the scanner and the cleaner.
+
+    Yields one DirListing per directory. File sizes and times come from the
+    DirEntry stat cache, which on Windows is filled by the directory listing
+    itself, so no per-file getsize call is needed. Symlinks and junctions are
+    never followed.
+
+    prune_dir(path, name) returning True skips a subdirectory before it is
+    listed. on_error(path, exc) is called for directories that cannot be read
+    and entries that cannot be stat'ed. should_stop() is polled per directory.
+    An optional Throttle paces the listing threads in low-impact mode; a
+    throttled walk always lists from its own worker threads (at least one),
+    so the caller's thread never drops to background priority.
+
+    With workers > 1 directories are listed by a pool of threads that steal
+    work from each other; listings are then yielded in completion order, but
+    the set of listings is the same as in the serial walk. Hooks may be
+    called from worker threads; an exception raised by one stops the walk
+    and is re-raised to the consumer, as in the serial walk.
+    """
+    def __init__(self, prune_dir=None, on_error=None, should_stop=None, workers=None, throttle=None):
+        self.prune_dir = prune_dir
+        self.on_error = on_error
+        self.should_stop = should_stop or (lambda: False)
+        self.workers = max(1, workers or SCANNER_WALK_WORKERS)
+        self.throttle = throttle
+
+    def _error(self, path, exc):
+        if self.on_error:
+            self.on_error(path, exc)
+
+    def list_dir(self, path, mtime=0.0):
+        """Lists a single directory. Returns None if it cannot be read."""
+        listing = DirListing(path, mtime)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError as e:
+                        self._error(entry.path, e)
+                        listing.skipped += 1
+                        continue
+
+                    mode = st.st_mode
+                    if stat.S_ISREG(mode):
+                        listing.files.append(FileEntry.from_stat(entry.path, entry.name, st))
+                    elif stat.S_ISDIR(mode) and not is_reparse_point(st):
+                        if self.prune_dir and self.prune_dir(entry.path, entry.name):
+                            listing.skipped += 1
+                            continue
+                        listing.dirs.append((entry.path, st.st_mtime))
+                    else:
+                        listing.skipped += 1
+        except OSError as e:
+            self._error(path, e)
+            return None
+        if self.throttle:
+            self.throttle.entries(len(listing.files) + len(listing.dirs))
+        return listing
+
+    def root_frames(self, roots):
+        """Stats the roots into (path, mtime) frames, skipping unreadable ones."""
+        frames = []
+        for root in roots:
+            try:
+                frames.append((root, os.stat(root).st_mtime))
+            except OSError as e:
+                self._error(root, e)
+        return frames
+
+    def walk(self, roots):
+        """Walks one or more root directories, yielding a DirListing per directory."""
+        if isinstance(roots, str):
+            roots = [roots]
+
+        return self.walk_frames(self.root_frames(roots))
+
+    def walk_frames(self, frames):
+        """Walks from (path, mtime) frames that were already stat'ed, e.g. a resumed frontier."""
+        if self.workers > 1 or (self.throttle and self.throttle.low_priority):
+            return self._walk_parallel(frames)
+        return self._walk_serial(frames)
+
+    def _walk_serial(self, frames):
+        stack = list(reversed(frames))
+
+        while stack:
+            if self.should_stop():
+                return
+            path, mtime = stack.pop()
+            listing = self.list_dir(path, mtime)
+            if listing is None:
+                continue
+            # Reverse so the first subdirectory is visited first, like os.walk
+            stack.extend(reversed(listing.dirs))
+            yield listing
+
+    def _walk_parallel(self, frames):
+        """Work-stealing walk: each worker pops its own deque LIFO and steals FIFO from others."""
+        n = self.workers
+        deques = [deque() for _ in range(n)]
+        for i, frame in enumerate(frames):
+            deques[i % n].append(frame)
+
+        cond = threading.Condition()
+        state = {"pending": len(frames), "stopped": False}
+        results = queue.Queue(maxsize=1024)
+
+        def _next_frame(own):
+            # Caller holds cond
+            while not state["stopped"]:
+                if own:
+                    return own.pop()
+                victim = max(deques, key=len)
+                if victim:
+                    return victim.popleft()
+                if state["pending"] == 0:
+                    return None
+                cond.wait()
+            return None
+
+        def _worker(i):
+            own = deques[i]
+            if self.throttle:
+                self.throttle.enter_worker()
+            while True:
+                with cond:
+                    frame = _next_frame(own)
+                if frame is None:
+                    return
+                if self.should_stop():
+                    with cond:
+                        state["stopped"] = True
+                        cond.notify_all()
+                    return
+
+                listing = None
+                try:
+                    listing = self.list_dir(*frame)
+                    # Publish the listing before its children so a consumer always
+                    # sees a parent directory before any of its subdirectories
+                    if listing is not None:
+                        results.put(listing)
+                except Exception as e:
+                    # A failing hook ends the walk; the consumer re-raises the error
+                    listing = None
+                    results.put(e)
+                    with cond:
+                        state["stopped"] = True
+                finally:
+                    with cond:
+                        if listing is not None and listing.dirs:
+                            own.extend(reversed(listing.dirs))
+                            state["pending"] += len(listing.dirs)
+                            cond.notify(len(listing.dirs))
+                        state["pending"] -= 1
+                        if state["pending"] == 0 or state["stopped"]:
+                            cond.notify_all()
+
+        threads = [threading.Thread(target=_worker, args=(i,), daemon=True) for i in range(n)]
+        for t in threads:
+            t.start()
+
+        done = object()
+        consumer_left = threading.Event()
+
+        def _finish():
+            for t in threads:
+                t.join()
+            # A consumer that left early may have left the queue full; never block on it
+            while not consumer_left.is_set():
+                try:
+                    results.put(done, timeout=0.25)
+                    return
+                except queue.Full:
+                    continue
+
+        threading.Thread(target=_finish, daemon=True).start()
+
+        try:
+            while True:
+                listing = results.get()
+                if listing is done:
+                    return
+                if isinstance(listing, Exception):
+                    raise listing
+                yield listing
+        finally:
+            # Consumer stopped early: release workers blocked on a full queue
+            consumer_left.set()
+            with cond:
+                state["stopped"] = True
+                cond.notify_all()
+            while any(t.is_alive() for t in threads):
+                try:
+                    results.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+    def iter_files(self, roots):
+        """Convenience generator yielding every FileEntry below the roots."""
+        for listing in self.walk(roots):
+            yield from listing.files
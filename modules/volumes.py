@@ -0,0 +1,274 @@
+import os
+import re
+import sys
+import queue
+import ctypes
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Windows volume to physical disk lookup
+IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS = 0x00560000
+OPEN_EXISTING = 3
+FILE_SHARE_READ_WRITE = 0x1 | 0x2
+DISK_EXTENT_BYTES = 24          # DWORD DiskNumber (padded), LARGE_INTEGER offset, LARGE_INTEGER length
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    # Own kernel32 instance, so these prototypes are set once and shared with no other module
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.CreateFileW.argtypes = (
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE
+    )
+    _kernel32.DeviceIoControl.restype = wintypes.BOOL
+    _kernel32.DeviceIoControl.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID
+    )
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+# /dev/sda1 -> /dev/sda, /dev/nvme0n1p2 -> /dev/nvme0n1, /dev/mmcblk0p1 -> /dev/mmcblk0
+PARTITION_SUFFIX = re.compile(r"^(/dev/(?:nvme\d+n\d+|mmcblk\d+|loop\d+))p\d+$|^(/dev/[a-z]+)\d+$")
+
+
+def _windows_disks(drive):
+    """Physical disk numbers behind a drive letter such as 'C:', or None if unknown."""
+    handle = _kernel32.CreateFileW("\\\\.\\" + drive, 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None)
+    if handle in (None, INVALID_HANDLE_VALUE):
+        return None
+    try:
+        buf = ctypes.create_string_buffer(8 + 16 * DISK_EXTENT_BYTES)
+        returned = wintypes.DWORD(0)
+        ok = _kernel32.DeviceIoControl(handle, IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS, None, 0,
+                                       buf, len(buf), ctypes.byref(returned), None)
+        if not ok:
+            return None
+        count = int.from_bytes(buf.raw[0:4], "little")
+        return tuple(sorted({
+            int.from_bytes(buf.raw[8 + i * DISK_EXTENT_BYTES:12 + i * DISK_EXTENT_BYTES], "little")
+            for i in range(min(count, 16))
+        }))
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def _linux_disk(st_dev):
+    """Whole-disk name for a block device number via sysfs, e.g. 'sda' for sda1; None if not a block device."""
+    node = f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}"
+    try:
+        real = os.path.realpath(node)
+    except OSError:
+        return None
+    if not os.path.exists(real):
+        return None
+    # Partitions live inside their disk's sysfs folder and have a 'partition' attribute
+    if os.path.exists(os.path.join(real, "partition")):
+        real = os.path.dirname(real)
+    return os.path.basename(real)
+
+
+def _partition_device(path):
+    """Device of the psutil partition whose mountpoint holds path, with any partition suffix removed."""
+    if psutil is None:
+        return None
+    try:
+        partitions = psutil.disk_partitions(all=True)
+    except (OSError, RuntimeError):
+        return None
+    norm = os.path.normcase(os.path.abspath(path))
+    best = None
+    for part in partitions:
+        mount = os.path.normcase(part.mountpoint)
+        if norm == mount or norm.startswith(mount.rstrip("\\/") + os.sep):
+            if best is None or len(mount) > len(os.path.normcase(best.mountpoint)):
+                best = part
+    if best is None or not best.device:
+        return None
+    match = PARTITION_SUFFIX.match(best.device)
+    return (match.group(1) or match.group(2)) if match else best.device
+
+
+class DeviceMap:
+    """Maps paths to a key naming the physical device they live on.
+
+    Two paths share a key when reading one competes for the same disk heads
+    as reading the other: partitions of one disk share it, and so do all
+    shares of one network server. Lookups are cached per st_dev, so mapping
+    every frontier directory of a resumed scan costs one stat each.
+    """
+    def __init__(self):
+        self._by_dev = {}
+        self._lock = threading.Lock()
+
+    def key(self, path):
+        try:
+            st_dev = os.stat(path).st_dev
+        except OSError:
+            return f"path:{path}"
+        with self._lock:
+            key = self._by_dev.get(st_dev)
+        if key is None:
+            key = self._resolve(path, st_dev)
+            with self._lock:
+                self._by_dev[st_dev] = key
+        return key
+
+    def _resolve(self, path, st_dev):
+        if sys.platform == "win32":
+            drive = os.path.splitdrive(os.path.abspath(path))[0]
+            if drive.startswith("\\\\"):
+                # UNC share: one key per server
+                return "net:" + drive.split("\\")[2].lower()
+            try:
+                disks = _windows_disks(drive)
+            except (OSError, AttributeError):
+                disks = None
+            if disks:
+                return "disk:" + ",".join(str(d) for d in disks)
+            return "volume:" + drive.upper()
+
+        if sys.platform.startswith("linux"):
+            disk = _linux_disk(st_dev)
+            if disk:
+                return "disk:" + disk
+        device = _partition_device(path)
+        if device:
+            # NFS/SMB mounts report 'server:/export' or '//server/share'
+            if ":" in device and not device.startswith("/"):
+                return "net:" + device.split(":", 1)[0]
+            if device.startswith("//"):
+                return "net:" + device[2:].split("/", 1)[0]
+            return "disk:" + device
+        return f"dev:{st_dev}"
+
+
+def group_by_device(paths, device_map=None):
+    """Groups paths by device, keeping the first-seen order of devices and of paths within each."""
+    device_map = device_map or DeviceMap()
+    groups = {}
+    for path in paths:
+        groups.setdefault(device_map.key(path), []).append(path)
+    return groups
+
+
+class _Failure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+class VolumeScheduler:
+    """Walks roots on different devices in parallel and roots on the same device in turn.
+
+    Wraps a TreeWalker and offers the same root_frames/walk/walk_frames
+    interface, so run_analysis and ScanCheckpoint use it unchanged. Each
+    device gets one pipeline thread that walks its roots one after another,
+    each root with the walker's own listing threads. Listings of all
+    pipelines are merged into a single stream consumed on the caller's
+    thread; each pipeline still yields a folder before its subfolders.
+
+    Frames of a resumed frontier are batched by the root that contains them,
+    so the same rule holds after a resume.
+    """
+    def __init__(self, walker, roots=None, device_map=None):
+        self.walker = walker
+        self.roots = [roots] if isinstance(roots, str) else list(roots or [])
+        self.device_map = device_map or DeviceMap()
+        self.devices = 0
+
+    @property
+    def should_stop(self):
+        return self.walker.should_stop
+
+    def root_frames(self, roots):
+        return self.walker.root_frames(roots)
+
+    def walk(self, roots):
+        if isinstance(roots, str):
+            roots = [roots]
+        if not self.roots:
+            self.roots = list(roots)
+        return self.walk_frames(self.root_frames(roots))
+
+    def _root_of(self, path):
+        """The longest scan root containing path (path itself when none does)."""
+        best = None
+        norm = os.path.normcase(path)
+        for root in self.roots:
+            r = os.path.normcase(root).rstrip("\\/")
+            if (norm == r or norm.startswith(r + os.sep)) and (best is None or len(root) > len(best)):
+                best = root
+        return best or path
+
+    def plan(self, frames):
+        """Returns {device key: [[frame, ...] per root, in order]}."""
+        plan = {}
+        for frame in frames:
+            batches = plan.setdefault(self.device_map.key(frame[0]), {})
+            batches.setdefault(self._root_of(frame[0]), []).append(frame)
+        return {device: list(batches.values()) for device, batches in plan.items()}
+
+    def walk_frames(self, frames):
+        plan = self.plan(frames)
+        self.devices = len(plan)
+        if len(plan) <= 1:
+            return self._walk_batches([batch for batches in plan.values() for batch in batches])
+        return self._walk_devices(list(plan.values()))
+
+    def _walk_batches(self, batches):
+        for batch in batches:
+            if self.should_stop():
+                return
+            yield from self.walker.walk_frames(batch)
+
+    def _walk_devices(self, pipelines):
+        results = queue.Queue(maxsize=1024)
+        stopped = threading.Event()
+        done = object()
+
+        def _put(item):
+            # A consumer that left early must not leave pipelines blocked on a full queue
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.25)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _pipeline(batches):
+            walk = self._walk_batches(batches)
+            try:
+                for listing in walk:
+                    if not _put(listing):
+                        break
+            except BaseException as e:
+                _put(_Failure(e))
+            finally:
+                walk.close()
+                _put(done)
+
+        threads = [threading.Thread(target=_pipeline, args=(batches,), daemon=True) for batches in pipelines]
+        for t in threads:
+            t.start()
+
+        remaining = len(threads)
+        try:
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, _Failure):
+                    raise item.exc
+                else:
+                    yield item
+        finally:
+            stopped.set()
@@ -0,0 +1,350 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import threading
+
+from modules.traversal import TreeWalker
+
+try:
+    from config import SCANNER_WATCH_POLL_SECONDS, SCANNER_WATCH_FULL_POLL_EVERY
+except ImportError:
+    SCANNER_WATCH_POLL_SECONDS = 30
+    SCANNER_WATCH_FULL_POLL_EVERY = 10
+
+# Events arriving within this window are coalesced into one batch
+BATCH_SECONDS = 0.5
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class ChangeEvent:
+    """A path that was created, deleted or modified. 'rescan' means events were lost."""
+    __slots__ = ("kind", "path", "is_dir")
+
+    def __init__(self, kind, path, is_dir=False):
+        self.kind = kind
+        self.path = path
+        self.is_dir = is_dir
+
+    def __repr__(self):
+        return f"ChangeEvent({self.kind!r}, {self.path!r}, is_dir={self.is_dir})"
+
+
+def coalesce(events):
+    """Keeps one event per path, the latest, except that created+modified stays created."""
+    merged = {}
+    for event in events:
+        prev = merged.get(event.path)
+        if prev is not None and prev.kind == "created" and event.kind == "modified":
+            continue
+        merged[event.path] = event
+    return list(merged.values())
+
+
+class ChangeWatcher:
+    """Base class of the change tracking backends.
+
+    on_changes(events) is called from the watcher thread with coalesced
+    batches of ChangeEvents. prune_dir(path, name) excludes directories the
+    same way as a scan does; on_error(path, exc) reports unreadable paths.
+    """
+    backend = "none"
+
+    def __init__(self, roots, on_changes, prune_dir=None, on_error=None):
+        self.roots = [roots] if isinstance(roots, str) else list(roots)
+        self.on_changes = on_changes
+        self.prune_dir = prune_dir
+        self.on_error = on_error
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _error(self, path, exc):
+        if self.on_error:
+            self.on_error(path, exc)
+
+    def _walker(self):
+        return TreeWalker(prune_dir=self.prune_dir, on_error=self.on_error, should_stop=self._stop.is_set, workers=1)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _deliver(self, events):
+        if events and not self._stop.is_set():
+            try:
+                self.on_changes(coalesce(events))
+            except Exception as e:
+                # A failing consumer is reported but must not end change tracking
+                self._error(self.roots[0], e)
+
+    def _run(self):
+        raise NotImplementedError
+
+
+# ===========================
+# Polling Backend
+# ===========================
+class PollingWatcher(ChangeWatcher):
+    """Portable fallback: re-checks the roots every `interval` seconds and diffs them per directory.
+
+    The last known state is kept per directory: its mtime, its subdirectory
+    names and {file name: (size, mtime)}. A poll stats every known directory
+    and re-lists only those whose mtime changed, which covers files being
+    created, deleted and renamed. Rewriting a file in place leaves its
+    directory's mtime alone, so every `full_every`-th poll re-lists all
+    directories to catch those changes as well.
+    """
+    backend = "polling"
+
+    def __init__(self, roots, on_changes, prune_dir=None, on_error=None, interval=None, full_every=None):
+        super().__init__(roots, on_changes, prune_dir=prune_dir, on_error=on_error)
+        self.interval = SCANNER_WATCH_POLL_SECONDS if interval is None else interval
+        self.full_every = max(1, SCANNER_WATCH_FULL_POLL_EVERY if full_every is None else full_every)
+        self._dirs = {}     # path -> (mtime, [subdirectory names], {file name: (size, mtime)})
+        self._polled = False
+
+    def _walker(self):
+        return TreeWalker(prune_dir=self.prune_dir, on_error=self._walk_error, should_stop=self._stop.is_set, workers=1)
+
+    def _walk_error(self, path, exc):
+        # After the first poll a vanished folder or file is a change, which the diff reports
+        if self._polled and getattr(exc, "errno", None) in (errno.ENOENT, errno.ENOTDIR):
+            return
+        self._error(path, exc)
+
+    def _subdir_frames(self, path, names):
+        """Stats the known subdirectories of a directory that was not re-listed."""
+        frames = []
+        for name in names:
+            sub = os.path.join(path, name)
+            try:
+                frames.append((sub, os.stat(sub, follow_symlinks=False).st_mtime))
+            except OSError as e:
+                self._walk_error(sub, e)
+        return frames
+
+    def poll(self, full=False, events=None):
+        """Brings the per-directory state up to date; appends ChangeEvents to `events` if given."""
+        walker = self._walker()
+        stack = walker.root_frames(self.roots)
+        seen = set()
+        while stack:
+            if self._stop.is_set():
+                return
+            path, mtime = stack.pop()
+            old = self._dirs.get(path)
+            if old is not None and not full and old[0] == mtime:
+                seen.add(path)
+                stack.extend(self._subdir_frames(path, old[1]))
+                continue
+
+            listing = walker.list_dir(path, mtime)
+            if listing is None:
+                continue
+            seen.add(path)
+            files = {entry.name: (entry.size, entry.mtime) for entry in listing.files}
+            if events is not None:
+                old_files = old[2] if old is not None else {}
+                if old is None:
+                    events.append(ChangeEvent("created", path, True))
+                for name, sig in files.items():
+                    before = old_files.get(name)
+                    if before is None:
+                        events.append(ChangeEvent("created", os.path.join(path, name)))
+                    elif before != sig:
+                        events.append(ChangeEvent("modified", os.path.join(path, name)))
+                events += [ChangeEvent("deleted", os.path.join(path, name)) for name in old_files.keys() - files.keys()]
+            self._dirs[path] = (mtime, [os.path.basename(sub) for sub, _ in listing.dirs], files)
+            stack.extend(listing.dirs)
+
+        self._polled = True
+        for path in self._dirs.keys() - seen:
+            _, _, files = self._dirs.pop(path)
+            if events is not None:
+                events.append(ChangeEvent("deleted", path, True))
+                events += [ChangeEvent("deleted", os.path.join(path, name)) for name in files]
+
+    def _run(self):
+        self.poll(full=True)
+        polls = 0
+        while not self._stop.wait(self.interval):
+            polls += 1
+            events = []
+            self.poll(full=polls % self.full_every == 0, events=events)
+            if self._stop.is_set():
+                return
+            self._deliver(events)
+
+
+# ===========================
+# inotify Backend (Linux)
+# ===========================
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyWatcher(ChangeWatcher):
+    """Native Linux backend: one inotify watch per directory, added as directories appear."""
+    backend = "inotify"
+
+    def __init__(self, roots, on_changes, prune_dir=None, on_error=None):
+        super().__init__(roots, on_changes, prune_dir=prune_dir, on_error=on_error)
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._paths = {}    # watch descriptor -> directory path
+        self._wds = {}      # directory path -> watch descriptor
+        try:
+            for root in self.roots:
+                self._add_tree(root, raise_errors=True)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def _add_watch(self, path, raise_errors=False):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            exc = OSError(err, os.strerror(err), path)
+            # ENOSPC means fs.inotify.max_user_watches is exhausted
+            if raise_errors or err == errno.ENOSPC:
+                raise exc
+            self._error(path, exc)
+            return
+        self._paths[wd] = path
+        self._wds[path] = wd
+
+    def _add_tree(self, top, raise_errors=False, events=None):
+        """Watches top and every directory below it; optionally reports their files as created."""
+        self._add_watch(top, raise_errors=raise_errors)
+        for listing in self._walker().walk(top):
+            for sub, _ in listing.dirs:
+                self._add_watch(sub)
+            if events is not None:
+                events.extend(ChangeEvent("created", e.path) for e in listing.files)
+
+    def _forget_tree(self, top):
+        prefix = top.rstrip(os.sep) + os.sep
+        for path in [p for p in self._wds if p == top or p.startswith(prefix)]:
+            wd = self._wds.pop(path)
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _parse(self, data, events):
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.extend(ChangeEvent("rescan", root, True) for root in self.roots)
+                continue
+            if mask & IN_IGNORED:
+                path = self._paths.pop(wd, None)
+                if path is not None and self._wds.get(path) == wd:
+                    del self._wds[path]
+                continue
+
+            parent = self._paths.get(wd)
+            if parent is None:
+                continue
+            if mask & IN_DELETE_SELF:
+                if parent in self.roots:
+                    events.append(ChangeEvent("deleted", parent, True))
+                continue
+
+            path = os.path.join(parent, name)
+            is_dir = bool(mask & IN_ISDIR)
+            if is_dir and self.prune_dir and self.prune_dir(path, name):
+                continue
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                events.append(ChangeEvent("created", path, is_dir))
+                if is_dir:
+                    # Files may have landed before the watch existed, report them too
+                    self._add_tree(path, events=events)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                events.append(ChangeEvent("deleted", path, is_dir))
+                if is_dir:
+                    self._forget_tree(path)
+            elif mask & (IN_CLOSE_WRITE | IN_MODIFY):
+                events.append(ChangeEvent("modified", path))
+
+    def _run(self):
+        events = []
+        batch_started = 0.0
+        try:
+            while not self._stop.is_set():
+                # Wait for the first event, then keep collecting until the batch window closes
+                timeout = max(0.0, batch_started + BATCH_SECONDS - time.monotonic()) if events else 1.0
+                ready, _, _ = select.select([self._fd], [], [], timeout)
+                if ready:
+                    try:
+                        data = os.read(self._fd, 64 * 1024)
+                    except BlockingIOError:
+                        data = b""
+                    if data and not events:
+                        batch_started = time.monotonic()
+                    self._parse(data, events)
+                if events and time.monotonic() - batch_started >= BATCH_SECONDS:
+                    self._deliver(events)
+                    events = []
+        except OSError as e:
+            self._error(self.roots[0], e)
+        finally:
+            os.close(self._fd)
+
+
+def open_watcher(roots, on_changes, prune_dir=None, on_error=None, poll_interval=None):
+    """Returns an unstarted watcher: inotify where available, polling otherwise."""
+    try:
+        return InotifyWatcher(roots, on_changes, prune_dir=prune_dir, on_error=on_error)
+    except OSError as e:
+        if e.errno != errno.ENOSYS and on_error:
+            on_error(roots if isinstance(roots, str) else roots[0], e)
+    return PollingWatcher(roots, on_changes, prune_dir=prune_dir, on_error=on_error, interval=poll_interval)
@@ -0,0 +1,19 @@
+import os
+
+from modules.chunking import ChunkReport
+
+
+def test_report_finds_shifted_content_and_respects_the_size_limit(tmp_path):
+    data = os.urandom(3 << 20)
+    (tmp_path / "a.img").write_bytes(data)
+    (tmp_path / "b.img").write_bytes(data[:1000] + b"x" + data[1000:])
+    (tmp_path / "c.img").write_bytes(os.urandom(2 << 20))
+    files = [(str(tmp_path / name), (tmp_path / name).stat().st_size) for name in ("a.img", "b.img", "c.img")]
+
+    report = ChunkReport(workers=2, max_bytes=7 << 20).run(files)
+
+    assert report.skipped_files == 1
+    assert report.skipped_bytes == 2 << 20
+    assert report.total_bytes == 2 * len(data) + 1
+    # Only the chunk around the inserted byte differs
+    assert report.redundant_bytes > len(data) * 0.9
@@ -0,0 +1,86 @@
+import os
+import sys
+import subprocess
+
+from modules import clean_engine
+from modules.clean_engine import scan_junk, DeletionEngine
+from modules.clean_plan import CleanPlan
+from modules.clean_rules import CleanRules
+
+
+def _scan(root):
+    return scan_junk([("Temp", str(root))], rules_for=lambda name: CleanRules())
+
+
+def test_plan_leaves_files_added_to_a_whole_folder_after_the_scan(tmp_path):
+    root = tmp_path / "temp"
+    (root / "a" / "sub").mkdir(parents=True)
+    for rel in ("a/1.tmp", "a/2.tmp", "a/sub/3.tmp", "loose.tmp"):
+        (root / rel).write_text("data")
+
+    plan_path = str(tmp_path / "cleanup.woplan")
+    CleanPlan.save(plan_path, _scan(root)).close()
+
+    (root / "a" / "new.tmp").write_text("added later")
+    (root / "a" / "sub" / "new2.tmp").write_text("added later")
+
+    plan = CleanPlan(plan_path)
+    queue = plan.load()
+    engine = DeletionEngine(on_done=plan.mark).run(queue)
+    assert plan.pending() == (0, 0)
+    plan.close()
+
+    assert engine.deleted == 4
+    remaining = sorted(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+    assert remaining == ["a/new.tmp", "a/sub/new2.tmp"]
+
+
+def test_whole_folders_are_removed_with_their_folders(tmp_path):
+    root = tmp_path / "temp"
+    (root / "a" / "sub").mkdir(parents=True)
+    (root / "a" / "sub" / "1.tmp").write_text("data")
+    (root / "empty").mkdir()
+
+    queue = _scan(root)
+    assert len(queue.tree_dir) == 2
+    DeletionEngine().run(queue)
+    assert list(root.iterdir()) == []
+
+
+def test_files_that_could_not_be_removed_stay_pending(tmp_path, monkeypatch):
+    root = tmp_path / "temp"
+    root.mkdir()
+    for name in ("a.tmp", "locked.tmp", "b.tmp"):
+        (root / name).write_text("data")
+    plan_path = str(tmp_path / "cleanup.woplan")
+    CleanPlan.save(plan_path, _scan(root)).close()
+
+    remove = os.remove
+
+    def _remove(path):
+        if path.endswith("locked.tmp"):
+            raise PermissionError(13, "in use", path)
+        remove(path)
+
+    monkeypatch.setattr(clean_engine.os, "remove", _remove)
+    plan = CleanPlan(plan_path)
+    engine = DeletionEngine(on_done=plan.mark).run(plan.load())
+    assert (engine.deleted, engine.failed) == (2, 1)
+    assert plan.pending()[0] == 1
+    plan.close()
+
+    monkeypatch.setattr(clean_engine.os, "remove", remove)
+    plan = CleanPlan(plan_path)
+    queue = plan.load()
+    assert len(queue) == 1
+    DeletionEngine(on_done=plan.mark).run(queue)
+    assert plan.pending() == (0, 0)
+    plan.close()
+    assert list(root.iterdir()) == []
+
+
+def test_command_line_loads_neither_tkinter_nor_the_scanner():
+    code = "import sys, modules.clean_plan; print(sorted({'tkinter', 'modules.scan_engine'} & set(sys.modules)))"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
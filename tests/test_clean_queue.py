@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from modules.clean_queue import CleanQueue
+
+
+def _paths(queue, indices):
+    return [(queue.path(i), queue.file_size[i], queue.file_mtime[i]) for i in indices]
+
+
+def test_files_are_packed_per_folder_and_category():
+    queue = CleanQueue()
+    queue.add_category("Temp")
+    temp = queue.add_dir(os.path.join("x", "temp"))
+    queue.add_file(temp, "a.tmp", 5, 1.5)
+    queue.add_file(temp, "\udcff-undecodable.tmp", 7)
+    queue.add_category("Cache")
+    cache = queue.add_dir(os.path.join("x", "cache"))
+    queue.add_file(cache, "日本.bin", 11, 2.0)
+
+    assert queue.dirs == [os.path.join("x", "temp"), os.path.join("x", "cache")]
+    assert list(queue.file_dir) == [temp, temp, cache]
+    assert [queue.path(i) for i in range(3)] == [
+        os.path.join("x", "temp", "a.tmp"), os.path.join("x", "temp", "\udcff-undecodable.tmp"), os.path.join("x", "cache", "日本.bin"),
+    ]
+    assert list(queue.category_range(0)) == [0, 1] and list(queue.category_range(1)) == [2]
+    assert (len(queue), queue.total_size) == (3, 23)
+    assert list(queue.preview(limit=2)) == [(queue.path(0), 5), (queue.path(1), 7)]
+
+
+def test_kept_files_are_only_counted():
+    queue = CleanQueue()
+    queue.add_category("Temp")
+    queue.add_kept("too new", 100)
+    queue.add_kept("too new", 50)
+
+    assert (len(queue), queue.kept_files, queue.kept_size) == (0, 2, 150)
+    assert queue.kept_reasons == {"too new": 2}
+
+
+def test_category_ids_fit_in_a_byte():
+    queue = CleanQueue()
+    for i in range(256):
+        queue.add_category(str(i))
+    with pytest.raises(ValueError):
+        queue.add_category("one too many")
+
+
+def test_collapse_groups_files_per_tree_after_the_loose_ones():
+    queue = CleanQueue()
+    queue.add_category("First")
+    other = queue.add_dir(os.path.join("x", "first"))
+    queue.add_file(other, "keep.tmp", 1, 1.0)
+
+    queue.add_category("Second")
+    first_dir = len(queue.dirs)
+    root = queue.add_dir(os.path.join("x", "second"))
+    a = queue.add_dir(os.path.join("x", "second", "a"), root)
+    b = queue.add_dir(os.path.join("x", "second", "a", "b"), a)
+    c = queue.add_dir(os.path.join("x", "second", "c"), root)
+    d = queue.add_dir(os.path.join("x", "second", "d"), root)
+    files = [(b, "ü.tmp", 10, 2.0), (root, "loose.tmp", 20, 3.0), (c, "partial.tmp", 30, 4.0),
+             (a, "long name.tmp", 40, 5.0), (d, "d.tmp", 50, 6.0), (b, "2.tmp", 60, 7.0)]
+    for dir_id, name, size, mtime in files:
+        queue.add_file(dir_id, name, size, mtime)
+    expected_files = _paths(queue, range(len(queue.file_size)))
+
+    queue.collapse_trees(first_dir, [True, True, True, False, True])
+
+    assert _paths(queue, queue.category_range(0)) == [(os.path.join("x", "first", "keep.tmp"), 1, 1.0)]
+    assert _paths(queue, queue.category_range(1)) == [expected_files[2], expected_files[3]]
+    assert [queue.dirs[queue.tree_dir[t]] for t in queue.category_trees(1)] == [queue.dirs[a], queue.dirs[d]]
+    first_tree, second_tree = queue.category_trees(1)
+    assert _paths(queue, queue.tree_range(first_tree)) == [expected_files[1], expected_files[4], expected_files[6]]
+    assert queue.tree_members(first_tree) == {
+        os.path.join("b", "ü.tmp"): (10, 2.0), "long name.tmp": (40, 5.0), os.path.join("b", "2.tmp"): (60, 7.0),
+    }
+    assert (queue.tree_files[first_tree], queue.tree_size[first_tree]) == (3, 110)
+    assert _paths(queue, queue.tree_range(second_tree)) == [expected_files[5]]
+    assert queue.totals() == [("First", 1, 1, 0), ("Second", 6, 210, 2)]
+    assert len(queue._names) == len("".join(name for _, name, _, _ in files).encode("utf-8")) + len("keep.tmp")
@@ -0,0 +1,36 @@
+import os
+
+from modules.scan_engine import default_options, run_scan
+
+
+def _dup_dir_groups(root, **overrides):
+    options = default_options(modes=["duplicates", "dup_dirs"], workers=1, **overrides)
+    analyzers, _ = run_scan([str(root)], options)
+    return [(files, [os.path.relpath(p, root) for p in paths]) for _, files, paths, _ in analyzers["dup_dirs"].groups]
+
+
+def _copy(root, names, data):
+    for name in names:
+        (root / name / "sub").mkdir(parents=True)
+        (root / name / "empty").mkdir()
+        (root / name / "a.bin").write_bytes(data)
+        (root / name / "sub" / "b.bin").write_bytes(data[::-1])
+
+
+def test_identical_folders_with_empty_subfolders_are_reported(tmp_path):
+    _copy(tmp_path, ["one", "two"], os.urandom(5000))
+    assert _dup_dir_groups(tmp_path) == [(2, ["one", "two"])]
+
+
+def test_folders_differing_in_pruned_subfolders_are_not_identical(tmp_path):
+    _copy(tmp_path, ["one", "two"], os.urandom(5000))
+    (tmp_path / "two" / "node_modules").mkdir()
+    (tmp_path / "two" / "node_modules" / "big.bin").write_bytes(os.urandom(9000))
+    # Only the subfolders below the pruned entry still match
+    assert _dup_dir_groups(tmp_path) == [(1, ["one/sub", "two/sub"])]
+
+
+def test_folders_differing_in_filtered_files_are_not_identical(tmp_path):
+    _copy(tmp_path, ["one", "two"], os.urandom(5000))
+    (tmp_path / "two" / "sub" / "trace.log").write_text("left out by the rules")
+    assert _dup_dir_groups(tmp_path, exclude_extensions=[".log"]) == []
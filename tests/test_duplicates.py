@@ -0,0 +1,58 @@
+import os
+
+from modules.duplicates import DuplicateFinder, files_identical
+
+
+def _write(folder, name, content):
+    path = folder / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def _find(paths, **kwargs):
+    by_size = {}
+    for path in paths:
+        by_size.setdefault(os.path.getsize(path), []).append(path)
+    return [(size, sorted(group)) for size, group in DuplicateFinder(workers=2, sample_bytes=4096, **kwargs).find(by_size)]
+
+
+def test_files_matching_only_in_their_samples_are_told_apart(tmp_path):
+    content = os.urandom(64 * 1024)
+    middle = bytearray(content)
+    middle[len(middle) // 2] ^= 0xFF
+    a = _write(tmp_path, "a.bin", content)
+    b = _write(tmp_path, "b.bin", content)
+    _write(tmp_path, "c.bin", bytes(middle))
+    _write(tmp_path, "unique.bin", os.urandom(1000))
+
+    assert _find([str(p) for p in tmp_path.iterdir()]) == [(len(content), [a, b])]
+
+
+def test_small_files_are_confirmed_from_the_sample_pass(tmp_path):
+    a = _write(tmp_path, "a.txt", b"same")
+    b = _write(tmp_path, "b.txt", b"same")
+    _write(tmp_path, "c.txt", b"diff")
+
+    assert _find([str(p) for p in tmp_path.iterdir()], verify=True) == [(4, [a, b])]
+
+
+def test_hard_links_are_not_reported_as_duplicates(tmp_path):
+    content = os.urandom(8192)
+    a = _write(tmp_path, "a.bin", content)
+    os.link(a, str(tmp_path / "a-link.bin"))
+    finder = DuplicateFinder(workers=2)
+
+    assert finder.find({len(content): sorted(str(p) for p in tmp_path.iterdir())}) == []
+    assert finder.linked_bytes == len(content)
+
+
+def test_files_identical_compares_every_window(tmp_path):
+    content = os.urandom(10_000)
+    changed = bytearray(content)
+    changed[-1] ^= 0xFF
+    a = _write(tmp_path, "a.bin", content)
+    b = _write(tmp_path, "b.bin", content)
+    c = _write(tmp_path, "c.bin", bytes(changed))
+
+    assert files_identical(a, b, len(content), window=4096)
+    assert not files_identical(a, c, len(content), window=4096)
@@ -0,0 +1,26 @@
+from modules.scan_engine import default_options, run_scan
+
+
+def _empty_dirs(root, **overrides):
+    options = default_options(modes=["empty"], workers=1, **overrides)
+    analyzers, _ = run_scan([str(root)], options)
+    return sorted(analyzers["empty"].empty_dirs)
+
+
+def test_folders_emptied_only_by_rules_are_not_reported(tmp_path):
+    (tmp_path / "a" / "node_modules").mkdir(parents=True)
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "readme.txt").write_text("kept on disk")
+    (tmp_path / "c").mkdir()
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d" / "clip.mp4").write_bytes(b"x")
+
+    assert _empty_dirs(tmp_path, extensions=[".mp4"]) == [str(tmp_path / "c")]
+
+
+def test_empty_folders_are_reported_without_rules(tmp_path):
+    (tmp_path / "a" / "inner").mkdir(parents=True)
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "file.txt").write_text("x")
+
+    assert _empty_dirs(tmp_path) == [str(tmp_path / "a" / "inner")]
@@ -0,0 +1,70 @@
+import os
+
+from modules.file_index import FileIndex, IndexedTreeWalker
+from modules.scan_engine import default_options, run_scan
+
+
+def _scan(root, index_path):
+    options = default_options(modes=["duplicates"], use_index=True, index_path=index_path, workers=1)
+    analyzers, _ = run_scan([str(root)], options)
+    return analyzers["duplicates"]
+
+
+def test_rescan_rehashes_file_edited_in_place_with_same_size(tmp_path):
+    root = tmp_path / "data"
+    root.mkdir()
+    content = os.urandom(256 * 1024)
+    (root / "a.bin").write_bytes(content)
+    (root / "b.bin").write_bytes(content)
+    index_path = str(tmp_path / "index.sqlite3")
+
+    first = _scan(root, index_path)
+    assert [sorted(os.path.basename(p) for p in paths) for _, paths in first.groups] == [["a.bin", "b.bin"]]
+
+    # Same size, new content and mtime; the folder's own mtime does not change
+    folder_mtime = os.stat(root).st_mtime
+    edited = bytearray(content)
+    edited[len(edited) // 2] ^= 0xFF
+    (root / "b.bin").write_bytes(bytes(edited))
+    st = os.stat(root / "b.bin")
+    os.utime(root / "b.bin", (st.st_atime, st.st_mtime + 10))
+    os.utime(root, (folder_mtime, folder_mtime))
+
+    second = _scan(root, index_path)
+    assert second.groups == []
+    assert second.bytes_read > 0
+
+
+def test_rescan_reuses_hashes_of_unchanged_files(tmp_path):
+    root = tmp_path / "data"
+    root.mkdir()
+    content = os.urandom(256 * 1024)
+    (root / "a.bin").write_bytes(content)
+    (root / "b.bin").write_bytes(content)
+    index_path = str(tmp_path / "index.sqlite3")
+
+    _scan(root, index_path)
+    second = _scan(root, index_path)
+    assert len(second.groups) == 1
+    assert second.bytes_read == 0
+
+
+def test_only_changed_listings_are_written_again(tmp_path):
+    root = tmp_path / "data"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "sub" / "b.txt").write_text("b")
+    index = FileIndex(str(tmp_path / "index.sqlite3"))
+
+    def walk():
+        walker = IndexedTreeWalker(index, workers=1)
+        for _ in walker.walk([str(root)]):
+            pass
+        return walker.dirs_stored, walker.dirs_unchanged
+
+    assert walk() == (2, 0)
+    assert walk() == (0, 2)
+    st = os.stat(root / "sub" / "b.txt")
+    os.utime(root / "sub" / "b.txt", (st.st_atime, st.st_mtime + 10))
+    assert walk() == (1, 1)
+    index.close()
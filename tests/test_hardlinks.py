@@ -0,0 +1,79 @@
+import os
+
+from modules.hardlinks import LinkReplacer, plan_links, undo_links
+
+
+def _copies(folder, content, *names):
+    paths = []
+    for name in names:
+        path = folder / name
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
+
+
+def test_replace_and_undo_round_trip(tmp_path):
+    content = os.urandom(64 * 1024)
+    source, first, second = _copies(tmp_path, content, "a.bin", "b.bin", "c.bin")
+    os.chmod(second, 0o600)
+    os.utime(second, (1_000_000_000, 1_000_000_000))
+    journal = str(tmp_path / "journal" / "links.ndjson")
+
+    plan = plan_links([(len(content), [source, first, second])])
+    assert [action.target for action in plan.actions] == [first, second]
+    assert plan.reclaimable == 2 * len(content)
+
+    replacer = LinkReplacer(journal_path=journal).run(plan)
+    assert (replacer.replaced, replacer.reclaimed, replacer.failed) == (2, 2 * len(content), [])
+    assert os.path.samefile(source, first) and os.path.samefile(source, second)
+    assert not [n for n in os.listdir(tmp_path) if n.endswith(".wolink")]
+
+    assert undo_links(journal) == (2, 0)
+    for path in (first, second):
+        assert not os.path.samefile(source, path)
+        with open(path, "rb") as f:
+            assert f.read() == content
+    st = os.stat(second)
+    assert (st.st_mode & 0o777, st.st_mtime) == (0o600, 1_000_000_000)
+    assert os.path.exists(journal + ".undone") and not os.path.exists(journal)
+
+
+def test_a_copy_changed_since_the_scan_is_not_linked(tmp_path):
+    content = os.urandom(4096)
+    source, target = _copies(tmp_path, content, "a.bin", "b.bin")
+    plan = plan_links([(len(content), [source, target])])
+
+    edited = bytearray(content)
+    edited[0] ^= 0xFF
+    with open(target, "wb") as f:
+        f.write(edited)
+    replacer = LinkReplacer(journal_path=str(tmp_path / "links.ndjson")).run(plan)
+
+    assert replacer.replaced == 0 and [path for path, _ in replacer.failed] == [target]
+    assert not os.path.samefile(source, target)
+    with open(target, "rb") as f:
+        assert f.read() == bytes(edited)
+
+
+def test_undo_skips_targets_changed_after_linking(tmp_path):
+    content = os.urandom(4096)
+    source, target = _copies(tmp_path, content, "a.bin", "b.bin")
+    journal = str(tmp_path / "links.ndjson")
+    LinkReplacer(journal_path=journal).run(plan_links([(len(content), [source, target])]))
+
+    # Saving through a new file breaks the link; undo must not overwrite the new content
+    os.remove(target)
+    (tmp_path / "b.bin").write_bytes(b"new content")
+
+    assert undo_links(journal) == (0, 1)
+    assert (tmp_path / "b.bin").read_bytes() == b"new content"
+
+
+def test_already_linked_copies_are_skipped(tmp_path):
+    source, = _copies(tmp_path, b"data" * 100, "a.bin")
+    target = str(tmp_path / "b.bin")
+    os.link(source, target)
+
+    plan = plan_links([(400, [source, target])])
+
+    assert plan.actions == [] and plan.skipped == [(target, "already linked")]
@@ -0,0 +1,35 @@
+import os
+
+from modules.live_results import LiveResults
+from modules.scan_engine import default_options, run_scan
+from modules.watcher import ChangeEvent
+
+
+def _live_duplicates(root):
+    analyzers, _ = run_scan([str(root)], default_options(modes=["duplicates"], workers=1))
+    return analyzers["duplicates"], LiveResults(analyzers)
+
+
+def test_touching_a_duplicate_keeps_its_group(tmp_path):
+    data = os.urandom(300000)
+    a, b = tmp_path / "a.bin", tmp_path / "b.bin"
+    a.write_bytes(data)
+    b.write_bytes(data)
+    dup, live = _live_duplicates(tmp_path)
+    assert dup.groups == [(300000, [str(a), str(b)])]
+
+    os.utime(a, (1000, 1000))
+    assert live.apply([ChangeEvent("modified", str(a))]) == set()
+    assert dup.groups == [(300000, [str(a), str(b)])]
+
+
+def test_rewriting_a_duplicate_dissolves_its_group(tmp_path):
+    data = os.urandom(300000)
+    a, b = tmp_path / "a.bin", tmp_path / "b.bin"
+    a.write_bytes(data)
+    b.write_bytes(data)
+    dup, live = _live_duplicates(tmp_path)
+
+    a.write_bytes(os.urandom(300000))
+    assert live.apply([ChangeEvent("modified", str(a))]) == {"duplicates"}
+    assert dup.groups == []
@@ -0,0 +1,7 @@
+import subprocess
+import sys
+
+
+def test_command_line_engine_does_not_import_tkinter():
+    code = "import sys, modules.scan_engine; sys.exit('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
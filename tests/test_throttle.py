@@ -0,0 +1,64 @@
+import os
+import time
+import threading
+
+from modules import throttle as throttle_module
+from modules.duplicates import DuplicateFinder
+from modules.throttle import Throttle, TokenBucket
+from modules.traversal import TreeWalker
+
+
+def _record_lowered(monkeypatch):
+    lowered = set()
+    monkeypatch.setattr(throttle_module, "lower_current_thread_priority", lambda: lowered.add(threading.get_ident()))
+    return lowered
+
+
+def test_token_bucket_paces_requests_beyond_the_burst():
+    bucket = TokenBucket(rate=1000, burst=100)
+    started = time.monotonic()
+    bucket.consume(100)
+    assert time.monotonic() - started < 0.05
+    bucket.consume(100)
+    assert time.monotonic() - started >= 0.08
+
+
+def test_process_settings_share_the_byte_rate():
+    settings = Throttle(bytes_per_sec=8000, cpu_percent=50).process_settings(4)
+    assert settings["bytes_per_sec"] == 2000
+    assert settings["cpu_percent"] == 50 and settings["scan_pid"] == os.getpid()
+
+
+def test_throttled_serial_walk_keeps_the_callers_priority(tmp_path, monkeypatch):
+    lowered = _record_lowered(monkeypatch)
+    for rel in ("a/b", "a/c", "d"):
+        (tmp_path / rel).mkdir(parents=True)
+        (tmp_path / rel / "f.txt").write_text("x")
+
+    plain = [listing.path for listing in TreeWalker(workers=1).walk(str(tmp_path))]
+    throttled = [listing.path for listing in TreeWalker(workers=1, throttle=Throttle()).walk(str(tmp_path))]
+
+    assert throttled == plain
+    assert lowered and threading.get_ident() not in lowered
+
+
+def test_rate_limits_alone_never_lower_the_calling_thread(monkeypatch):
+    lowered = _record_lowered(monkeypatch)
+    throttle = Throttle(bytes_per_sec=1 << 30, entries_per_sec=1 << 20)
+    throttle.entries(10)
+    throttle.bytes(4096)
+    assert not lowered
+
+
+def test_hashing_threads_drop_to_background_priority(tmp_path, monkeypatch):
+    lowered = _record_lowered(monkeypatch)
+    content = os.urandom(64 * 1024)
+    paths = []
+    for name in ("a.bin", "b.bin"):
+        (tmp_path / name).write_bytes(content)
+        paths.append(str(tmp_path / name))
+
+    groups = DuplicateFinder(workers=2, throttle=Throttle()).find({len(content): paths})
+
+    assert [sorted(group) for _, group in groups] == [sorted(paths)]
+    assert lowered and threading.get_ident() not in lowered
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from modules.traversal import TreeWalker
+
+
+def _make_tree(root, width=4, depth=3):
+    dirs = [root]
+    for _ in range(depth):
+        dirs = [d / f"d{i}" for d in dirs for i in range(width)]
+        for d in dirs:
+            d.mkdir()
+            (d / "f.txt").write_text("x")
+
+
+def _walk_in_thread(walker, root):
+    """Runs a full walk on a helper thread so a hang fails the test instead of blocking it."""
+    outcome = {}
+
+    def _run():
+        try:
+            outcome["paths"] = sorted(listing.path for listing in walker.walk(str(root)))
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive(), "walk hung"
+    return outcome
+
+
+def test_parallel_walk_lists_the_same_directories_as_the_serial_walk(tmp_path):
+    _make_tree(tmp_path)
+    serial = _walk_in_thread(TreeWalker(workers=1), tmp_path)["paths"]
+    parallel = _walk_in_thread(TreeWalker(workers=4), tmp_path)["paths"]
+    assert len(serial) == 1 + 4 + 16 + 64
+    assert parallel == serial
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_an_exception_in_a_hook_ends_the_walk_and_reaches_the_caller(tmp_path, workers):
+    _make_tree(tmp_path)
+
+    def prune_dir(path, name):
+        if name == "d2":
+            raise ValueError(f"bad rule for {path}")
+        return False
+
+    outcome = _walk_in_thread(TreeWalker(prune_dir=prune_dir, workers=workers), tmp_path)
+    assert isinstance(outcome.get("error"), ValueError)
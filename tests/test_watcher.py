@@ -0,0 +1,86 @@
+import os
+import time
+
+from modules.watcher import PollingWatcher
+
+
+def _changes(watcher, full=False):
+    events = []
+    watcher.poll(full=full, events=events)
+    return sorted((e.kind, os.path.relpath(e.path, watcher.roots[0])) for e in events)
+
+
+def _touch_dir(path, offset):
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + offset))
+
+
+def test_polling_relists_changed_folders_and_catches_edits_on_full_polls(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "keep.txt").write_text("one")
+    (tmp_path / "a" / "gone.txt").write_text("two")
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "edit.txt").write_text("three")
+    watcher = PollingWatcher([str(tmp_path)], on_changes=None)
+    watcher.poll(full=True)
+
+    (tmp_path / "a" / "gone.txt").unlink()
+    (tmp_path / "a" / "new.txt").write_text("four")
+    (tmp_path / "b" / "edit.txt").write_text("33")
+    (tmp_path / "b" / "c").mkdir()
+    (tmp_path / "b" / "c" / "d.txt").write_text("five")
+    for folder in ("a", "b"):
+        _touch_dir(tmp_path / folder, 5)    # coarse timestamps must not hide the change
+
+    assert _changes(watcher) == [
+        ("created", "a/new.txt"), ("created", "b/c"), ("created", "b/c/d.txt"),
+        ("deleted", "a/gone.txt"), ("modified", "b/edit.txt"),
+    ]
+
+    # An in-place edit leaves the folder mtime alone: only a full poll sees it
+    os.utime(tmp_path / "a" / "keep.txt", (0, 2000))
+    assert _changes(watcher) == []
+    assert _changes(watcher, full=True) == [("modified", "a/keep.txt")]
+
+    (tmp_path / "b" / "c" / "d.txt").unlink()
+    (tmp_path / "b" / "c").rmdir()
+    assert _changes(watcher) == [("deleted", "b/c"), ("deleted", "b/c/d.txt")]
+
+
+def test_deleted_folders_are_changes_not_errors(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "f.txt").write_text("x")
+    errors = []
+    watcher = PollingWatcher([str(tmp_path)], on_changes=None, on_error=lambda path, e: errors.append(path))
+    watcher.poll(full=True)
+
+    (tmp_path / "a" / "b" / "f.txt").unlink()
+    (tmp_path / "a" / "b").rmdir()
+    (tmp_path / "a").rmdir()
+    assert _changes(watcher) == [("deleted", "a"), ("deleted", "a/b"), ("deleted", "a/b/f.txt")]
+    assert errors == []
+
+
+def test_a_failing_consumer_does_not_stop_polling(tmp_path):
+    batches, errors = [], []
+
+    def on_changes(events):
+        batches.append(events)
+        if len(batches) == 1:
+            raise ValueError("consumer failed")
+
+    watcher = PollingWatcher([str(tmp_path)], on_changes, on_error=lambda path, e: errors.append(e), interval=0.05).start()
+    try:
+        deadline = time.monotonic() + 5
+        while not watcher._polled and time.monotonic() < deadline:
+            time.sleep(0.02)
+        (tmp_path / "one.txt").write_text("1")
+        while len(batches) < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        (tmp_path / "two.txt").write_text("2")
+        while len(batches) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        watcher.stop()
+    assert len(batches) == 2
+    assert [type(e) for e in errors] == [ValueError]